@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Adaptive Request Timeouts
+Keeps a rolling window of response times per endpoint between runs and
+derives each request's timeout from them: a high percentile times a safety
+factor, clamped between a floor and the call site's own timeout. A normally
+fast endpoint that hangs is abandoned in seconds instead of waiting out the
+worst-case limit; endpoints without enough history keep the fixed timeout.
+A request that times out is recorded as a censored sample at the time it
+waited and doubles that endpoint's next timeout, so a slowed endpoint is
+given longer instead of being cut off at the same point every run.
+"""
+
+import math
+import re
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+from urllib.parse import urlsplit
+
+from profile_cache import load_json, save_json
+
+# Path segments that name a collection -> placeholders for the parameters after them.
+PARAMETER_SEGMENTS = {'users': ('{user}',), 'orgs': ('{org}',), 'repos': ('{owner}', '{repo}')}
+OPERATION_NAME = re.compile(r'^\s*(?:query|mutation)\s+(\w+)')
+
+
+def route_template(path: str) -> str:
+    """Replace the parameters of a GitHub-style path with placeholders.
+
+    ``/repos/<owner>/<name>/languages`` becomes ``/repos/{owner}/{repo}/languages``
+    and ``/users/<login>`` becomes ``/users/{user}``; numeric ids become ``{id}``.
+    """
+    segments = [segment for segment in path.split('/') if segment]
+    template = []
+    index = 0
+    while index < len(segments):
+        segment = segments[index]
+        template.append('{id}' if segment.isdigit() else segment)
+        index += 1
+        for placeholder in PARAMETER_SEGMENTS.get(segment, ()):
+            if index < len(segments):
+                template.append(placeholder)
+                index += 1
+    return '/' + '/'.join(template)
+
+
+def operation_name(body: Any) -> Optional[str]:
+    """The GraphQL operation name of a JSON request body, if it has one."""
+    if not isinstance(body, dict):
+        return None
+    if body.get('operationName'):
+        return body['operationName']
+    match = OPERATION_NAME.match(body.get('query') or '')
+    return match.group(1) if match else None
+
+
+def endpoint_key(method: str, url: str, body: Any = None) -> str:
+    """Group requests by method, host, route template and GraphQL operation.
+
+    Every repository's language request shares one key, while each GraphQL
+    query keeps its own history although they all post to ``/graphql``.
+    """
+    parts = urlsplit(url)
+    key = f'{method.upper()} {parts.netloc}{route_template(parts.path)}'
+    operation = operation_name(body)
+    return f'{key}#{operation}' if operation else key
+
+
+class LatencyBook:
+    """Per-endpoint latency samples and the timeouts they imply."""
+
+    def __init__(
+        self,
+        path: Optional[str],
+        window: int = 200,
+        percentile: float = 99,
+        multiplier: float = 3.0,
+        floor: float = 2.0,
+        cap: float = 30.0,
+        min_samples: int = 5,
+    ):
+        self.path = path
+        self.window = window
+        self.percentile = percentile
+        self.multiplier = multiplier
+        self.floor = floor
+        self.cap = cap
+        self.min_samples = min_samples
+        self._lock = threading.Lock()
+        stored = load_json(path, {}) if path else {}
+        self.samples: Dict[str, Deque[float]] = {
+            key: deque(values[-window:], maxlen=window) for key, values in stored.get('endpoints', {}).items()
+        }
+        # key -> timeout to allow next, after a request to it timed out
+        self.backoff: Dict[str, float] = dict(stored.get('backoff', {}))
+
+    def record(self, key: str, seconds: float) -> None:
+        """Add one completed response time; it also clears any timeout backoff."""
+        with self._lock:
+            self.samples.setdefault(key, deque(maxlen=self.window)).append(round(seconds, 4))
+            self.backoff.pop(key, None)
+
+    def record_timeout(self, key: str, seconds: float) -> None:
+        """Note a request that gave up after ``seconds``.
+
+        The real latency is at least that long, so it is kept as a censored
+        sample, and the next timeout for ``key`` is at least double it.
+        """
+        with self._lock:
+            self.samples.setdefault(key, deque(maxlen=self.window)).append(round(seconds, 4))
+            self.backoff[key] = round(max(self.backoff.get(key, 0.0), 2 * seconds), 3)
+
+    def latency(self, key: str) -> Optional[float]:
+        """The configured percentile of ``key``'s samples (nearest rank)."""
+        with self._lock:
+            values = sorted(self.samples.get(key, ()))
+        if len(values) < self.min_samples:
+            return None
+        rank = max(1, math.ceil(len(values) * self.percentile / 100))
+        return values[rank - 1]
+
+    def timeout(self, key: str, default: Optional[float]) -> Optional[float]:
+        """Timeout for the next request to ``key``; ``default`` is also the ceiling."""
+        observed = self.latency(key)
+        ceiling = min(default, self.cap) if default is not None else self.cap
+        if observed is None:
+            return default
+        derived = max(self.floor, observed * self.multiplier, self.backoff.get(key, 0.0))
+        return round(min(ceiling, derived), 3)
+
+    def save(self) -> None:
+        if not self.path:
+            return
+        with self._lock:
+            endpoints = {key: list(values) for key, values in self.samples.items()}
+            backoff = dict(self.backoff)
+        save_json(self.path, {'endpoints': endpoints, 'backoff': backoff})
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+End-to-End Pipeline Benchmark
+Runs ``DailyUpdater.run_daily_update`` against the local stub server at
+several scales (repositories x streak length): once with a cold cache, once
+warm (a forced full update over the cached state) and once idle (the events
+feed is unchanged, so cached stats are reused). For each run it records wall
+time, API calls, bytes served, peak RSS and README update time, then
+compares the numbers with the committed baseline in
+``benchmarks/baseline.json``. It exits non-zero when any budget regresses or
+when a run fails or serves any section from a fallback.
+
+    python scripts/benchmark_pipeline.py                    # compare with baseline
+    python scripts/benchmark_pipeline.py --scenario small   # one scenario
+    python scripts/benchmark_pipeline.py --update-baseline  # accept current numbers
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+BASELINE_PATH = SCRIPTS_DIR / 'benchmarks' / 'baseline.json'
+WAKATIME_SECTION = '\n<!--START_SECTION:waka-->\n<!--END_SECTION:waka-->\n'
+
+# phase -> extra environment; warm forces the full pipeline past the events check.
+PHASES = {
+    'cold': {},
+    'warm': {'FORCE_FULL_UPDATE': 'true'},
+    'idle': {},
+}
+
+# name -> (repositories, streak days)
+SCENARIOS = {
+    'small': (10, 365),
+    'medium': (1000, 365),
+    'large': (5000, 365 * 5),
+    'xlarge': (5000, 365 * 10),
+}
+
+# Allowed growth over the baseline, as (relative, absolute), before a metric
+# counts as a regression. Timings are noisy across machines, so they get an
+# absolute floor too; request counts should not move at all.
+TOLERANCES = {
+    'wall_seconds': (0.50, 0.25),
+    'readme_seconds': (0.50, 0.05),
+    'peak_rss_mb': (0.25, 8.0),
+    'api_calls': (0.0, 0),
+    'bytes': (0.10, 1024),
+}
+
+
+def _child_run(readme: str, stargazer_max_repos: int) -> Dict[str, Any]:
+    """Run one update in this process and report timings (used via --child).
+
+    The stargazer cap is raised to the scenario's repository count, so a cold
+    run syncs every repository instead of deferring some to later runs.
+    """
+    sys.path.insert(0, str(SCRIPTS_DIR))
+    from daily_update import DailyUpdater
+    from run_logging import shutdown as shutdown_logging
+
+    started = time.perf_counter()
+    updater = DailyUpdater()
+    updater.readme_file = readme
+    updater.stargazer_max_repos = max(updater.stargazer_max_repos, stargazer_max_repos)
+    succeeded = updater.run_daily_update()
+    wall = time.perf_counter() - started
+    shutdown_logging()
+
+    durations = updater.tracer.durations() if updater.tracer else {}
+    try:
+        import resource
+        # ru_maxrss is KiB on Linux and bytes on macOS.
+        divisor = 1024 * 1024 if sys.platform == 'darwin' else 1024
+        peak_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / divisor
+    except ImportError:
+        peak_rss_mb = None
+    return {
+        'succeeded': succeeded,
+        'fallbacks': list(updater.fallbacks),
+        'degraded': list(updater.degraded),
+        'wall_seconds': wall,
+        'readme_seconds': durations.get('update_readme'),
+        'peak_rss_mb': peak_rss_mb,
+    }
+
+
+def run_scenario(name: str, repos: int, streak_days: int) -> Dict[str, Dict[str, Any]]:
+    """Run a scenario cold, warm and idle, each in a fresh interpreter."""
+    from stub_server import StubDataset, StubServer
+
+    results = {}
+    readme_source = SCRIPTS_DIR.parent / 'README.md'
+    with StubServer(StubDataset(repos=repos, streak_days=streak_days)) as server, \
+            tempfile.TemporaryDirectory() as directory:
+        readme = Path(directory) / 'README.md'
+        source = readme_source.read_text(encoding='utf-8')
+        if '<!--START_SECTION:waka-->' not in source:
+            source += WAKATIME_SECTION  # so the WakaTime sync is part of the run
+        readme.write_text(source, encoding='utf-8')
+        env = dict(
+            os.environ,
+            **server.env(),
+            GH_TOKEN='benchmark-token',
+            WAKATIME_API_KEY='benchmark-key',
+            PUSH_CHANGES='false',
+            PROFILE_CACHE_DIR=str(Path(directory) / 'cache'),
+            LOG_FILE=str(Path(directory) / 'run.log'),
+            TRACE_FILE=str(Path(directory) / 'run.trace.json'),
+            METRICS_TEXTFILE=str(Path(directory) / 'run.prom'),
+            LOG_LEVEL='WARNING',
+        )
+        for phase, phase_env in PHASES.items():
+            before = len(server.requests)
+            completed = subprocess.run(
+                [
+                    sys.executable, str(Path(__file__).resolve()),
+                    '--child', str(readme), '--stargazer-max-repos', str(repos),
+                ],
+                env=dict(env, **phase_env), capture_output=True, text=True, check=False,
+            )
+            lines = completed.stdout.strip().splitlines()
+            if completed.returncode != 0 or not lines:
+                raise RuntimeError(f'{name}/{phase} failed:\n{completed.stderr}')
+            result = json.loads(lines[-1])
+            requests_made = server.requests[before:]
+            result['api_calls'] = len(requests_made)
+            result['bytes'] = sum(entry['bytes'] for entry in requests_made)
+            results[f'{name}/{phase}'] = result
+    return results
+
+
+def compare(results: Dict[str, Dict[str, Any]], baseline: Dict[str, Dict[str, Any]]) -> List[str]:
+    """Return a message for every metric that exceeds its budget."""
+    regressions = []
+    for key, result in results.items():
+        if not result.get('succeeded'):
+            regressions.append(f'{key}: run failed')
+        # A fallback means part of the pipeline was skipped, so its timings mean little.
+        for field in ('fallbacks', 'degraded'):
+            if result.get(field):
+                regressions.append(f"{key}: {field}: {', '.join(result[field])}")
+        budget = baseline.get(key)
+        if budget is None:
+            continue
+        for metric, (relative, absolute) in TOLERANCES.items():
+            value, limit = result.get(metric), budget.get(metric)
+            if value is None or limit is None:
+                continue
+            allowed = limit * (1 + relative) + absolute
+            if value > allowed:
+                regressions.append(f'{key}: {metric} {value:.4g} exceeds budget {allowed:.4g} (baseline {limit:.4g})')
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the daily update pipeline against the stub server.')
+    parser.add_argument('--scenario', choices=sorted(SCENARIOS), action='append', help='run only these scenarios')
+    parser.add_argument('--update-baseline', action='store_true', help='write the results as the new baseline')
+    parser.add_argument('--output', help='also write the raw results to this JSON file')
+    parser.add_argument('--child', metavar='README', help=argparse.SUPPRESS)
+    parser.add_argument('--stargazer-max-repos', type=int, default=0, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        with open(os.devnull, 'w') as devnull:
+            stdout, sys.stdout = sys.stdout, devnull
+            try:
+                result = _child_run(args.child, args.stargazer_max_repos)
+            finally:
+                sys.stdout = stdout
+        print(json.dumps(result))
+        return
+
+    sys.path.insert(0, str(SCRIPTS_DIR))
+    results: Dict[str, Dict[str, Any]] = {}
+    for name in args.scenario or SCENARIOS:
+        repos, streak_days = SCENARIOS[name]
+        print(f'Running {name}: {repos} repos, {streak_days}-day streak...', flush=True)
+        results.update(run_scenario(name, repos, streak_days))
+
+    print(f"\n{'run':<14} {'wall s':>8} {'readme s':>9} {'calls':>6} {'KiB':>9} {'RSS MB':>7}")
+    for key, result in results.items():
+        print(
+            f"{key:<14} {result['wall_seconds']:>8.2f} {result['readme_seconds'] or 0:>9.3f} "
+            f"{result['api_calls']:>6} {result['bytes'] / 1024:>9.1f} {result['peak_rss_mb'] or 0:>7.1f}"
+        )
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=1, sort_keys=True) + '\n', encoding='utf-8')
+
+    baseline: Dict[str, Dict[str, Any]] = {}
+    if BASELINE_PATH.exists():
+        baseline = json.loads(BASELINE_PATH.read_text(encoding='utf-8'))
+    if args.update_baseline:
+        baseline.update({
+            key: {metric: round(result[metric], 4) for metric in TOLERANCES if result.get(metric) is not None}
+            for key, result in results.items()
+        })
+        BASELINE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        BASELINE_PATH.write_text(json.dumps(baseline, indent=1, sort_keys=True) + '\n', encoding='utf-8')
+        print(f'\nBaseline updated: {BASELINE_PATH}')
+        return
+
+    regressions = compare(results, baseline)
+    if regressions:
+        print('\nBudget regressions:')
+        for message in regressions:
+            print(f'  - {message}')
+        sys.exit(1)
+    print('\nAll runs within budget.')
+
+
+if __name__ == '__main__':
+    main()
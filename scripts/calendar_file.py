@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Binary Calendar Files
+A compact, memory-mappable format for per-user contribution history:
+
+    offset  size  field
+    0       4     magic  b'CCAL'
+    4       2     format version (uint16)
+    6       2     reserved
+    8       8     GitHub user id (uint64, 0 when unknown)
+    16      40    login (UTF-8, NUL padded)
+    56      4     epoch day (int32, days since 1970-01-01)
+    60      4     day count (uint32)
+    64      2*n   daily counts (uint16)
+
+All fields are little-endian. Readers map the file and slice only the tail
+they need, so nothing is parsed at startup no matter how long the history is.
+"""
+
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from datetime import date, timedelta
+from typing import Optional
+
+from contribution_analytics import ContributionSeries
+
+MAGIC = b'CCAL'
+VERSION = 1
+HEADER = struct.Struct('<4sHHQ40siI')
+UNIX_EPOCH = date(1970, 1, 1)
+
+
+def _to_little_endian(counts: array) -> bytes:
+    if sys.byteorder == 'big':
+        counts = array('H', counts)
+        counts.byteswap()
+    return counts.tobytes()
+
+
+def write_calendar(path: str, series: ContributionSeries, login: str = '', user_id: int = 0) -> None:
+    """Atomically write ``series`` to ``path`` in the binary calendar format."""
+    epoch_day = (series.epoch - UNIX_EPOCH).days if series.epoch else 0
+    header = HEADER.pack(
+        MAGIC, VERSION, 0, user_id, login.encode('utf-8')[:40], epoch_day, len(series.counts)
+    )
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as file:
+            file.write(header)
+            file.write(_to_little_endian(series.counts))
+        os.replace(temp_path, path)
+    except Exception:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+class CalendarFile:
+    """Read-only, memory-mapped view of a binary calendar file."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f'Empty calendar file: {path}')
+        if len(self._map) < HEADER.size:
+            self.close()
+            raise ValueError(f'Truncated calendar file: {path}')
+        magic, version, _, self.user_id, login, epoch_day, self.day_count = HEADER.unpack_from(self._map)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f'Not a version {VERSION} calendar file: {path}')
+        self.login = login.rstrip(b'\x00').decode('utf-8')
+        self.epoch = UNIX_EPOCH + timedelta(days=epoch_day)
+        self.day_count = min(self.day_count, (len(self._map) - HEADER.size) // 2)
+
+    def __enter__(self) -> 'CalendarFile':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if getattr(self, '_map', None) is not None and not self._map.closed:
+            self._map.close()
+        self._file.close()
+
+    @property
+    def last_date(self) -> Optional[date]:
+        return self.epoch + timedelta(days=self.day_count - 1) if self.day_count else None
+
+    def _counts(self, start: int, end: int) -> array:
+        counts = array('H')
+        counts.frombytes(self._map[HEADER.size + 2 * start:HEADER.size + 2 * end])
+        if sys.byteorder == 'big':
+            counts.byteswap()
+        return counts
+
+    def tail(self, days: int) -> ContributionSeries:
+        """Return only the newest ``days`` days as a series."""
+        start = max(0, self.day_count - max(days, 0))
+        return ContributionSeries(self.epoch + timedelta(days=start), self._counts(start, self.day_count))
+
+    def series(self) -> ContributionSeries:
+        """Return the whole history as a series."""
+        return self.tail(self.day_count)
+
+    def current_streak(self, today: date, chunk_days: int = 64) -> int:
+        """Compute the current streak reading tail chunks until a zero day appears."""
+        days = chunk_days
+        while True:
+            tail = self.tail(days)
+            streak = tail.current_streak(today)
+            # A streak shorter than the loaded tail ended on a zero inside it.
+            if days >= self.day_count or streak < len(tail) - 1:
+                return streak
+            days *= 4
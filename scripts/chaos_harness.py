@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Upstream Chaos Harness
+Runs ``DailyUpdater.run_daily_update`` repeatedly against the local stub
+server while one upstream route misbehaves: slow answers, 5xx responses,
+truncated bodies or connection resets. For every fault profile it reports
+p50/p95/p99 end-to-end runtime and which README sections fell back, so the
+cost of a stalled upstream is visible before it happens in production.
+
+    python scripts/chaos_harness.py                         # every route x fault
+    python scripts/chaos_harness.py --route quote --runs 20
+    python scripts/chaos_harness.py --kind delay --delay 6  # past the quote timeout
+"""
+
+import argparse
+import contextlib
+import json
+import math
+import os
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from daily_update import DailyUpdater
+from run_logging import shutdown as shutdown_logging
+from stub_server import Fault, StubDataset, StubServer
+
+ROUTES = ('quote', 'user', 'repos', 'languages', 'events', 'graphql', 'contributions', 'wakatime')
+WAKATIME_SECTION = '\n<!--START_SECTION:waka-->\n<!--END_SECTION:waka-->\n'
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """Nearest-rank percentile; exact for the small samples a harness produces."""
+    ordered = sorted(values)
+    if not ordered:
+        return math.nan
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+@contextlib.contextmanager
+def _environment(values: Dict[str, str]) -> Iterator[None]:
+    saved = {name: os.environ.get(name) for name in values}
+    os.environ.update(values)
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+
+def run_once(server: StubServer, readme_source: str) -> Dict[str, Any]:
+    """One cold run (fresh README and cache) against ``server``."""
+    with tempfile.TemporaryDirectory() as directory:
+        readme = Path(directory) / 'README.md'
+        readme.write_text(readme_source, encoding='utf-8')
+        env = dict(
+            server.env(),
+            GH_TOKEN='chaos-token',
+            WAKATIME_API_KEY='chaos-key',
+            PUSH_CHANGES='false',
+            PROFILE_CACHE_DIR=str(Path(directory) / 'cache'),
+            LOG_FILE=str(Path(directory) / 'run.log'),
+            TRACE_FILE=str(Path(directory) / 'run.trace.json'),
+            METRICS_TEXTFILE=str(Path(directory) / 'run.prom'),
+            LOG_LEVEL='ERROR',
+        )
+        started = time.perf_counter()
+        with _environment(env), open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            updater = DailyUpdater()
+            updater.readme_file = str(readme)
+            try:
+                succeeded = updater.run_daily_update()
+            except Exception:
+                succeeded = False
+            finally:
+                shutdown_logging()
+        return {
+            'seconds': time.perf_counter() - started,
+            'succeeded': bool(succeeded),
+            'fallbacks': list(updater.fallbacks),
+        }
+
+
+def build_profiles(routes: Sequence[str], kinds: Sequence[str], delay: float, probability: float) -> Dict[str, Dict[str, Fault]]:
+    """``baseline`` plus one profile per route and fault kind."""
+    profiles: Dict[str, Dict[str, Fault]] = {'baseline': {}}
+    for route in routes:
+        for kind in kinds:
+            profiles[f'{kind}:{route}'] = {route: Fault(kind, probability=probability, delay=delay)}
+    return profiles
+
+
+def run_profiles(
+    profiles: Dict[str, Dict[str, Fault]],
+    runs: int,
+    dataset: StubDataset,
+    seed: int = 0,
+) -> Dict[str, Dict[str, Any]]:
+    readme_source = (SCRIPTS_DIR.parent / 'README.md').read_text(encoding='utf-8')
+    if '<!--START_SECTION:waka-->' not in readme_source:
+        readme_source += WAKATIME_SECTION  # so WakaTime faults reach a section
+    report: Dict[str, Dict[str, Any]] = {}
+    with StubServer(dataset, fault_seed=seed) as server:
+        for name, faults in profiles.items():
+            server.faults = faults
+            results = [run_once(server, readme_source) for _ in range(runs)]
+            seconds = [result['seconds'] for result in results]
+            fallbacks = Counter(section for result in results for section in result['fallbacks'])
+            report[name] = {
+                'runs': runs,
+                'succeeded': sum(result['succeeded'] for result in results),
+                'p50': percentile(seconds, 50),
+                'p95': percentile(seconds, 95),
+                'p99': percentile(seconds, 99),
+                'max': max(seconds),
+                'fallbacks': dict(sorted(fallbacks.items())),
+            }
+    return report
+
+
+def format_report(report: Dict[str, Dict[str, Any]]) -> str:
+    lines = [f"{'profile':<22} {'ok':>5} {'p50 s':>7} {'p95 s':>7} {'p99 s':>7}  fallbacks"]
+    for name, row in report.items():
+        fallbacks = ', '.join(f'{section} x{count}' for section, count in row['fallbacks'].items()) or '-'
+        lines.append(
+            f"{name:<22} {row['succeeded']:>2}/{row['runs']:<2} {row['p50']:>7.2f} {row['p95']:>7.2f} {row['p99']:>7.2f}  {fallbacks}"
+        )
+    return '\n'.join(lines)
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description='Inject upstream faults and measure run latency and fallbacks.')
+    parser.add_argument('--route', choices=ROUTES, action='append', help='routes to disturb (default: all)')
+    parser.add_argument('--kind', choices=Fault.KINDS, action='append', help='fault kinds (default: all)')
+    parser.add_argument('--runs', type=int, default=5, help='runs per profile')
+    parser.add_argument('--delay', type=float, default=1.5, help='seconds added by delay faults')
+    parser.add_argument('--probability', type=float, default=1.0, help='share of requests hit by the fault')
+    parser.add_argument('--repos', type=int, default=30)
+    parser.add_argument('--seed', type=int, default=0, help='seed for probabilistic faults')
+    parser.add_argument('--json', help='also write the report to this JSON file')
+    args = parser.parse_args(argv)
+
+    profiles = build_profiles(args.route or ROUTES, args.kind or Fault.KINDS, args.delay, args.probability)
+    report = run_profiles(profiles, args.runs, StubDataset(repos=args.repos), seed=args.seed)
+    print(format_report(report))
+    if args.json:
+        Path(args.json).write_text(json.dumps(report, indent=1) + '\n', encoding='utf-8')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Contribution Analytics
+Holds a contribution calendar as a compact ``array('H')`` of daily counts
+indexed by day offset from an epoch date. Streaks, totals and distributions
+are computed with C-level builtins (bytes searches, slice sums) instead of
+walking lists of day dicts, so decade-long histories take microseconds.
+"""
+
+from array import array
+from datetime import date, timedelta
+from itertools import accumulate
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+MAX_COUNT = 0xFFFF
+
+
+class ContributionSeries:
+    """Daily contribution counts stored as uint16 values from ``epoch`` onward."""
+
+    def __init__(self, epoch: Optional[date] = None, counts: Optional[Iterable[int]] = None):
+        self.epoch = epoch
+        self.counts = array('H', counts or [])
+        self._mask: Optional[bytes] = None
+
+    @classmethod
+    def from_days(cls, days: Iterable[Dict[str, Any]]) -> 'ContributionSeries':
+        """Build a series from GraphQL-style ``contributionDays`` entries."""
+        series = cls()
+        series.merge(days)
+        return series
+
+    def __len__(self) -> int:
+        return len(self.counts)
+
+    @property
+    def last_date(self) -> Optional[date]:
+        """Return the newest date held by the series."""
+        if self.epoch is None or not self.counts:
+            return None
+        return self.epoch + timedelta(days=len(self.counts) - 1)
+
+    def get(self, day: date) -> int:
+        """Return the count for ``day``; days outside the series count as zero."""
+        if self.epoch is None:
+            return 0
+        index = (day - self.epoch).days
+        return self.counts[index] if 0 <= index < len(self.counts) else 0
+
+    def set(self, day: date, count: int) -> None:
+        """Store ``count`` for ``day``, growing the array in either direction."""
+        count = max(0, min(int(count), MAX_COUNT))
+        if self.epoch is None:
+            self.epoch = day
+        index = (day - self.epoch).days
+        if index < 0:
+            self.counts = array('H', bytes(2 * -index)) + self.counts
+            self.epoch = day
+            index = 0
+        elif index >= len(self.counts):
+            self.counts.extend(array('H', bytes(2 * (index + 1 - len(self.counts)))))
+        self.counts[index] = count
+        self._mask = None
+
+    def merge(self, days: Iterable[Dict[str, Any]]) -> None:
+        """Record ``contributionDays`` entries, newest data wins."""
+        for day in days:
+            date_str = day.get('date')
+            if date_str:
+                self.set(date.fromisoformat(date_str), day.get('contributionCount', 0) or 0)
+
+    def active_mask(self) -> bytes:
+        """Return one byte per day: 1 when the day has contributions, else 0."""
+        if self._mask is None:
+            self._mask = bytes(map(bool, self.counts))
+        return self._mask
+
+    def current_streak(self, today: date) -> int:
+        """Count consecutive active days ending today (or yesterday if today is still empty)."""
+        if self.epoch is None:
+            return 0
+        last = (today - self.epoch).days
+        if self.get(today) == 0:
+            last -= 1
+        if last < 0 or last >= len(self.counts):
+            return 0
+        return last - self.active_mask().rfind(b'\x00', 0, last + 1)
+
+    def longest_streak(self) -> Tuple[int, Optional[date]]:
+        """Return the longest run of active days and the date it started."""
+        mask = self.active_mask()
+        length = max(map(len, mask.split(b'\x00')), default=0)
+        if not length:
+            return 0, None
+        return length, self.epoch + timedelta(days=mask.find(b'\x01' * length))
+
+    def total(self) -> int:
+        """Return all contributions in the series."""
+        return sum(self.counts)
+
+    def yearly_totals(self) -> Dict[int, int]:
+        """Return contributions per calendar year."""
+        if self.epoch is None or not self.counts:
+            return {}
+        totals = {}
+        for year in range(self.epoch.year, self.last_date.year + 1):
+            start = max(0, (date(year, 1, 1) - self.epoch).days)
+            end = min(len(self.counts), (date(year + 1, 1, 1) - self.epoch).days)
+            totals[year] = sum(self.counts[start:end])
+        return totals
+
+    def best_day(self) -> Optional[Tuple[date, int]]:
+        """Return the date with the most contributions and its count."""
+        if not self.counts:
+            return None
+        best = max(self.counts)
+        return self.epoch + timedelta(days=self.counts.index(best)), best
+
+    def rolling_average(self, window: int) -> List[float]:
+        """Return the trailing ``window``-day average for each complete window."""
+        window = max(1, window)
+        prefix = array('Q', accumulate(self.counts, initial=0))
+        return [
+            (prefix[index + window] - prefix[index]) / window
+            for index in range(len(self.counts) - window + 1)
+        ]
+
+    def weekday_distribution(self) -> List[int]:
+        """Return total contributions per weekday, Monday first."""
+        distribution = [0] * 7
+        if self.epoch is None:
+            return distribution
+        first_weekday = self.epoch.weekday()
+        for offset in range(7):
+            distribution[(first_weekday + offset) % 7] = sum(self.counts[offset::7])
+        return distribution
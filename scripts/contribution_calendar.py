@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Contribution Calendar Store
+Keeps the daily contribution counts seen by previous runs so streaks can be
+recomputed locally when nothing new has happened upstream, and parses GitHub's
+public contributions calendar for runs without a token.
+"""
+
+import os
+import re
+from datetime import date
+from html.parser import HTMLParser
+from typing import Any, Dict, Iterable, List, Optional
+
+from calendar_file import CalendarFile, write_calendar
+from contribution_analytics import ContributionSeries
+from profile_cache import load_json
+
+
+class CalendarStore:
+    """A user's ``ContributionSeries``, persisted as a binary calendar file."""
+
+    def __init__(self, path: Optional[str], login: str = '', user_id: int = 0, legacy_path: Optional[str] = None):
+        self.path = path
+        self.login = login
+        self.user_id = user_id
+        self.series = ContributionSeries()
+        if path and os.path.exists(path):
+            with CalendarFile(path) as calendar_file:
+                self.series = calendar_file.series()
+                self.user_id = user_id or calendar_file.user_id
+        elif legacy_path:
+            # Earlier releases kept the calendar as JSON; migrate it on first save.
+            data = load_json(legacy_path, {})
+            if data.get('epoch'):
+                self.series = ContributionSeries(date.fromisoformat(data['epoch']), data.get('counts', []))
+            elif data.get('days'):
+                self.series.merge(
+                    {'date': day, 'contributionCount': count} for day, count in data['days'].items()
+                )
+
+    def merge(self, days: Iterable[Dict[str, Any]]) -> None:
+        """Record GraphQL-style ``contributionDays`` entries, newest data wins."""
+        self.series.merge(days)
+
+    def latest_date(self) -> Optional[str]:
+        """Return the most recent date held in the store."""
+        last = self.series.last_date
+        return last.isoformat() if last else None
+
+    def current_streak(self, today: date) -> int:
+        """Return the streak ending today; days after the newest stored day count as zero."""
+        return self.series.current_streak(today)
+
+    def save(self) -> None:
+        """Persist the store when it has a backing file."""
+        if self.path and self.series.epoch is not None:
+            write_calendar(self.path, self.series, self.login, self.user_id)
+
+
+class ContributionCalendarParser(HTMLParser):
+    """Single-pass parser for GitHub's ``users/{user}/contributions`` fragment.
+
+    Day cells carry ``data-date`` and an ``id`` that a later ``tool-tip``
+    element references with the exact count ("3 contributions on ...").
+    Older markup exposes ``data-count`` on the cell itself. Feed the page in
+    chunks as it downloads and read ``days()`` once the stream ends.
+    """
+
+    COUNT_PATTERN = re.compile(r'^\s*(\d[\d,]*)\s+contribution')
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self._dates: Dict[str, str] = {}
+        self._levels: Dict[str, int] = {}
+        self._counts: Dict[str, int] = {}
+        self._tooltip_for: Optional[str] = None
+        self._tooltip_text: List[str] = []
+
+    def handle_starttag(self, tag: str, attrs) -> None:
+        attributes = dict(attrs)
+        date_str = attributes.get('data-date')
+        if date_str and tag in ('td', 'rect'):
+            # Skip cells a markup change has left unreadable instead of failing the page.
+            try:
+                date.fromisoformat(date_str)
+                count = attributes.get('data-count')
+                count = int(count.replace(',', '')) if count is not None else None
+            except ValueError:
+                return
+            cell_id = attributes.get('id') or date_str
+            self._dates[cell_id] = date_str
+            if count is not None:
+                self._counts[cell_id] = count
+            try:
+                self._levels[cell_id] = int(attributes.get('data-level') or 0)
+            except ValueError:
+                self._levels[cell_id] = 0
+        elif tag == 'tool-tip' and attributes.get('for'):
+            self._tooltip_for = attributes['for']
+            self._tooltip_text = []
+
+    def handle_data(self, data: str) -> None:
+        if self._tooltip_for is not None:
+            self._tooltip_text.append(data)
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == 'tool-tip' and self._tooltip_for is not None:
+            text = ''.join(self._tooltip_text)
+            match = self.COUNT_PATTERN.match(text)
+            if match:
+                self._counts[self._tooltip_for] = int(match.group(1).replace(',', ''))
+            elif text.strip().lower().startswith('no contributions'):
+                self._counts[self._tooltip_for] = 0
+            self._tooltip_for = None
+
+    def days(self) -> List[Dict[str, Any]]:
+        """Return parsed days in GraphQL ``contributionDays`` shape."""
+        result = []
+        for cell_id, date_str in self._dates.items():
+            count = self._counts.get(cell_id)
+            if count is None:
+                # Without a tooltip the intensity level still tells active from idle.
+                count = 1 if self._levels.get(cell_id, 0) > 0 else 0
+            result.append({'date': date_str, 'contributionCount': count})
+        return result
+
+
+def parse_contributions_html(chunks: Iterable[str]) -> List[Dict[str, Any]]:
+    """Parse a streamed contributions fragment into ``contributionDays`` entries."""
+    parser = ContributionCalendarParser()
+    for chunk in chunks:
+        if chunk:
+            parser.feed(chunk)
+    parser.close()
+    return parser.days()
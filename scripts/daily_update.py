@@ -5,19 +5,167 @@ Updates README.md with daily quote, GitHub stats, and contribution snake
 All updates are performed in a single operation for one commit per day
 """
 
+import argparse
+import hashlib
+import heapq
+import json
+import logging
+import math
 import os
 import re
 import requests
 import random
 import subprocess
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
 from datetime import datetime, timedelta, timezone
 from html import escape
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
+
+from adaptive_timeouts import LatencyBook, endpoint_key
+from calendar_file import CalendarFile
+from contribution_calendar import CalendarStore, parse_contributions_html
+from profile_cache import atomic_write_text, load_json, save_json
+from stats_history import StatsHistory
+from follower_sync import FOLLOWERS_QUERY, FollowerSync
+from stargazer_tracker import StargazerTracker, stargazers_query
+from streak_history import StreakHistory
+from metrics_exporter import build_metrics
+from run_profiler import PhaseProfiler
+from run_deadline import PRIORITIES, DeadlineExceeded, RunDeadline
+from run_logging import configure_logger, shutdown as shutdown_logging
+from tracing import Tracer, span, traced_request
+from trend_charts import bucket_weekly, write_trend_charts
+from wakatime_analytics import DEFAULT_WINDOWS, WakaTimeAnalytics
+from wakatime_cache import WakaTimeDayCache
+from wakatime_heatmap import build_hour_heatmap, build_year_heatmap
+
+# README badge URLs rewritten on every run with the freshly fetched values.
+BADGE_PATTERNS = {
+    'followers': re.compile(r'https://img\.shields\.io/(?:github/followers/Rayyan9477\?[^"]*|badge/Followers-[^"]*)'),
+    'stars': re.compile(r'https://img\.shields\.io/(?:github/stars/Rayyan9477\?[^"]*|badge/Total_Stars-[^"]*)'),
+    'profile_views': re.compile(r'https://komarev\.com/ghpvc/\?username=Rayyan9477[^"]*'),
+    'current_streak': re.compile(r'https://img\.shields\.io/badge/Current_Streak-[\d_]+Days-[^"]*'),
+}
+
+CONTRIBUTION_DAYS_QUERY = """
+query ContributionDays($username: String!, $from: DateTime!, $to: DateTime!) {
+  user(login: $username) {
+    contributionsCollection(from: $from, to: $to) {
+      contributionCalendar {
+        weeks {
+          contributionDays {
+            contributionCount
+            date
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+ACCOUNT_CREATED_QUERY = """
+query AccountCreated($username: String!) {
+  user(login: $username) {
+    createdAt
+  }
+}
+"""
+
 
 class DailyUpdater:
-    def __init__(self):
+    # Oldest stats snapshot that may stand in for a fetch on a quiet day.
+    stats_snapshot_max_age = 24 * 3600
+    language_fetch_workers = 8
+    top_repos_count = 5
+    # Days up to and including today that WakaTime may still be updating.
+    wakatime_refresh_days = 2
+    # Stargazer sync limits: repositories per aliased query, repositories per
+    # run, and GraphQL points to leave for everything after the sync.
+    stargazer_batch_size = 50
+    stargazer_max_repos = 500
+    graphql_rate_limit_reserve = 200
+    # Wall-clock budget for a run; RUN_DEADLINE_SECONDS overrides it and 0 disables it.
+    run_deadline_seconds = 300.0
+    github_api_url = 'https://api.github.com'
+    github_web_url = 'https://github.com'
+    quotes_api_url = 'https://api.quotable.io/random'
+    wakatime_api_base = 'https://wakatime.com/api/v1'
+
+    def __init__(self, configure: bool = True):
+        """Create an updater with empty per-run state.
+
+        With ``configure`` (the default) tokens, paths, logging, tracing, the
+        latency book and the run deadline come from the environment. Without
+        it the updater is offline, cache-less and uninstrumented until its
+        attributes are set, which is how the tests build one.
+        """
+        self.GH_TOKEN: Optional[str] = None
+        self.wakatime_token: Optional[str] = None
+        self.username = 'Rayyan9477'
+        self.user_id = 0
+        self.dry_run = False
+        self.push_changes_enabled = False
+        self.force_full_update = False
+        self.wakatime_hourly = False
+        # Project names can be private repositories; they are published only on request.
+        self.wakatime_publish_projects = False
+        # Cache files are skipped entirely when no cache directory is configured.
+        self.cache_dir: Optional[str] = None
+        self.readme_file: Optional[str] = None
+        self.log_file: Optional[str] = None
+        self.trace_file: Optional[str] = None
+        self.metrics_file: Optional[str] = None
+        self.logger: Optional[logging.Logger] = None
+        self.tracer: Optional[Tracer] = None
+        self.profiler: Optional[PhaseProfiler] = None
+        # Response-time history that turns each call site's timeout into a ceiling.
+        self.latency_book: Optional[LatencyBook] = None
+        # Wall-clock budget for the run, and the sections it forced onto cached values.
+        self.deadline: Optional[RunDeadline] = None
+        self.degraded: tuple = ()
+        # Sections served from a fallback this run, and the stats the run published.
+        self.fallbacks: tuple = ()
+        self.published_stats: Optional[Dict[str, Any]] = None
+        self.run_succeeded = False
+        self.streak_history: Optional[StreakHistory] = None
+        # Streak published by the current run, recorded in the stats history.
+        self.current_streak_days: Optional[int] = None
+        # Set when the public events feed shows nothing new since the last run.
+        self.activity_unchanged = False
+        self._pending_events_state: Optional[Dict[str, Any]] = None
+        # Cached per-repository entries and star counts from the last complete
+        # repository listing.
+        self._repo_index: Optional[Dict[str, Dict[str, Any]]] = None
+        self._repo_star_counts: Optional[Dict[str, int]] = None
+        self._wakatime_days: Optional[WakaTimeDayCache] = None
+        self._graphql_remaining: Optional[int] = None
+
+        # Tech quotes as fallback
+        self.tech_quotes = [
+            {"content": "The best way to predict the future is to invent it.", "author": "Alan Kay"},
+            {"content": "Code is like humor. When you have to explain it, it's bad.", "author": "Cory House"},
+            {"content": "First, solve the problem. Then, write the code.", "author": "John Johnson"},
+            {"content": "Any fool can write code that a computer can understand. Good programmers write code that humans can understand.", "author": "Martin Fowler"},
+            {"content": "Talk is cheap. Show me the code.", "author": "Linus Torvalds"},
+            {"content": "Simplicity is the ultimate sophistication.", "author": "Leonardo da Vinci"},
+            {"content": "Innovation distinguishes between a leader and a follower.", "author": "Steve Jobs"}
+        ]
+
+        if configure:
+            self._configure_from_environment()
+
+    def _configure_from_environment(self) -> None:
+        """Read settings from the environment (and ``.env``) and start instrumentation."""
+        self.log_file = os.getenv('LOG_FILE') or os.path.join(
+            os.path.dirname(os.path.abspath(__file__)), 'daily_update.log'
+        )
+        self.logger = configure_logger('daily_update', self.log_file)
         # Try to load .env file if present
         try:
             from dotenv import load_dotenv
@@ -34,27 +182,47 @@ class DailyUpdater:
         self.wakatime_token = os.getenv('WAKATIME_API_KEY')
         self.dry_run = os.getenv('DRY_RUN', 'false').lower() == 'true'
         self.push_changes_enabled = os.getenv('PUSH_CHANGES', 'true').lower() == 'true'
-        self.username = 'Rayyan9477'
-        self.quotes_api_url = "https://api.quotable.io/random"
-        self.wakatime_api_base = "https://wakatime.com/api/v1"
+        self.force_full_update = os.getenv('FORCE_FULL_UPDATE', 'false').lower() == 'true'
+        self.wakatime_hourly = os.getenv('WAKATIME_HOURLY', 'false').lower() == 'true'
+        self.wakatime_publish_projects = os.getenv('WAKATIME_PUBLISH_PROJECTS', 'false').lower() == 'true'
+        # Base URLs can point at scripts/stub_server.py for hermetic runs.
+        self.github_api_url = os.getenv('GITHUB_API_URL') or self.github_api_url
+        self.github_web_url = os.getenv('GITHUB_WEB_URL') or self.github_web_url
+        self.quotes_api_url = os.getenv('QUOTES_API_URL') or self.quotes_api_url
+        self.wakatime_api_base = os.getenv('WAKATIME_API_URL') or self.wakatime_api_base
         
         # Find README.md
         self.readme_file = self._find_readme()
-        self.log_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'daily_update.log')
-        
-        # Tech quotes as fallback
-        self.tech_quotes = [
-            {"content": "The best way to predict the future is to invent it.", "author": "Alan Kay"},
-            {"content": "Code is like humor. When you have to explain it, it's bad.", "author": "Cory House"},
-            {"content": "First, solve the problem. Then, write the code.", "author": "John Johnson"},
-            {"content": "Any fool can write code that a computer can understand. Good programmers write code that humans can understand.", "author": "Martin Fowler"},
-            {"content": "Talk is cheap. Show me the code.", "author": "Linus Torvalds"},
-            {"content": "Simplicity is the ultimate sophistication.", "author": "Leonardo da Vinci"},
-            {"content": "Innovation distinguishes between a leader and a follower.", "author": "Steve Jobs"}
-        ]
+        self.tracer = Tracer('daily_update')
+        self.trace_file = os.getenv('TRACE_FILE') or os.path.join(
+            os.path.dirname(os.path.abspath(__file__)), 'daily_update.trace.json'
+        )
+        self.metrics_file = os.getenv('METRICS_TEXTFILE') or os.path.join(
+            os.path.dirname(os.path.abspath(__file__)), 'daily_update.prom'
+        )
+        self.cache_dir = os.getenv('PROFILE_CACHE_DIR') or os.path.join(
+            os.path.dirname(os.path.abspath(__file__)), 'cache'
+        )
+        self.latency_book = LatencyBook(self._cache_path('latency.json'))
+        budget = self._env_seconds('RUN_DEADLINE_SECONDS', self.run_deadline_seconds)
+        self.deadline = RunDeadline(budget) if budget > 0 else None
         
         self.log("🚀 Daily Update Script Started")
     
+    def _env_seconds(self, name: str, default: float) -> float:
+        """Read a duration in seconds from ``name``, keeping ``default`` when it is unset or malformed."""
+        raw = (os.getenv(name) or '').strip()
+        if not raw:
+            return default
+        try:
+            value = float(raw)
+            if math.isnan(value):
+                raise ValueError(raw)
+        except ValueError:
+            self.log(f"⚠️ Ignoring {name}={raw!r}; using {default:g}s", "WARNING")
+            return default
+        return value
+
     def _find_readme(self) -> str:
         """Find README.md in common locations"""
         possible_paths = [
@@ -74,31 +242,119 @@ class DailyUpdater:
         return possible_paths[0]
     
     def log(self, message: str, level: str = "INFO"):
-        """Log messages with timestamp"""
+        """Log a message through the queue-backed logger (console + JSON lines)"""
+        levelno = logging.getLevelName(level.upper())
+        if not isinstance(levelno, int):
+            levelno = logging.INFO
+        if self.logger is not None:
+            self.logger.log(levelno, message)
+            return
+
+        # Not configured (e.g. partially constructed in tests): console only.
+        if levelno < logging.INFO:
+            return
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         log_message = f"[{timestamp}] {level}: {message}"
         try:
             print(log_message)
         except UnicodeEncodeError:
             # Fallback for terminals that cannot render emojis
-            safe_message = log_message.encode("ascii", "ignore").decode("ascii")
             try:
-                print(safe_message)
+                print(log_message.encode("ascii", "ignore").decode("ascii"))
             except Exception:
                 pass
-        
-        try:
-            with open(self.log_file, 'a', encoding='utf-8') as f:
-                f.write(log_message + '\n')
-        except (PermissionError, OSError):
-            pass  # Ignore logging errors
-        except Exception:
-            pass  # Ignore any other logging errors
     
+    def _note_fallback(self, section: str) -> None:
+        """Remember that a section was served from a fallback this run."""
+        if section not in self.fallbacks:
+            self.fallbacks += (section,)
+
+    def _note_degraded(self, section: str) -> None:
+        """Remember that the run deadline pushed a section onto cached values."""
+        if section not in self.degraded:
+            self.degraded += (section,)
+            self.log(f"⏱️ Run deadline: serving {section} from cached values", "WARNING")
+        self._note_fallback(section)
+
+    def _write_metrics(self) -> None:
+        """Export this run's trace and published values as a Prometheus textfile."""
+        if not self.metrics_file or self.tracer is None:
+            return
+        stats = self.published_stats or {}
+        published = {
+            'followers': stats.get('followers'),
+            'total_stars': stats.get('total_stars'),
+            'stars_this_week': stats.get('stars_this_week'),
+            'current_streak': self.current_streak_days,
+        }
+        try:
+            atomic_write_text(
+                self.metrics_file,
+                build_metrics(
+                    self.tracer, published, self.run_succeeded, self.fallbacks,
+                    degraded=self.degraded,
+                    deadline=(self.deadline.budget, self.deadline.remaining()) if self.deadline else None,
+                ),
+            )
+        except OSError as e:
+            self.log(f"⚠️ Could not write metrics textfile: {e}", "WARNING")
+
+    def _debug_enabled(self) -> bool:
+        return self.logger is not None and self.logger.isEnabledFor(logging.DEBUG)
+
+    @contextmanager
+    def _span(self, name: str, category: str = 'phase', **args: Any):
+        """Open a tracing span, and a profiling phase under ``--profile``.
+
+        Spans named after a prioritized section also bill their requests to
+        that section of the run deadline.
+        """
+        with ExitStack() as stack:
+            attributes = stack.enter_context(span(self.tracer, name, category, **args))
+            if self.profiler is not None:
+                stack.enter_context(self.profiler.phase(name))
+            if self.deadline is not None and name in PRIORITIES:
+                stack.enter_context(self.deadline.section(name))
+            yield attributes
+
+    def _request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Send an HTTP request through the tracer with a latency-derived timeout.
+
+        The ``timeout`` passed by the call site is the ceiling; once an
+        endpoint has history, it is lowered towards its observed tail latency.
+        A timeout is recorded too, so the next run allows that endpoint longer,
+        unless the run deadline had cut the timeout short: that one says
+        nothing about the endpoint.
+        """
+        key = endpoint_key(method, url, kwargs.get('json')) if self.latency_book is not None else None
+        adjustable = not isinstance(kwargs.get('timeout'), tuple)
+        if key is not None and adjustable:
+            kwargs['timeout'] = self.latency_book.timeout(key, kwargs.get('timeout'))
+        budget_limited = False
+        if self.deadline is not None and adjustable:
+            wanted = kwargs.get('timeout')
+            try:
+                kwargs['timeout'] = self.deadline.clamp(wanted)
+            except DeadlineExceeded:
+                self._note_degraded(self.deadline.current or 'other')
+                raise
+            budget_limited = wanted is None or kwargs['timeout'] < wanted
+        if key is None:
+            return traced_request(self.tracer, method, url, **kwargs)
+        started = time.perf_counter()
+        try:
+            response = traced_request(self.tracer, method, url, **kwargs)
+        except requests.exceptions.Timeout:
+            if not budget_limited:
+                self.latency_book.record_timeout(key, time.perf_counter() - started)
+            raise
+        self.latency_book.record(key, time.perf_counter() - started)
+        return response
+
     def get_daily_quote(self) -> Dict[str, str]:
         """Get a daily inspirational quote"""
         try:
-            response = requests.get(self.quotes_api_url, timeout=5)
+            response = self._request('GET', self.quotes_api_url, timeout=5)
             if response.status_code == 200:
                 data = response.json()
                 content = data.get("content", "").strip()
@@ -117,10 +373,173 @@ class DailyUpdater:
             self.log(f"⚠️ Unexpected error fetching quote: {e}", "WARNING")
         
         # Fallback to predefined quotes
+        self._note_fallback('quote')
         quote = random.choice(self.tech_quotes)
         self.log(f"✅ Using fallback quote: '{quote['content'][:50]}...' by {quote['author']}")
         return quote
     
+    def _check_public_activity(self) -> bool:
+        """Report whether the public events feed changed since the last run.
+
+        The feed is polled with the stored ETag, so an unchanged feed costs a
+        single 304 response, and ``X-Poll-Interval`` is honored between polls.
+        Private contributions never appear in this feed; set
+        ``FORCE_FULL_UPDATE=true`` to bypass the check. Any failure counts as
+        new activity so the full pipeline runs.
+        """
+        path = self._cache_path('events.json')
+        if not path or self.force_full_update:
+            return True
+
+        state = load_json(path, {})
+        last_event_id = state.get('last_event_id')
+        if last_event_id and time.time() < state.get('next_poll_at', 0):
+            self.log("ℹ️ Events feed polled recently; assuming no new activity")
+            return False
+
+        headers = {'Accept': 'application/vnd.github.v3+json'}
+        if self.GH_TOKEN:
+            headers['Authorization'] = f'token {self.GH_TOKEN}'
+        if state.get('etag'):
+            headers['If-None-Match'] = state['etag']
+
+        try:
+            response = self._request(
+                'GET',
+                f'{self.github_api_url}/users/{self.username}/events/public?per_page=1',
+                headers=headers,
+                timeout=10,
+            )
+        except requests.exceptions.RequestException as e:
+            self.log(f"⚠️ Events feed check failed: {e}", "WARNING")
+            return True
+
+        try:
+            poll_interval = int(response.headers.get('X-Poll-Interval', 60))
+        except (TypeError, ValueError):
+            poll_interval = 60
+
+        if response.status_code == 304:
+            event_id = last_event_id
+        elif response.status_code == 200:
+            events = response.json()
+            event_id = str(events[0].get('id')) if events else last_event_id
+        else:
+            self.log(f"⚠️ Events feed returned status {response.status_code}", "WARNING")
+            return True
+
+        # Saved only after a successful run, so a failed run is retried in full.
+        self._pending_events_state = {
+            'etag': response.headers.get('ETag', state.get('etag')),
+            'last_event_id': event_id,
+            'next_poll_at': time.time() + poll_interval,
+        }
+        changed = event_id is None or event_id != last_event_id
+        self.log(
+            "✅ New public activity detected" if changed
+            else "ℹ️ No new public activity since the last run"
+        )
+        return changed
+
+    def _save_events_state(self) -> None:
+        """Persist the events feed position observed by this run."""
+        path = self._cache_path('events.json')
+        state = self._pending_events_state
+        if path and state and not self.dry_run:
+            save_json(path, state)
+
+    def _load_stats_snapshot(self, max_age: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Return the stats published by the last full run, if any.
+
+        With ``max_age`` a snapshot older than that many seconds, or one
+        without a fetch time, counts as missing so the caller refetches.
+        """
+        path = self._cache_path('stats.json')
+        snapshot = load_json(path, None) if path else None
+        if not snapshot:
+            return None
+        fetched_at = snapshot.pop('fetched_at', None)
+        if max_age is not None and (fetched_at is None or time.time() - fetched_at > max_age):
+            return None
+        return snapshot
+
+    def _save_stats_snapshot(self, stats: Dict[str, Any]) -> None:
+        """Remember fetched stats for days without new activity."""
+        path = self._cache_path('stats.json')
+        if path and stats and not self.dry_run:
+            save_json(path, dict(stats, fetched_at=time.time()))
+
+    def _record_stats_history(self, stats: Dict[str, Any]) -> None:
+        """Append the published values to the local SQLite history."""
+        path = self._cache_path('stats_history.sqlite3')
+        if not path or self.dry_run or not stats:
+            return
+        values = {
+            'followers': stats.get('followers'),
+            'following': stats.get('following'),
+            'public_repos': stats.get('public_repos'),
+            'total_stars': stats.get('total_stars'),
+            'total_forks': stats.get('total_forks'),
+            'stars_this_week': stats.get('stars_this_week'),
+            'current_streak': self.current_streak_days,
+        }
+        today = datetime.now(timezone.utc).date()
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with StatsHistory(path) as history:
+                recorded = history.record_snapshot(self.username, today, values)
+                growth = history.growth(self.username, 'followers', today)
+            self.log(f"✅ Recorded {recorded} metrics in stats history")
+            if growth is not None:
+                self.log(f"📈 Followers week over week: {growth:+d}")
+        except Exception as e:
+            self.log(f"⚠️ Could not record stats history: {e}", "WARNING")
+
+    def _write_trend_charts(self) -> None:
+        """Render trend PNGs from the stats history and calendar; no API calls."""
+        if self.dry_run or not self.cache_dir:
+            return
+        history_path = self._cache_path('stats_history.sqlite3')
+        charts = {}
+        today = datetime.now(timezone.utc).date()
+        last_value = itemgetter(-1)
+        if os.path.exists(history_path):
+            since = today - timedelta(days=365)
+            try:
+                with StatsHistory(history_path) as history:
+                    charts['followers.png'] = ('Followers', bucket_weekly(
+                        history.series(self.username, 'followers', since), today, last_value
+                    ), '#22C55E')
+                    charts['stars.png'] = ('Total Stars', bucket_weekly(
+                        history.series(self.username, 'total_stars', since), today, last_value
+                    ), '#FFC107')
+            except Exception as e:
+                # A damaged history only costs the follower and star charts.
+                self.log(f"⚠️ Could not read stats history for trend charts: {e}", "WARNING")
+                self._note_fallback('trend_charts')
+                charts = {}
+
+        series = self._calendar_store().series
+        if series.epoch is not None:
+            # Totals for the 52 completed calendar weeks, each dated by its Sunday.
+            start = today - timedelta(days=today.weekday() + 364)
+            days = [start + timedelta(days=offset) for offset in range((today - start).days)]
+            charts['contributions.png'] = ('Weekly Contributions', bucket_weekly(
+                [(day.isoformat(), series.get(day)) for day in days], today, sum
+            ), '#F85D7F')
+
+        output_dir = Path(self.readme_file).resolve().parent / 'assets' / 'trends'
+        try:
+            written = write_trend_charts(charts, output_dir, self._cache_path('trend_charts.json'))
+        except ImportError:
+            self.log("ℹ️ matplotlib not installed, skipping trend charts")
+            return
+        except Exception as e:
+            self.log(f"⚠️ Could not render trend charts: {e}", "WARNING")
+            return
+        for name in written:
+            self.log(f"✅ Updated trend chart: {output_dir / name}")
+
     def get_github_stats(self) -> Dict[str, Any]:
         """Fetch latest GitHub statistics"""
         headers = {
@@ -132,8 +551,8 @@ class DailyUpdater:
             self.log("⚠️ GH_TOKEN not set, attempting unauthenticated GitHub stats", "WARNING")
         
         try:
-            user_url = f'https://api.github.com/users/{self.username}'
-            response = requests.get(user_url, headers=headers, timeout=10)
+            user_url = f'{self.github_api_url}/users/{self.username}'
+            response = self._request('GET', user_url, headers=headers, timeout=10)
             
             if response.status_code == 403:
                 self.log("⚠️ GitHub API rate limit exceeded", "WARNING")
@@ -146,6 +565,7 @@ class DailyUpdater:
                 return {}
                 
             user_data = response.json()
+            self.user_id = user_data.get('id', 0) or 0
             stats = {
                 'followers': user_data.get('followers', 0),
                 'following': user_data.get('following', 0),
@@ -154,6 +574,9 @@ class DailyUpdater:
                 'total_forks': self._get_total_forks(headers),
                 'languages': self._get_primary_languages(headers),
             }
+            followers = self._sync_followers(stats['followers'])
+            if followers is not None:
+                stats['recent_followers'] = [entry['login'] for entry in followers['recent']]
             
             self.log(f"✅ GitHub stats fetched: {stats['public_repos']} repos, {stats['followers']} followers")
             return stats
@@ -170,13 +593,14 @@ class DailyUpdater:
     
     def _get_total_stars(self, headers: Dict[str, str]) -> Optional[int]:
         """Get total stars across all repositories"""
-        url = f'https://api.github.com/users/{self.username}/repos'
+        url = f'{self.github_api_url}/users/{self.username}/repos'
         total_stars = 0
+        star_counts = {}
         page = 1
         
         try:
             while True:
-                response = requests.get(f'{url}?page={page}&per_page=100', headers=headers, timeout=10)
+                response = self._request('GET', f'{url}?page={page}&per_page=100', headers=headers, timeout=10)
                 if response.status_code != 200:
                     self.log(
                         f"⚠️ Stars fetch failed with status {response.status_code}",
@@ -189,6 +613,9 @@ class DailyUpdater:
                     break
                     
                 total_stars += sum(repo.get('stargazers_count', 0) for repo in repos)
+                star_counts.update(
+                    (repo.get('full_name', ''), repo.get('stargazers_count', 0)) for repo in repos
+                )
                 page += 1
                 
         except requests.exceptions.Timeout:
@@ -201,17 +628,136 @@ class DailyUpdater:
             self.log(f"⚠️ Unexpected error fetching stars: {e}", "WARNING")
             return None
             
+        self._repo_star_counts = star_counts
         return total_stars
+
+    def _post_graphql(self, query: str, variables: Dict[str, Any], label: str) -> Optional[Dict[str, Any]]:
+        """Run one GraphQL query and return its ``data``, or None on any failure."""
+        headers = {
+            'Authorization': f'bearer {self.GH_TOKEN}',
+            'Content-Type': 'application/json',
+        }
+        try:
+            response = self._request(
+                'POST',
+                f'{self.github_api_url}/graphql',
+                json={'query': query, 'variables': variables},
+                headers=headers,
+                timeout=20,
+            )
+            if response.status_code != 200:
+                self.log(f"⚠️ {label} query returned status {response.status_code}", "WARNING")
+                return None
+            try:
+                self._graphql_remaining = int(response.headers['X-RateLimit-Remaining'])
+            except (KeyError, TypeError, ValueError):
+                pass
+            data = response.json()
+            if 'errors' in data:
+                self.log(f"⚠️ {label} GraphQL errors: {data['errors']}", "WARNING")
+                return None
+            return data.get('data') or {}
+        except requests.exceptions.RequestException as e:
+            self.log(f"⚠️ Error running {label} query: {e}", "WARNING")
+            return None
+
+    def _sync_followers(self, follower_count: int) -> Optional[Dict[str, Any]]:
+        """Update the local follower id set and return recent gains and losses.
+
+        When the profile's follower count matches the stored set, a one-node
+        query confirms the newest follower is unchanged (an unfollow plus a
+        follow keeps the count); otherwise pages are read newest first until
+        known ids.
+        """
+        if not self.GH_TOKEN:
+            return None
+
+        sync = FollowerSync(self._cache_path('followers.json'))
+
+        def fetch_page(cursor: Optional[str], first: int = 100) -> Optional[Dict[str, Any]]:
+            data = self._post_graphql(
+                FOLLOWERS_QUERY, {'login': self.username, 'cursor': cursor, 'first': first}, 'Followers'
+            )
+            return ((data or {}).get('user') or {}).get('followers')
+
+        if not sync.ids or len(sync) != follower_count or not sync.is_current(fetch_page(None, 1)):
+            changes = sync.sync(fetch_page, datetime.now(timezone.utc).date())
+            if changes is None:
+                self.log("⚠️ Follower sync failed; keeping the previous follower list", "WARNING")
+                return None
+            if not self.dry_run:
+                sync.save()
+            self.log(
+                f"✅ Follower sync: {len(changes['gained'])} new, "
+                f"{len(changes['lost'])} lost, {len(sync)} total"
+            )
+        return {'recent': sync.recent, 'lost': sync.lost}
+
+    def _get_star_growth(self) -> Optional[Dict[str, int]]:
+        """Return stars gained this week per repository.
+
+        Only repositories whose star count changed since the last run are
+        queried, ``stargazer_batch_size`` per aliased query and only from
+        their stored stargazer cursor onward. At most ``stargazer_max_repos``
+        are synced per run, and syncing stops while the GraphQL budget is
+        below ``graphql_rate_limit_reserve``. Returns None until every
+        changed repository has caught up, so a partial sum is never published.
+        """
+        if not self.GH_TOKEN or self._repo_star_counts is None:
+            return None
+
+        def fetch_batch(pages) -> Optional[List[Optional[Dict[str, Any]]]]:
+            if self._graphql_remaining is not None and self._graphql_remaining < self.graphql_rate_limit_reserve:
+                self.log(f"⚠️ GraphQL budget down to {self._graphql_remaining} points; pausing stargazer sync", "WARNING")
+                return None
+            variables = {}
+            for index, (owner, name, cursor) in enumerate(pages):
+                variables.update({f'owner{index}': owner, f'name{index}': name, f'cursor{index}': cursor})
+            data = self._post_graphql(stargazers_query(len(pages)), variables, 'Stargazers')
+            if data is None:
+                return None
+            return [(data.get(f'r{index}') or {}).get('stargazers') for index in range(len(pages))]
+
+        tracker = StargazerTracker(self._cache_path('stargazers.json'))
+        tracker.forget_missing(self._repo_star_counts)
+        changed = [
+            (full_name, count)
+            for full_name, count in self._repo_star_counts.items()
+            if tracker.needs_sync(full_name, count)
+        ]
+        new_stars = 0
+        synced = 0
+        for start in range(0, min(len(changed), self.stargazer_max_repos), self.stargazer_batch_size):
+            batch = dict(changed[start:min(start + self.stargazer_batch_size, self.stargazer_max_repos)])
+            result = tracker.sync_batch(batch, fetch_batch)
+            if result is None:
+                break
+            added, unfinished = result
+            new_stars += added
+            # Repositories still paging (or missing from the answer) count as deferred.
+            synced += len(batch) - len(unfinished)
+
+        today = datetime.now(timezone.utc).date()
+        tracker.prune(today)
+        if not self.dry_run:
+            tracker.save()
+        deferred = len(changed) - synced
+        self.log(
+            f"✅ Stargazers: {synced} repositories synced, {deferred} deferred, {new_stars} new stars"
+        )
+        if deferred:
+            return None
+        return tracker.gained(today)
     
     def _get_total_forks(self, headers: Dict[str, str]) -> Optional[int]:
         """Get total forks across all repositories"""
-        url = f'https://api.github.com/users/{self.username}/repos'
+        url = f'{self.github_api_url}/users/{self.username}/repos'
         total_forks = 0
         page = 1
         
         try:
             while True:
-                response = requests.get(f'{url}?page={page}&per_page=100', headers=headers, timeout=10)
+                response = self._request('GET', f'{url}?page={page}&per_page=100', headers=headers, timeout=10)
                 if response.status_code != 200:
                     self.log(
                         f"⚠️ Forks fetch failed with status {response.status_code}",
@@ -238,15 +784,30 @@ class DailyUpdater:
             
         return total_forks
 
+    def _cache_path(self, name: str) -> Optional[str]:
+        """Return the path of a cache file, or None when caching is disabled."""
+        if not self.cache_dir:
+            return None
+        return os.path.join(self.cache_dir, name)
+
     def _get_primary_languages(self, headers: Dict[str, str]) -> Dict[str, int]:
-        """Count primary languages across non-fork public repositories."""
-        url = f'https://api.github.com/users/{self.username}/repos'
-        languages: Dict[str, int] = {}
+        """Sum language bytes across non-fork public repositories.
+
+        Per-repository breakdowns come from ``/repos/{owner}/{repo}/languages``
+        and are cached keyed by ``pushed_at``, so only repositories pushed since
+        the previous run are queried again, concurrently.
+        """
+        url = f'{self.github_api_url}/users/{self.username}/repos'
+        cache_path = self._cache_path('languages.json')
+        cache = load_json(cache_path, {}) if cache_path else {}
+        cached_repos: Dict[str, Dict[str, Any]] = cache.get('repos', {})
+        repos: Optional[list] = []
         page = 1
 
         try:
             while True:
-                response = requests.get(
+                response = self._request(
+                    'GET',
                     f'{url}?page={page}&per_page=100&type=owner',
                     headers=headers,
                     timeout=10,
@@ -256,24 +817,101 @@ class DailyUpdater:
                         f"⚠️ Languages fetch failed with status {response.status_code}",
                         "WARNING",
                     )
+                    repos = None
                     break
 
-                repos = response.json()
-                if not repos:
+                page_repos = response.json()
+                if not page_repos:
                     break
 
-                for repo in repos:
-                    language = repo.get('language')
-                    if language and not repo.get('fork', False):
-                        languages[language] = languages.get(language, 0) + 1
+                repos.extend(repo for repo in page_repos if not repo.get('fork', False))
 
-                if len(repos) < 100:
+                if len(page_repos) < 100:
                     break
                 page += 1
         except requests.exceptions.RequestException as e:
             self.log(f"⚠️ Error fetching repository languages: {e}", "WARNING")
+            repos = None
 
-        return languages
+        if repos is None:
+            # Without a complete listing, the last known breakdowns are the best data.
+            self.log("ℹ️ Using cached language breakdowns", "INFO")
+            return self._sum_language_bytes(cached_repos.values())
+
+        stale = [
+            repo for repo in repos
+            if cached_repos.get(repo.get('full_name', ''), {}).get('pushed_at') != repo.get('pushed_at')
+        ]
+        if stale:
+            workers = min(self.language_fetch_workers, len(stale))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                fetched = list(executor.map(
+                    lambda repo: self._fetch_repo_languages(repo.get('full_name', ''), headers),
+                    stale,
+                ))
+        else:
+            fetched = []
+
+        refreshed = {}
+        for repo, languages in zip(stale, fetched):
+            if languages is not None:
+                refreshed[repo['full_name']] = {
+                    'pushed_at': repo.get('pushed_at'),
+                    'languages': languages,
+                }
+
+        entries: Dict[str, Dict[str, Any]] = {}
+        for repo in repos:
+            name = repo.get('full_name', '')
+            entry = refreshed.get(name) or cached_repos.get(name)
+            if entry is not None:
+                # Listing fields ride along so the top-repositories card needs no extra calls.
+                entries[name] = dict(
+                    entry,
+                    stars=repo.get('stargazers_count', 0),
+                    description=repo.get('description') or '',
+                )
+
+        if self.tracer:
+            self.tracer.instant('languages', hits=len(entries) - len(refreshed), misses=len(refreshed))
+        self.log(
+            f"✅ Language breakdowns: {len(refreshed)} refreshed, "
+            f"{len(entries) - len(refreshed)} cached"
+        )
+        if cache_path and not self.dry_run:
+            save_json(cache_path, {'repos': entries})
+        self._repo_index = entries
+
+        return self._sum_language_bytes(entries.values())
+
+    def _fetch_repo_languages(self, full_name: str, headers: Dict[str, str]) -> Optional[Dict[str, int]]:
+        """Fetch the byte size of each language in a single repository."""
+        try:
+            response = self._request(
+                'GET',
+                f'{self.github_api_url}/repos/{full_name}/languages',
+                headers=headers,
+                timeout=10,
+            )
+            if response.status_code != 200:
+                self.log(
+                    f"⚠️ Languages fetch for {full_name} failed with status {response.status_code}",
+                    "WARNING",
+                )
+                return None
+            return {name: int(size) for name, size in response.json().items()}
+        except requests.exceptions.RequestException as e:
+            self.log(f"⚠️ Error fetching languages for {full_name}: {e}", "WARNING")
+            return None
+
+    @staticmethod
+    def _sum_language_bytes(entries) -> Dict[str, int]:
+        """Merge cached per-repository language breakdowns into byte totals."""
+        totals: Dict[str, int] = {}
+        for entry in entries:
+            for language, size in entry.get('languages', {}).items():
+                totals[language] = totals.get(language, 0) + size
+        return totals
 
     @staticmethod
     def _replace_stat_marker(content: str, marker: str, value: Any) -> str:
@@ -301,22 +939,22 @@ class DailyUpdater:
 
     @staticmethod
     def _build_languages_card(languages: Dict[str, int]) -> str:
-        """Build a self-hosted SVG card from repository primary-language counts."""
+        """Build a self-hosted SVG card from per-language byte totals."""
         palette = ['#7CF6D2', '#FFD166', '#7C8CFF', '#FF6B6B', '#22C55E']
         top_languages = sorted(languages.items(), key=lambda item: (-item[1], item[0]))[:5]
-        total = sum(count for _, count in top_languages) or 1
+        total = sum(languages.values()) or 1
         rows = []
 
-        for index, (language, count) in enumerate(top_languages):
+        for index, (language, size) in enumerate(top_languages):
             y = 62 + index * 25
-            width = max(6, round(250 * count / total))
+            width = max(6, round(250 * size / total))
             color = palette[index]
             rows.extend([
                 f'  <circle cx="22" cy="{y - 4}" r="5" fill="{color}"/>',
                 f'  <text x="34" y="{y}" class="label">{escape(language)}</text>',
                 f'  <rect x="180" y="{y - 12}" width="250" height="9" rx="4.5" fill="#1F2937"/>',
                 f'  <rect x="180" y="{y - 12}" width="{width}" height="9" rx="4.5" fill="{color}"/>',
-                f'  <text x="450" y="{y}" text-anchor="end" class="count">{count} repos</text>',
+                f'  <text x="475" y="{y}" text-anchor="end" class="count">{100 * size / total:.1f}%</text>',
             ])
 
         if not top_languages:
@@ -325,12 +963,12 @@ class DailyUpdater:
         return '\n'.join([
             '<svg xmlns="http://www.w3.org/2000/svg" width="495" height="195" viewBox="0 0 495 195" role="img" aria-labelledby="title desc">',
             '  <title id="title">Most used languages</title>',
-            '  <desc id="desc">Top primary languages across public, non-fork repositories.</desc>',
+            '  <desc id="desc">Top languages by bytes of code across public, non-fork repositories.</desc>',
             '  <style>.title{font:600 17px Segoe UI,Ubuntu,sans-serif;fill:#7CF6D2}.label{font:13px Segoe UI,Ubuntu,sans-serif;fill:#FFFFFF}.count{font:12px Segoe UI,Ubuntu,sans-serif;fill:#AAB2C0}.note{font:11px Segoe UI,Ubuntu,sans-serif;fill:#7D8590}</style>',
             '  <rect width="494" height="194" x=".5" y=".5" rx="8" fill="#0D1117" stroke="#30363D"/>',
             '  <text x="22" y="31" class="title">Most Used Languages</text>',
             *rows,
-            '  <text x="22" y="183" class="note">By primary language across public, non-fork repositories</text>',
+            '  <text x="22" y="183" class="note">By bytes of code across public, non-fork repositories</text>',
             '</svg>',
             '',
         ])
@@ -342,6 +980,77 @@ class DailyUpdater:
         asset_path.write_text(self._build_languages_card(languages), encoding='utf-8')
         self.log(f"✅ Updated language card: {asset_path}")
     
+    @staticmethod
+    def _rank_repositories(repos: Dict[str, Dict[str, Any]], count: int) -> list:
+        """Pick the top repositories by stars, most recently pushed first on ties."""
+        top = heapq.nlargest(
+            count,
+            repos.items(),
+            key=lambda item: (item[1].get('stars', 0), item[1].get('pushed_at') or '', item[0]),
+        )
+        return [
+            {
+                'name': full_name.split('/')[-1],
+                'stars': entry.get('stars', 0),
+                'description': entry.get('description', ''),
+                'pushed': (entry.get('pushed_at') or '')[:10],
+            }
+            for full_name, entry in top
+        ]
+
+    @staticmethod
+    def _build_top_repos_card(ranking: list) -> str:
+        """Build a self-hosted SVG card listing featured repositories."""
+        rows = []
+        for index, repo in enumerate(ranking):
+            y = 62 + index * 25
+            description = repo['description']
+            if len(description) > 40:
+                description = description[:39].rstrip() + '…'
+            rows.extend([
+                f'  <text x="22" y="{y}" class="label">{escape(repo["name"])}</text>',
+                f'  <text x="180" y="{y}" class="note">{escape(description)}</text>',
+                f'  <text x="475" y="{y}" text-anchor="end" class="count">★ {repo["stars"]}</text>',
+            ])
+
+        if not ranking:
+            rows.append('  <text x="22" y="92" class="label">Repository data is temporarily unavailable.</text>')
+
+        return '\n'.join([
+            '<svg xmlns="http://www.w3.org/2000/svg" width="495" height="195" viewBox="0 0 495 195" role="img" aria-labelledby="title desc">',
+            '  <title id="title">Featured repositories</title>',
+            '  <desc id="desc">Top public, non-fork repositories by stars and recent activity.</desc>',
+            '  <style>.title{font:600 17px Segoe UI,Ubuntu,sans-serif;fill:#7CF6D2}.label{font:13px Segoe UI,Ubuntu,sans-serif;fill:#FFFFFF}.count{font:12px Segoe UI,Ubuntu,sans-serif;fill:#FFD166}.note{font:11px Segoe UI,Ubuntu,sans-serif;fill:#7D8590}</style>',
+            '  <rect width="494" height="194" x=".5" y=".5" rx="8" fill="#0D1117" stroke="#30363D"/>',
+            '  <text x="22" y="31" class="title">Featured Repositories</text>',
+            *rows,
+            '  <text x="22" y="183" class="note">By stars, then most recent push</text>',
+            '</svg>',
+            '',
+        ])
+
+    def _write_top_repos_card(self) -> None:
+        """Write the featured repositories card unless the ranking is unchanged."""
+        repos = self._repo_index
+        if repos is None:
+            cache_path = self._cache_path('languages.json')
+            repos = load_json(cache_path, {}).get('repos', {}) if cache_path else {}
+        if not repos:
+            return
+
+        ranking = self._rank_repositories(repos, self.top_repos_count)
+        digest = hashlib.sha256(json.dumps(ranking, sort_keys=True).encode('utf-8')).hexdigest()
+        asset_path = Path(self.readme_file).resolve().parent / 'assets' / 'github-top-repos.svg'
+        state_path = self._cache_path('top_repos.json')
+        if state_path and asset_path.exists() and load_json(state_path, {}).get('ranking') == digest:
+            return
+
+        asset_path.parent.mkdir(parents=True, exist_ok=True)
+        asset_path.write_text(self._build_top_repos_card(ranking), encoding='utf-8')
+        if state_path:
+            save_json(state_path, {'ranking': digest})
+        self.log(f"✅ Updated top repositories card: {asset_path}")
+
     def _get_profile_views(self) -> str:
         """Get profile views badge using komarev service"""
         try:
@@ -352,7 +1061,18 @@ class DailyUpdater:
             return "https://img.shields.io/badge/👀_Profile_Views-650+-0e75b6?style=for-the-badge&labelColor=1a1a2e"  # Fallback
     
     def _get_current_streak(self) -> str:
-        """Get current streak from GitHub using GraphQL API or streak stats service"""
+        """Get current streak from GitHub using GraphQL API or the contributions calendar"""
+        # Nothing new upstream, or no budget left: roll the cached calendar forward to today.
+        if self.deadline is not None and not self.deadline.allows('current_streak'):
+            self._note_degraded('current_streak')
+            streak = self._get_streak_from_calendar_cache()
+            return f"{streak}_Days" if streak is not None else None
+        if self.activity_unchanged:
+            streak = self._get_streak_from_calendar_cache(settled_only=True)
+            if streak is not None:
+                self.log(f"✅ Current streak from cached calendar: {streak} days")
+                return f"{streak}_Days"
+
         # Try GitHub GraphQL API first if token is available
         if self.GH_TOKEN:
             try:
@@ -363,50 +1083,126 @@ class DailyUpdater:
             except Exception as e:
                 self.log(f"⚠️ GitHub GraphQL API streak fetch failed: {e}", "WARNING")
         
-        # Fallback to streak stats service
-        try:
-            # Try alternative endpoint first (vercel deployment)
-            streak_urls = [
-                f"https://streak-stats.demolab.com/?user={self.username}&theme=tokyonight&hide_border=true&background=0D1117&stroke=F85D7F&ring=F85D7F&fire=F8D866&currStreakLabel=FFFFFF",
-                f"https://github-readme-streak-stats.herokuapp.com/?user={self.username}&theme=tokyonight&hide_border=true&background=0D1117&stroke=F85D7F&ring=F85D7F&fire=F8D866&currStreakLabel=FFFFFF"
-            ]
-            
-            for streak_url in streak_urls:
-                try:
-                    response = requests.get(streak_url, timeout=15)
-                    if response.status_code == 200:
-                        svg_content = response.text
-                        # Parse current streak from SVG - try multiple patterns
-                        # The actual number appears after the "Current Streak" label in a separate text element
-                        patterns = [
-                            r'Current Streak.*?<text[^>]*>(\d+)</text>',
-                            r'animation: currstreak[^>]*>\s*(\d+)\s*</text>',
-                            r'<text[^>]*>Current Streak</text>.*?<text[^>]*>(\d+)</text>',
-                            r'Current Streak</text><text[^>]*>(\d+)</text>',
-                        ]
-                        
-                        for pattern in patterns:
-                            current_streak_match = re.search(pattern, svg_content, re.IGNORECASE | re.DOTALL)
-                            if current_streak_match:
-                                streak_days = current_streak_match.group(1)
-                                self.log(f"✅ Fetched current streak: {streak_days} days")
-                                return f"{streak_days}_Days"
-                except:
-                    continue
-                    
-        except requests.exceptions.Timeout:
-            self.log("⚠️ Streak stats fetch timed out", "WARNING")
-        except requests.exceptions.RequestException as e:
-            self.log(f"⚠️ Error fetching streak stats: {e}", "WARNING")
-        except Exception as e:
-            self.log(f"⚠️ Unexpected error fetching streak: {e}", "WARNING")
-        
+        # Fallback to GitHub's own contributions calendar fragment
+        streak = self._get_streak_from_contributions_page()
+        if streak is not None:
+            self.log(f"✅ Fetched current streak from contributions calendar: {streak} days")
+            return f"{streak}_Days"
+
         # If all methods fail, preserve existing value by returning None
         self.log("ℹ️ Unable to fetch streak, preserving existing value", "INFO")
         return None  # Signal to preserve existing value
     
-    def _get_streak_from_github_api(self) -> int:
-        """Get the full current contribution streak using yearly GraphQL windows."""
+    def _calendar_path(self) -> Optional[str]:
+        """Return this user's binary calendar file path."""
+        return self._cache_path(os.path.join('calendars', f'{self.username}.bin'))
+
+    def _calendar_store(self) -> CalendarStore:
+        """Open the cached contribution calendar."""
+        return CalendarStore(
+            self._calendar_path(),
+            self.username,
+            self.user_id,
+            legacy_path=self._cache_path('calendar.json'),
+        )
+
+    def _get_streak_from_calendar_cache(self, settled_only: bool = False) -> Optional[int]:
+        """Compute the streak from cached days, or None when nothing is cached.
+
+        The binary calendar is memory-mapped and only its tail is read. With
+        ``settled_only`` a cache that cannot be rolled forward safely (see
+        ``_calendar_tail_settled``) also returns None.
+        """
+        today = datetime.now(timezone.utc).date()
+        path = self._calendar_path()
+        if path and os.path.exists(path):
+            try:
+                with CalendarFile(path) as calendar_file:
+                    if calendar_file.day_count:
+                        if settled_only and not self._calendar_tail_settled(calendar_file.tail(1), today):
+                            return None
+                        return calendar_file.current_streak(today)
+            except (OSError, ValueError) as e:
+                self.log(f"⚠️ Unable to read calendar file: {e}", "WARNING")
+
+        calendar = self._calendar_store()
+        if not calendar.series:
+            return None
+        if settled_only and not self._calendar_tail_settled(calendar.series, today):
+            return None
+        return calendar.current_streak(today)
+
+    @staticmethod
+    def _calendar_tail_settled(series, today) -> bool:
+        """Whether the cached calendar's newest day can stand for the days since.
+
+        The previous run saw its last day while it was still in progress, so
+        a zero there may not be final, and a cache ending before yesterday
+        leaves days nobody has counted.
+        """
+        last = series.last_date
+        if last is None or last < today - timedelta(days=1):
+            return False
+        return last == today or series.get(last) > 0
+
+    def _get_streak_from_contributions_page(self) -> Optional[int]:
+        """Compute the streak from the public ``users/{user}/contributions`` fragment.
+
+        Needs no token: the page is streamed through a single-pass parser and
+        merged into the same calendar store the GraphQL path fills.
+        """
+        url = f'{self.github_web_url}/users/{self.username}/contributions'
+        try:
+            response = self._request('GET', url, headers={'Accept': 'text/html'}, timeout=15, stream=True)
+            if response.status_code != 200:
+                self.log(f"⚠️ Contributions calendar returned status {response.status_code}", "WARNING")
+                return None
+            response.encoding = response.encoding or 'utf-8'
+            with self._span('contributions_page', 'parse'):
+                days = parse_contributions_html(response.iter_content(chunk_size=16384, decode_unicode=True))
+        except requests.exceptions.RequestException as e:
+            self.log(f"⚠️ Error fetching contributions calendar: {e}", "WARNING")
+            return None
+
+        if not days:
+            self.log("⚠️ No day cells found in contributions calendar", "WARNING")
+            return None
+
+        calendar_store = self._calendar_store()
+        calendar_store.merge(days)
+        self._save_calendar(calendar_store)
+        today = datetime.now(timezone.utc).date()
+        streak = calendar_store.current_streak(today)
+
+        # The page covers about a year; a streak reaching its first day may be
+        # longer, and only earlier cached days can tell.
+        first_day = min(datetime.strptime(day['date'], '%Y-%m-%d').date() for day in days)
+        end = today if calendar_store.series.get(today) else today - timedelta(days=1)
+        if streak and end - timedelta(days=streak - 1) <= first_day and calendar_store.series.epoch >= first_day:
+            self.log("⚠️ Streak spans the whole contributions calendar; its full length is unknown", "WARNING")
+            return None
+        return streak
+
+    def _save_calendar(self, calendar: CalendarStore) -> None:
+        """Persist fetched calendar days and advance the streak history."""
+        history_path = self._cache_path('streak_history.json')
+        self.streak_history = StreakHistory.load(history_path).sync(calendar.series)
+        if not self.dry_run:
+            calendar.save()
+            self.streak_history.save(history_path)
+
+    def _backfill_streak_history(self) -> Optional[StreakHistory]:
+        """Return a streak history reaching back to the account's first year.
+
+        Streak fetches stop at the first break, so the history they build
+        misses older streaks. The first call downloads one calendar year per
+        GraphQL query from the account's creation year; later runs find the
+        history marked backfilled. Returns None when that is not possible.
+        """
+        history_path = self._cache_path('streak_history.json')
+        history = self.streak_history or StreakHistory.load(history_path)
+        if history.backfilled:
+            return history
         if not self.GH_TOKEN:
             return None
 
@@ -414,29 +1210,73 @@ class DailyUpdater:
             'Authorization': f'bearer {self.GH_TOKEN}',
             'Content-Type': 'application/json',
         }
-        query = """
-        query($username: String!, $from: DateTime!, $to: DateTime!) {
-          user(login: $username) {
-            contributionsCollection(from: $from, to: $to) {
-              contributionCalendar {
-                weeks {
-                  contributionDays {
-                    contributionCount
-                    date
-                  }
+        url = f'{self.github_api_url}/graphql'
+        today = datetime.now(timezone.utc).date()
+        calendar_store = self._calendar_store()
+        try:
+            response = self._request(
+                'POST', url,
+                json={'query': ACCOUNT_CREATED_QUERY, 'variables': {'username': self.username}},
+                headers=headers,
+                timeout=20,
+            )
+            data = response.json().get('data') if response.status_code == 200 else None
+            created_at = ((data or {}).get('user') or {}).get('createdAt')
+            if not created_at:
+                self.log(f"⚠️ Account creation date unavailable (status {response.status_code})", "WARNING")
+                return None
+            for year in range(int(created_at[:4]), today.year + 1):
+                variables = {
+                    'username': self.username,
+                    'from': f'{year}-01-01T00:00:00Z',
+                    'to': f'{min(today, datetime(year, 12, 31).date()).isoformat()}T23:59:59Z',
                 }
-              }
-            }
-          }
-        }
-        """
+                response = self._request(
+                    'POST', url,
+                    json={'query': CONTRIBUTION_DAYS_QUERY, 'variables': variables},
+                    headers=headers,
+                    timeout=20,
+                )
+                data = response.json().get('data') if response.status_code == 200 else None
+                weeks = (
+                    ((data or {}).get('user') or {})
+                    .get('contributionsCollection', {})
+                    .get('contributionCalendar', {})
+                    .get('weeks')
+                )
+                if not weeks:
+                    self.log(f"⚠️ Contribution calendar for {year} unavailable (status {response.status_code})", "WARNING")
+                    return None
+                calendar_store.merge(day for week in weeks for day in week.get('contributionDays', []))
+        except (requests.exceptions.RequestException, ValueError) as e:
+            self.log(f"⚠️ Streak history backfill failed: {e}", "WARNING")
+            return None
 
+        history = StreakHistory.from_series(calendar_store.series)
+        history.backfilled = True
+        self.streak_history = history
+        if not self.dry_run:
+            calendar_store.save()
+            history.save(history_path)
+        self.log(f"✅ Backfilled streak history from {created_at[:4]}")
+        return history
+
+    def _get_streak_from_github_api(self) -> int:
+        """Get the full current contribution streak using yearly GraphQL windows."""
+        if not self.GH_TOKEN:
+            return None
+
+        headers = {
+            'Authorization': f'bearer {self.GH_TOKEN}',
+            'Content-Type': 'application/json',
+        }
         try:
             today = datetime.now(timezone.utc).date()
             today_str = today.isoformat()
             window_end = today
             current_streak = 0
-            first_day_checked = False
+            calendar_store = self._calendar_store()
+            series = calendar_store.series
 
             # GitHub limits contributionsCollection to roughly one year.
             # Continue backwards until the first zero-contribution day.
@@ -451,9 +1291,10 @@ class DailyUpdater:
                     f"🔍 Querying contribution window {window_number}: "
                     f"{window_start} to {window_end}"
                 )
-                response = requests.post(
-                    'https://api.github.com/graphql',
-                    json={'query': query, 'variables': variables},
+                response = self._request(
+                    'POST',
+                    f'{self.github_api_url}/graphql',
+                    json={'query': CONTRIBUTION_DAYS_QUERY, 'variables': variables},
                     headers=headers,
                     timeout=20,
                 )
@@ -478,50 +1319,44 @@ class DailyUpdater:
                     self.log("⚠️ No contribution weeks data available", "WARNING")
                     return None
 
-                days_by_date = {}
-                for week in weeks:
-                    for day in week.get('contributionDays', []):
-                        date = day.get('date', '')
-                        if window_start.isoformat() <= date <= window_end.isoformat():
-                            days_by_date[date] = day
-
-                days = sorted(
-                    days_by_date.values(),
-                    key=lambda item: item.get('date', ''),
-                    reverse=True,
-                )
+                window_start_str = window_start.isoformat()
+                window_end_str = window_end.isoformat()
+                days = [
+                    day
+                    for week in weeks
+                    for day in week.get('contributionDays', [])
+                    if window_start_str <= day.get('date', '') <= window_end_str
+                ]
                 if not days:
                     self.log("⚠️ No contribution days data available", "WARNING")
                     return None
+                received_days = len({day.get('date') for day in days})
                 expected_days = (window_end - window_start).days + 1
-                if len(days) != expected_days:
+                if received_days != expected_days:
                     self.log(
                         f"⚠️ Incomplete contribution window: expected {expected_days} "
-                        f"days, received {len(days)}",
+                        f"days, received {received_days}",
                         "WARNING",
                     )
                     return None
+                series.merge(days)
 
-                if window_number == 1:
-                    self.log("Recent contributions:")
-                    for day in days[:7]:
-                        self.log(
-                            f"  {day.get('date', 'Unknown')}: "
-                            f"{day.get('contributionCount', 0)} contribution(s)"
-                        )
+                # Per-day detail is DEBUG-only; skip building the lines otherwise.
+                if window_number == 1 and self._debug_enabled():
+                    self.log("Recent contributions:", "DEBUG")
+                    for offset in range(7):
+                        day = today - timedelta(days=offset)
+                        self.log(f"  {day.isoformat()}: {series.get(day)} contribution(s)", "DEBUG")
+                if window_number == 1 and series.get(today) == 0:
+                    self.log(f"ℹ️ Skipping today ({today_str}) with 0 contributions")
 
-                for day in days:
-                    date = day.get('date', '')
-                    count = day.get('contributionCount', 0)
-                    if not first_day_checked:
-                        first_day_checked = True
-                        if date == today_str and count == 0:
-                            self.log(f"ℹ️ Skipping today ({today_str}) with 0 contributions")
-                            continue
-                    if count <= 0:
-                        self.log(f"🔥 Current streak calculated: {current_streak} days")
-                        return current_streak
-                    current_streak += 1
+                # The streak is final once it breaks inside the fetched window.
+                current_streak = series.current_streak(today)
+                last_day = today if series.get(today) else today - timedelta(days=1)
+                if last_day - timedelta(days=current_streak - 1) > window_start:
+                    self.log(f"🔥 Current streak calculated: {current_streak} days")
+                    self._save_calendar(calendar_store)
+                    return current_streak
 
                 self.log(
                     f"ℹ️ Streak exceeds {current_streak} days; querying the prior window"
@@ -529,6 +1364,7 @@ class DailyUpdater:
                 window_end = window_start - timedelta(days=1)
 
             self.log("⚠️ Streak exceeds the 10-year safety limit", "WARNING")
+            self._save_calendar(calendar_store)
             return current_streak
 
         except requests.exceptions.RequestException as e:
@@ -556,6 +1392,8 @@ class DailyUpdater:
         - If `WAKATIME_API_KEY` is not configured, return a helpful setup message
         - If the API returns no data, return a friendly 'No activity' message
         - Otherwise render a compact weekly summary in a fenced text block
+        - Closed days come from the per-day cache; only the newest
+          `wakatime_refresh_days` days are downloaded again
         """
         from datetime import timedelta
 
@@ -573,30 +1411,45 @@ class DailyUpdater:
         from datetime import timezone
         end_date = datetime.now(timezone.utc).date()
         start_date = end_date - timedelta(days=7)
-        url = (
-            f"{self.wakatime_api_base}/users/current/summaries?start={start_date.isoformat()}&end={end_date.isoformat()}"
-        )
+        cache = WakaTimeDayCache(self._cache_path('wakatime_days.json'))
+        fetch_start = cache.first_stale_day(start_date, end_date, self.wakatime_refresh_days)
+        if fetch_start is not None and self.deadline is not None and not self.deadline.allows('wakatime'):
+            self._note_degraded('wakatime')
+            fetch_start = None  # Render the cached days without refreshing them
         try:
-            response = requests.get(url, headers=headers, timeout=15)
-            if response.status_code in (401, 403):
-                self.log("⚠️ WakaTime authentication/permission failed", "WARNING")
-                return (
-                    '<div align="center">\n'
-                    '  <img src="https://img.shields.io/badge/Status-Pending%20API%20Key%20Configuration-yellow?style=for-the-badge&logo=wakatime&logoColor=white"/>\n'
-                    '</div>\n\n'
-                    '> Add or refresh repo secret `WAKATIME_API_KEY`, then re-run the workflow.'
-                )
-            if response.status_code != 200:
-                self.log(f"⚠️ WakaTime API error: {response.status_code}", "WARNING")
-                return (
-                    '<div align="center">\n'
-                    '  <img src="https://img.shields.io/badge/WakaTime-API%20Unavailable-lightgrey?style=for-the-badge&logo=wakatime&logoColor=white"/>\n'
-                    '</div>'
+            # Closed days come from the cache; only stale days are downloaded.
+            if fetch_start is not None:
+                url = (
+                    f"{self.wakatime_api_base}/users/current/summaries?start={fetch_start.isoformat()}&end={end_date.isoformat()}"
                 )
+                response = self._request('GET', url, headers=headers, timeout=15)
+                if response.status_code in (401, 403):
+                    self.log("⚠️ WakaTime authentication/permission failed", "WARNING")
+                    return (
+                        '<div align="center">\n'
+                        '  <img src="https://img.shields.io/badge/Status-Pending%20API%20Key%20Configuration-yellow?style=for-the-badge&logo=wakatime&logoColor=white"/>\n'
+                        '</div>\n\n'
+                        '> Add or refresh repo secret `WAKATIME_API_KEY`, then re-run the workflow.'
+                    )
+                if response.status_code != 200:
+                    self.log(f"⚠️ WakaTime API error: {response.status_code}", "WARNING")
+                    self._note_fallback('wakatime')
+                    return (
+                        '<div align="center">\n'
+                        '  <img src="https://img.shields.io/badge/WakaTime-API%20Unavailable-lightgrey?style=for-the-badge&logo=wakatime&logoColor=white"/>\n'
+                        '</div>'
+                    )
+
+                payload = response.json()
+                cache.store(payload.get("data", []))
+                if self.wakatime_hourly:
+                    self._sync_wakatime_hours(headers, cache, fetch_start, end_date)
+                if not self.dry_run:
+                    cache.save()
+                self.log(f"✅ Synced WakaTime days {fetch_start} to {end_date}")
 
-            payload = response.json()
-            data = payload.get("data", [])
-            if not data:
+            self._wakatime_days = cache
+            if not cache.window(start_date, end_date):
                 self.log("ℹ️ WakaTime returned no data for the selected period")
                 return (
                     "```text\n"
@@ -606,28 +1459,10 @@ class DailyUpdater:
                     "```"
                 )
 
-            # Aggregate totals across the period
-            total_seconds = 0
-            language_totals: Dict[str, int] = {}
-            editor_totals: Dict[str, int] = {}
-            for day in data:
-                day_total = day.get("grand_total", {}).get("total_seconds", 0) or 0
-                total_seconds += int(day_total)
-                for lang in day.get("languages", [])[:8]:  # top languages per day
-                    name = lang.get("name", "Other")
-                    secs = int(lang.get("total_seconds", 0) or 0)
-                    language_totals[name] = language_totals.get(name, 0) + secs
-                for ed in day.get("editors", [])[:5]:
-                    name = ed.get("name", "Editor")
-                    secs = int(ed.get("total_seconds", 0) or 0)
-                    editor_totals[name] = editor_totals.get(name, 0) + secs
-
-            total_minutes = total_seconds // 60
-            total_text = self._format_minutes(total_minutes)
-
-            # Sort languages by time desc, take top 5
-            top_languages = sorted(language_totals.items(), key=lambda x: x[1], reverse=True)[:5]
-            top_editors = sorted(editor_totals.items(), key=lambda x: x[1], reverse=True)[:3]
+            # Aggregate every language and editor across the period
+            period_days = (end_date - start_date).days + 1
+            week = WakaTimeAnalytics(cache.days, end_date, span=period_days).window(period_days)
+            total_text = self._format_minutes(week['total_seconds'] // 60)
 
             lines = [
                 "```text",
@@ -637,17 +1472,15 @@ class DailyUpdater:
                 "",
             ]
 
-            if top_languages:
-                lines.append("Languages:")
-                for name, secs in top_languages:
-                    lines.append(f"  {name:<18} {self._format_minutes(secs // 60)}")
-                lines.append("")
-
-            if top_editors:
-                lines.append("Editors:")
-                for name, secs in top_editors:
-                    lines.append(f"  {name:<18} {self._format_minutes(secs // 60)}")
-                lines.append("")
+            for title, category, limit in (
+                ("Languages:", "languages", 5),
+                ("Editors:", "editors", 3),
+            ):
+                if week[category]:
+                    lines.append(title)
+                    for name, secs in week[category][:limit]:
+                        lines.append(f"  {name:<18} {self._format_minutes(secs // 60)}")
+                    lines.append("")
 
             lines.append("```")
             block = "\n".join(lines)
@@ -656,6 +1489,7 @@ class DailyUpdater:
 
         except requests.exceptions.Timeout:
             self.log("⚠️ WakaTime API request timed out", "WARNING")
+            self._note_fallback('wakatime')
             return (
                 '<div align="center">\n'
                 '  <img src="https://img.shields.io/badge/WakaTime-Time%20Out-lightgrey?style=for-the-badge&logo=wakatime&logoColor=white"/>\n'
@@ -663,12 +1497,97 @@ class DailyUpdater:
             )
         except Exception as e:
             self.log(f"❌ Unexpected WakaTime error: {e}", "ERROR")
+            self._note_fallback('wakatime')
             return (
                 '<div align="center">\n'
                 '  <img src="https://img.shields.io/badge/WakaTime-Error-red?style=for-the-badge&logo=wakatime&logoColor=white"/>\n'
                 '</div>'
             )
 
+    def _sync_wakatime_hours(self, headers: Dict[str, str], cache: WakaTimeDayCache, start_date, end_date) -> None:
+        """Fetch ``durations`` for the stale days so the hour heatmap stays current."""
+        response = self._request('GET', f"{self.wakatime_api_base}/users/current", headers=headers, timeout=15)
+        if response.status_code == 200:
+            cache.set_timezone((response.json().get("data") or {}).get("timezone"))
+        current = start_date
+        while current <= end_date:
+            response = self._request(
+                'GET',
+                f"{self.wakatime_api_base}/users/current/durations?date={current.isoformat()}",
+                headers=headers,
+                timeout=15,
+            )
+            if response.status_code != 200:
+                self.log(f"⚠️ WakaTime durations for {current} failed with status {response.status_code}", "WARNING")
+                return
+            cache.store_durations(current.isoformat(), response.json().get("data", []))
+            current += timedelta(days=1)
+
+    def _write_wakatime_heatmaps(self) -> None:
+        """Render WakaTime heatmaps from the local day cache; no API calls."""
+        cache = self._wakatime_days or WakaTimeDayCache(self._cache_path('wakatime_days.json'))
+        if not cache.days:
+            return
+
+        assets_dir = Path(self.readme_file).resolve().parent / 'assets'
+        cards = {'wakatime-heatmap.svg': build_year_heatmap(cache.days, datetime.now(timezone.utc).date())}
+        if any(day.get('hours') for day in cache.days.values()):
+            cards['wakatime-hours.svg'] = build_hour_heatmap(cache.days, cache.timezone)
+
+        for name, svg in cards.items():
+            asset_path = assets_dir / name
+            if asset_path.exists() and asset_path.read_text(encoding='utf-8') == svg:
+                continue
+            asset_path.parent.mkdir(parents=True, exist_ok=True)
+            asset_path.write_text(svg, encoding='utf-8')
+            self.log(f"✅ Updated WakaTime heatmap: {asset_path}")
+
+    def get_wakatime_windows_block(self) -> str:
+        """Render 7/30/90/365-day WakaTime leaderboards from the local day cache.
+
+        Windows reaching past the oldest cached day are labelled with the span
+        the cache covers, and windows covering the same span are shown once.
+        """
+        cache = self._wakatime_days or WakaTimeDayCache(self._cache_path('wakatime_days.json'))
+        end_date = datetime.now(timezone.utc).date()
+        windows = WakaTimeAnalytics(cache.days, end_date, span=max(DEFAULT_WINDOWS)).windows()
+
+        lines = ["```text"]
+        shown = set()
+        for window in windows.values():
+            covered = window['covered_days']
+            if covered in shown:
+                continue
+            shown.add(covered)
+            top = ", ".join(name for name, _ in window['languages'][:3]) or "No activity"
+            lines.append(
+                f"Last {covered:>3} days  {self._format_minutes(window['total_seconds'] // 60):<18} "
+                f"{self._format_minutes(window['daily_average'] // 60) + '/day':<16} {top}"
+            )
+        lines.append("```")
+        self.log("✅ Built WakaTime rolling-window block")
+        return "\n".join(lines)
+
+    def get_wakatime_projects_block(self) -> str:
+        """Render the weekly per-project breakdown from the local day cache.
+
+        Project names can be private repositories, so this only reaches the
+        README when ``WAKATIME_PUBLISH_PROJECTS=true``.
+        """
+        cache = self._wakatime_days or WakaTimeDayCache(self._cache_path('wakatime_days.json'))
+        end_date = datetime.now(timezone.utc).date()
+        period_days = 8  # Same span as the weekly WakaTime block
+        week = WakaTimeAnalytics(cache.days, end_date, span=period_days).window(period_days)
+
+        lines = ["```text"]
+        for name, secs in week['projects'][:5]:
+            lines.append(f"  {name:<18} {self._format_minutes(secs // 60)}")
+        if len(lines) == 1:
+            lines.append("No activity tracked")
+        lines.append("```")
+        self.log("✅ Built WakaTime projects block")
+        return "\n".join(lines)
+
     def update_readme_content(self, quote: Dict[str, str], stats: Dict[str, Any]) -> bool:
         """Update README.md with new content"""
         try:
@@ -708,41 +1627,52 @@ class DailyUpdater:
             if stats:
                 # Use the same fetched values in each badge and number so the
                 # dashboard cannot show two different snapshots.
-                followers_pattern = r'https://img\.shields\.io/(?:github/followers/Rayyan9477\?[^"]*|badge/Followers-[^"]*)'
                 followers_replacement = f'https://img.shields.io/badge/Followers-{stats["followers"]}-22c55e?style=flat-square&logo=github&logoColor=white'
-                if re.search(followers_pattern, content):
-                    content = re.sub(followers_pattern, followers_replacement, content)
+                if BADGE_PATTERNS['followers'].search(content):
+                    content = BADGE_PATTERNS['followers'].sub(followers_replacement, content)
                     self.log("✅ Updated followers badge")
                 
                 # Update stars only when every repository page was fetched.
                 if stats.get('total_stars') is not None:
-                    stars_pattern = r'https://img\.shields\.io/(?:github/stars/Rayyan9477\?[^"]*|badge/Total_Stars-[^"]*)'
                     stars_replacement = f'https://img.shields.io/badge/Total_Stars-{stats["total_stars"]}-FFC107?style=flat-square&logo=github&logoColor=white'
-                    if re.search(stars_pattern, content):
-                        content = re.sub(stars_pattern, stars_replacement, content)
+                    if BADGE_PATTERNS['stars'].search(content):
+                        content = BADGE_PATTERNS['stars'].sub(stars_replacement, content)
                         self.log("✅ Updated stars badge")
                 else:
+                    self._note_fallback('total_stars')
                     self.log("ℹ️ Preserving existing stars badge", "INFO")
                 
                 # Komarev remains the single visible source for profile views.
                 # A duplicated daily snapshot would inevitably drift from it.
-                profile_views_pattern = r'https://komarev\.com/ghpvc/\?username=Rayyan9477[^"]*'
                 profile_views_replacement = f'https://komarev.com/ghpvc/?username={self.username}&label=Profile%20Views&color=0e75b6&style=flat-square'
-                if re.search(profile_views_pattern, content):
-                    content = re.sub(profile_views_pattern, profile_views_replacement, content)
+                if BADGE_PATTERNS['profile_views'].search(content):
+                    content = BADGE_PATTERNS['profile_views'].sub(profile_views_replacement, content)
                     self.log("✅ Updated profile views badge")
                 
                 # Update current streak badge
-                current_streak = self._get_current_streak()
+                with self._span('current_streak', 'fetch'):
+                    current_streak = self._get_current_streak()
                 if current_streak:  # Only update if we successfully fetched the streak
+                    self.current_streak_days = int(current_streak.replace('_Days', ''))
                     # Update badge URL
-                    current_streak_badge_pattern = r'https://img\.shields\.io/badge/Current_Streak-[\d_]+Days-[^"]*'
                     current_streak_badge_replacement = f'https://img.shields.io/badge/Current_Streak-{current_streak}-F85D7F?style=flat-square&logo=github&logoColor=white'
-                    if re.search(current_streak_badge_pattern, content):
-                        content = re.sub(current_streak_badge_pattern, current_streak_badge_replacement, content)
+                    if BADGE_PATTERNS['current_streak'].search(content):
+                        content = BADGE_PATTERNS['current_streak'].sub(current_streak_badge_replacement, content)
                         self.log("✅ Updated current streak badge")
                 else:
+                    self._note_fallback('current_streak')
                     self.log("ℹ️ Preserving existing streak value", "INFO")
+
+                # Stargazer paging runs after the streak so it cannot spend the
+                # GraphQL budget the streak query needs.
+                if self.GH_TOKEN and self._repo_star_counts is not None:
+                    with self._span('stargazers', 'fetch'):
+                        star_growth = self._get_star_growth()
+                    if star_growth is not None:
+                        stats['star_growth'] = star_growth
+                        stats['stars_this_week'] = sum(star_growth.values())
+                    else:
+                        self._note_fallback('stars_this_week')
                 
                 # Update followers number
                 if 'followers' in stats:
@@ -774,12 +1704,41 @@ class DailyUpdater:
                         streak_num_pattern = r'(<b style="font-size: 32px; color: #F85D7F;">)[\d,]+(</b>)'
                         content = re.sub(streak_num_pattern, f'\\g<1>{current_streak.replace("_Days", "")}\\g<2>', content, count=1)
                     self.log(f"✅ Updated streak number: {current_streak}")
+
+                # Update stars gained this week (if the marker exists)
+                if stats.get('stars_this_week') is not None:
+                    if re.search(r'<!--STARS_THIS_WEEK-->.*?<!--/STARS_THIS_WEEK-->', content, re.DOTALL):
+                        content = self._replace_stat_marker(content, 'STARS_THIS_WEEK', stats['stars_this_week'])
+                        self.log(f"✅ Updated stars this week: {stats['stars_this_week']}")
+
+                # Update recent followers (if the marker exists)
+                if stats.get('recent_followers') and re.search(
+                    r'<!--RECENT_FOLLOWERS-->.*?<!--/RECENT_FOLLOWERS-->', content, re.DOTALL
+                ):
+                    followers_list = ', '.join(
+                        f'<a href="https://github.com/{escape(login)}">@{escape(login)}</a>'
+                        for login in stats['recent_followers']
+                    )
+                    content = self._replace_stat_marker(content, 'RECENT_FOLLOWERS', followers_list)
+                    self.log("✅ Updated recent followers")
+
+                # Update longest streak (if the marker exists)
+                if re.search(r'<!--LONGEST_STREAK-->.*?<!--/LONGEST_STREAK-->', content, re.DOTALL):
+                    history = self._backfill_streak_history()
+                    longest_streak = history.longest()[0] if history else 0
+                    if history is None:
+                        self.log("ℹ️ Streak history does not reach the first year yet, preserving longest streak")
+                        self._note_fallback('longest_streak')
+                    elif longest_streak:
+                        content = self._replace_stat_marker(content, 'LONGEST_STREAK', longest_streak)
+                        self.log(f"✅ Updated longest streak: {longest_streak}")
                 
                 self.log("✅ All dashboard numbers updated dynamically")
             
             # Update WakaTime section (if tags exist)
             if "<!--START_SECTION:waka-->" in content and "<!--END_SECTION:waka-->" in content:
-                waka_block = self.get_wakatime_block()
+                with self._span('wakatime', 'fetch'):
+                    waka_block = self.get_wakatime_block()
                 content = re.sub(
                     r"<!--START_SECTION:waka-->[\s\S]*?<!--END_SECTION:waka-->",
                     f"<!--START_SECTION:waka-->\n{waka_block}\n\n<!--END_SECTION:waka-->",
@@ -790,6 +1749,30 @@ class DailyUpdater:
             else:
                 self.log("ℹ️ WakaTime tags not found in README; skipping WakaTime update")
 
+            # Longer WakaTime windows reuse the cache synced above (if tags exist)
+            if "<!--START_SECTION:waka_windows-->" in content and "<!--END_SECTION:waka_windows-->" in content:
+                with self._span('wakatime_windows', 'render'):
+                    windows_block = self.get_wakatime_windows_block()
+                content = re.sub(
+                    r"<!--START_SECTION:waka_windows-->[\s\S]*?<!--END_SECTION:waka_windows-->",
+                    lambda _: f"<!--START_SECTION:waka_windows-->\n{windows_block}\n\n<!--END_SECTION:waka_windows-->",
+                    content,
+                )
+                self.log("✅ Updated WakaTime rolling-window section")
+
+            # Per-project time is opt-in (if tags exist), as project names may be private
+            if "<!--START_SECTION:waka_projects-->" in content and "<!--END_SECTION:waka_projects-->" in content:
+                if self.wakatime_publish_projects:
+                    projects_block = self.get_wakatime_projects_block()
+                    content = re.sub(
+                        r"<!--START_SECTION:waka_projects-->[\s\S]*?<!--END_SECTION:waka_projects-->",
+                        lambda _: f"<!--START_SECTION:waka_projects-->\n{projects_block}\n\n<!--END_SECTION:waka_projects-->",
+                        content,
+                    )
+                    self.log("✅ Updated WakaTime projects section")
+                else:
+                    self.log("ℹ️ WAKATIME_PUBLISH_PROJECTS not enabled; leaving the WakaTime projects section as is")
+
             # Update timestamps
             now = datetime.now(timezone.utc).strftime("%B %d, %Y at %I:%M %p UTC")
             
@@ -809,12 +1792,19 @@ class DailyUpdater:
                 self.log("ℹ️ Dry run enabled; skipping README write")
                 return True
 
-            if stats.get('languages'):
-                self._write_languages_card(stats['languages'])
+            with self._span('cards', 'write'):
+                if stats.get('languages'):
+                    self._write_languages_card(stats['languages'])
+                self._write_top_repos_card()
+
+            if self.wakatime_token:
+                with self._span('wakatime_heatmaps', 'render'):
+                    self._write_wakatime_heatmaps()
 
             # Write updated content
-            with open(self.readme_file, 'w', encoding='utf-8') as file:
-                file.write(content)
+            with self._span('readme', 'write', bytes=len(content.encode('utf-8'))):
+                with open(self.readme_file, 'w', encoding='utf-8') as file:
+                    file.write(content)
 
             self.log("✅ README content updated successfully")
             return True
@@ -892,24 +1882,59 @@ class DailyUpdater:
                     self.log("❌ README.md not found in any expected location", "ERROR")
                     return False
             
-            # Step 1: Get daily quote
-            quote = self.get_daily_quote()
-            
-            # Step 2: Get GitHub stats
-            stats = self.get_github_stats()
+            # Sections run in deadline priority order: GitHub stats, then the
+            # quote (which the README render needs up front), then the streak
+            # and WakaTime inside update_readme_content. The quote may only
+            # spend what the streak and WakaTime reserves leave over, so
+            # running it before them costs them no budget.
+
+            # Step 1: Get GitHub stats, reusing the last snapshot when the
+            # public events feed shows nothing new since the previous run.
+            with self._span('github_stats', 'fetch') as phase:
+                stats = None
+                if not self._check_public_activity():
+                    stats = self._load_stats_snapshot(max_age=self.stats_snapshot_max_age)
+                    if stats:
+                        self.activity_unchanged = True
+                        self.log("ℹ️ Reusing cached GitHub stats; only date-dependent sections refresh")
+                phase['cache'] = 'hit' if stats else 'miss'
+                fetched_stats = None
+                if not stats:
+                    stats = fetched_stats = self.get_github_stats()
+                if not stats and 'github_stats' in self.degraded:
+                    stats = self._load_stats_snapshot()
+                if not stats:
+                    self._note_fallback('github_stats')
+                self.published_stats = stats
+
+            # Step 2: Get daily quote
+            with self._span('quote', 'fetch'):
+                quote = self.get_daily_quote()
             
             # Step 3: Contribution snake is intentionally not used in the profile README.
             
             # Step 4: Update README content
-            if not self.update_readme_content(quote, stats):
+            with self._span('update_readme', 'render') as phase:
+                phase['status'] = 'ok' if self.update_readme_content(quote, stats) else 'failed'
+            if phase['status'] != 'ok':
                 self.log("❌ README update failed", "ERROR")
                 return False
+            with self._span('history', 'write'):
+                if fetched_stats:
+                    # Saved after the README so it includes the star growth.
+                    self._save_stats_snapshot(fetched_stats)
+                self._save_events_state()
+                self._record_stats_history(stats)
+            with self._span('trend_charts', 'render'):
+                self._write_trend_charts()
             
             # Step 5: Commit changes only when this script owns Git operations.
             if self.dry_run:
                 self.log("ℹ️ Dry run enabled; skipping git commit and push")
             elif self.push_changes_enabled:
-                if not self.commit_changes():
+                with self._span('commit', 'git') as phase:
+                    phase['status'] = 'ok' if self.commit_changes() else 'failed'
+                if phase['status'] != 'ok':
                     self.log("❌ Commit failed", "ERROR")
                     return False
             else:
@@ -917,19 +1942,51 @@ class DailyUpdater:
             
             # Step 6: Push changes (optional)
             if not self.dry_run and self.push_changes_enabled:
-                self.push_changes()
+                with self._span('push', 'git'):
+                    self.push_changes()
             
+            if self.deadline is not None:
+                self.log(
+                    f"⏱️ Run deadline: {self.deadline.elapsed():.1f}s of {self.deadline.budget:.0f}s used; "
+                    f"degraded: {', '.join(self.degraded) or 'none'}"
+                )
             self.log("🎉 Daily update completed successfully!")
+            self.run_succeeded = True
             return True
             
         except Exception as e:
             self.log(f"❌ Daily update failed: {e}", "ERROR")
             return False
+        finally:
+            if self.latency_book is not None and not self.dry_run:
+                self.latency_book.save()
+            if self.tracer:
+                self.tracer.write(self.trace_file)
+                self.log(f"🧭 Trace written to {self.trace_file}")
+                self._write_metrics()
 
 def main():
     """Main entry point"""
+    parser = argparse.ArgumentParser(description='Update the profile README with fresh stats.')
+    parser.add_argument(
+        '--profile',
+        action='store_true',
+        help='profile each run phase with cProfile and tracemalloc',
+    )
+    parser.add_argument(
+        '--profile-dir',
+        default=os.path.join(os.path.dirname(os.path.abspath(__file__)), 'profiles'),
+        help='directory for .pstats files and allocation reports (default: scripts/profiles)',
+    )
+    args = parser.parse_args()
+
     updater = DailyUpdater()
+    if args.profile:
+        updater.profiler = PhaseProfiler(args.profile_dir)
     success = updater.run_daily_update()
+    if updater.profiler is not None:
+        updater.log(f"🔬 Profile summary written to {updater.profiler.write_summary()}")
+    shutdown_logging()
     
     try:
         if success:
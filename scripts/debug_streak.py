@@ -4,58 +4,69 @@ Debug Streak Script - Fetch and display current GitHub streak
 """
 
 import os
-import re
 import requests
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+
+from calendar_file import CalendarFile
+from contribution_calendar import parse_contributions_html
+from daily_update import DailyUpdater
 
 def get_streak_from_api():
-    """Fetch current streak from GitHub Streak Stats API"""
+    """Fetch current streak from GitHub's public contributions calendar"""
     username = 'Rayyan9477'
-    
-    # Try both streak stats services
-    streak_urls = [
-        f"https://streak-stats.demolab.com/?user={username}&theme=tokyonight",
-        f"https://github-readme-streak-stats.herokuapp.com/?user={username}&theme=tokyonight"
-    ]
-    
-    for url in streak_urls:
-        print(f"\nTrying: {url}")
-        try:
-            response = requests.get(url, timeout=15)
-            if response.status_code == 200:
-                svg_content = response.text
-                print(f"✅ Got response from {url}")
-                
-                # Try multiple patterns to parse the streak
-                patterns = [
-                    (r'<text[^>]*>Current Streak</text>\s*<text[^>]*>(\d+)</text>', 'Pattern 1'),
-                    (r'Current Streak</text><text[^>]*>(\d+)</text>', 'Pattern 2'),
-                    (r'current-streak[^>]*>(\d+)<', 'Pattern 3'),
-                    (r'<text[^>]*data-testid="current-streak-count"[^>]*>(\d+)</text>', 'Pattern 4'),
-                    (r'<text[^>]*id="curr-streak-num"[^>]*>(\d+)</text>', 'Pattern 5')
-                ]
-                
-                for pattern, name in patterns:
-                    match = re.search(pattern, svg_content, re.IGNORECASE)
-                    if match:
-                        streak = match.group(1)
-                        print(f"✅ {name} matched: {streak} days")
-                        return streak
-                
-                # If no pattern matched, let's save the SVG for inspection
-                print("\n⚠️ No pattern matched. Saving SVG for inspection...")
-                with open('streak_debug.svg', 'w', encoding='utf-8') as f:
-                    f.write(svg_content)
-                print("Saved to streak_debug.svg")
-                
-                # Let's also print a snippet
-                print("\nSVG snippet (first 1000 chars):")
-                print(svg_content[:1000])
-                
-        except Exception as e:
-            print(f"❌ Error: {e}")
-            continue
-    
+    url = f"https://github.com/users/{username}/contributions"
+
+    print(f"\nTrying: {url}")
+    try:
+        response = requests.get(url, timeout=15, stream=True)
+        if response.status_code != 200:
+            print(f"❌ Contributions calendar returned status {response.status_code}")
+            return None
+
+        response.encoding = response.encoding or 'utf-8'
+        days = parse_contributions_html(response.iter_content(chunk_size=16384, decode_unicode=True))
+        print(f"✅ Parsed {len(days)} day cells from {url}")
+
+        if not days:
+            print("\n⚠️ No day cells found; the calendar markup may have changed")
+            return None
+
+        days.sort(key=lambda day: day['date'], reverse=True)
+        print("\nLast 10 days of contributions:")
+        for day in days[:10]:
+            print(f"  {day['date']}: {day['contributionCount']} contributions")
+
+        today_str = datetime.now(timezone.utc).date().isoformat()
+        streak = DailyUpdater._calculate_current_streak(days, today_str)
+        print(f"✅ Current streak: {streak} days")
+        return streak
+
+    except Exception as e:
+        print(f"❌ Error: {e}")
+
+    return None
+
+def get_streak_from_calendar_file():
+    """Read the current streak from the cached binary calendar without parsing it all"""
+    username = 'Rayyan9477'
+    cache_dir = os.getenv('PROFILE_CACHE_DIR') or os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cache')
+    path = os.path.join(cache_dir, 'calendars', f'{username}.bin')
+    if not os.path.exists(path):
+        print(f"\n⚠️ No cached calendar at {path}")
+        return None
+
+    try:
+        with CalendarFile(path) as calendar_file:
+            print(f"✅ {calendar_file.login}: {calendar_file.day_count} days since {calendar_file.epoch}")
+            tail = calendar_file.tail(10)
+            print("\nLast 10 cached days:")
+            for offset, count in enumerate(tail.counts):
+                print(f"  {tail.epoch + timedelta(days=offset)}: {count} contributions")
+            streak = calendar_file.current_streak(datetime.now(timezone.utc).date())
+            print(f"\n✅ Current streak: {streak} days")
+            return streak
+    except (OSError, ValueError) as e:
+        print(f"❌ Error: {e}")
     return None
 
 def get_streak_from_graphql():
@@ -162,15 +173,20 @@ if __name__ == "__main__":
     print("GitHub Streak Debug Tool")
     print("=" * 60)
     
-    print("\n1. Fetching from Streak Stats API...")
+    print("\n1. Fetching from GitHub contributions calendar...")
     api_streak = get_streak_from_api()
     
     print("\n" + "=" * 60)
     print("\n2. Fetching from GitHub GraphQL API...")
     graphql_streak = get_streak_from_graphql()
     
+    print("\n" + "=" * 60)
+    print("\n3. Reading cached calendar file...")
+    cached_streak = get_streak_from_calendar_file()
+
     print("\n" + "=" * 60)
     print("\nSUMMARY:")
-    print(f"  Streak Stats API: {api_streak if api_streak else 'Failed'}")
+    print(f"  Contributions calendar: {api_streak if api_streak is not None else 'Failed'}")
     print(f"  GitHub GraphQL API: {graphql_streak if graphql_streak else 'Failed'}")
+    print(f"  Cached calendar: {cached_streak if cached_streak is not None else 'Unavailable'}")
     print("=" * 60)
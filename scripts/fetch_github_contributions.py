@@ -7,56 +7,151 @@ Fetches real contribution data using GitHub's GraphQL API
 import os
 import requests
 from datetime import datetime
-from typing import Dict, Any
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+REPOSITORY_PAGE_FIELDS = """
+    repositories(first: 100, after: $cursor, ownerAffiliations: OWNER) {
+      totalCount
+      pageInfo {
+        endCursor
+        hasNextPage
+      }
+      nodes {
+        stargazerCount
+        forkCount
+        languages(first: 10) {
+          edges {
+            size
+            node {
+              name
+            }
+          }
+        }
+      }
+    }
+"""
+
+CONTRIBUTION_FIELDS = """
+    contributionsCollection {
+      contributionCalendar {
+        totalContributions
+      }
+      restrictedContributionsCount
+      totalCommitContributions
+      totalIssueContributions
+      totalPullRequestContributions
+      totalPullRequestReviewContributions
+    }
+    followers {
+      totalCount
+    }
+"""
+
 
 class GitHubContributionsFetcher:
+    github_api_url = 'https://api.github.com'
+
     def __init__(self):
         self.token = os.getenv('GH_TOKEN') or os.getenv('GITHUB_TOKEN')
         self.username = 'Rayyan9477'
-        self.graphql_url = 'https://api.github.com/graphql'
+        self.github_api_url = os.getenv('GITHUB_API_URL') or self.github_api_url
+        self.graphql_url = f'{self.github_api_url}/graphql'
+        self.max_repository_pages = 100
     
-    def fetch_contributions(self) -> Dict[str, Any]:
-        """Fetch contribution statistics using GitHub GraphQL API"""
+    def _post_graphql(self, query: str, variables: Dict[str, Any], headers: Dict[str, str]) -> Optional[Dict[str, Any]]:
+        """Run one GraphQL request and return its ``user`` object, or None on failure"""
+        response = requests.post(
+            self.graphql_url,
+            json={'query': query, 'variables': variables},
+            headers=headers,
+            timeout=15
+        )
+
+        if response.status_code != 200:
+            print(f"⚠️ GraphQL API returned status {response.status_code}")
+            return None
+
+        data = response.json()
+
+        if 'errors' in data:
+            print(f"⚠️ GraphQL errors: {data['errors']}")
+            return None
+
+        return data['data']['user']
+
+    def _iter_repository_pages(self, headers: Dict[str, str], first_page: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+        """Yield repository connection pages, following ``endCursor`` until exhausted.
+
+        ``first_page`` lets the caller supply a page that was already fetched
+        together with the contributions query, saving a round trip. Raises
+        ``RuntimeError`` when a page fails or ``max_repository_pages`` is hit.
+        """
+        query = f"""
+        query($username: String!, $cursor: String) {{
+          user(login: $username) {{
+            {REPOSITORY_PAGE_FIELDS}
+          }}
+        }}
+        """
+        page = first_page
+        cursor = None
+        for _ in range(self.max_repository_pages):
+            if page is None:
+                user_data = self._post_graphql(query, {'username': self.username, 'cursor': cursor}, headers)
+                if user_data is None:
+                    raise RuntimeError('repository page request failed')
+                page = user_data['repositories']
+
+            yield page
+
+            page_info = page.get('pageInfo') or {}
+            if not page_info.get('hasNextPage'):
+                return
+            cursor = page_info.get('endCursor')
+            page = None
+
+        # Partial totals would be published as an undercount; fall back instead.
+        raise RuntimeError(f'more than {self.max_repository_pages} repository pages')
+
+    @staticmethod
+    def _aggregate_repositories(pages: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        """Fold repository pages into running totals, keeping no nodes in memory"""
+        totals: Dict[str, Any] = {
+            'total_count': 0,
+            'total_stars': 0,
+            'total_forks': 0,
+            'language_bytes': {},
+        }
+        for page in pages:
+            totals['total_count'] = page.get('totalCount', totals['total_count'])
+            for repo in page.get('nodes') or []:
+                totals['total_stars'] += repo.get('stargazerCount', 0)
+                totals['total_forks'] += repo.get('forkCount', 0)
+                for edge in (repo.get('languages') or {}).get('edges', []):
+                    name = edge['node']['name']
+                    totals['language_bytes'][name] = totals['language_bytes'].get(name, 0) + edge.get('size', 0)
+        return totals
+
+    def fetch_contributions(self, combine_first_page: bool = True) -> Dict[str, Any]:
+        """Fetch contribution statistics using GitHub GraphQL API
+
+        Repositories are paged with cursors so accounts with more than 100
+        repositories are counted in full. With ``combine_first_page`` the first
+        repository page rides along with the contributions query.
+        """
         if not self.token:
             print("⚠️ No GitHub token found, cannot fetch contributions")
             return self._get_fallback_data()
         
-        # GraphQL query to get contribution data
-        query = """
-        query($username: String!) {
-          user(login: $username) {
-            contributionsCollection {
-              contributionCalendar {
-                totalContributions
-              }
-              restrictedContributionsCount
-            }
-            repositories(first: 100, ownerAffiliations: OWNER) {
-              totalCount
-              nodes {
-                stargazerCount
-                forkCount
-                languages(first: 10) {
-                  edges {
-                    size
-                    node {
-                      name
-                    }
-                  }
-                }
-              }
-            }
-            followers {
-              totalCount
-            }
-            contributionsCollection {
-              totalCommitContributions
-              totalIssueContributions
-              totalPullRequestContributions
-              totalPullRequestReviewContributions
-            }
-          }
-        }
+        repository_fields = REPOSITORY_PAGE_FIELDS if combine_first_page else ''
+        cursor_variable = ', $cursor: String' if combine_first_page else ''
+        query = f"""
+        query($username: String!{cursor_variable}) {{
+          user(login: $username) {{
+            {CONTRIBUTION_FIELDS}
+            {repository_fields}
+          }}
+        }}
         """
         
         headers = {
@@ -65,29 +160,21 @@ class GitHubContributionsFetcher:
         }
         
         try:
-            response = requests.post(
-                self.graphql_url,
-                json={'query': query, 'variables': {'username': self.username}},
-                headers=headers,
-                timeout=15
-            )
-            
-            if response.status_code != 200:
-                print(f"⚠️ GraphQL API returned status {response.status_code}")
+            variables = {'username': self.username}
+            if combine_first_page:
+                variables['cursor'] = None
+            user_data = self._post_graphql(query, variables, headers)
+            if user_data is None:
                 return self._get_fallback_data()
             
-            data = response.json()
-            
-            if 'errors' in data:
-                print(f"⚠️ GraphQL errors: {data['errors']}")
-                return self._get_fallback_data()
-            
-            user_data = data['data']['user']
             contributions = user_data['contributionsCollection']
             
-            # Calculate total stars and forks
-            total_stars = sum(repo['stargazerCount'] for repo in user_data['repositories']['nodes'])
-            total_forks = sum(repo['forkCount'] for repo in user_data['repositories']['nodes'])
+            # Calculate total stars and forks across every repository page
+            repositories = self._aggregate_repositories(
+                self._iter_repository_pages(headers, user_data.get('repositories'))
+            )
+            total_stars = repositories['total_stars']
+            total_forks = repositories['total_forks']
             
             # Get this year's contributions
             this_year_contributions = contributions['contributionCalendar']['totalContributions']
@@ -104,9 +191,10 @@ class GitHubContributionsFetcher:
             
             result = {
                 'followers': user_data['followers']['totalCount'],
-                'public_repos': user_data['repositories']['totalCount'],
+                'public_repos': repositories['total_count'],
                 'total_stars': total_stars,
                 'total_forks': total_forks,
+                'language_bytes': repositories['language_bytes'],
                 'this_year_contributions': this_year_contributions,
                 'total_contributions': lifetime_total,
                 'total_commits': total_commits,
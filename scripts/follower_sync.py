@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Follower Sync
+Keeps the follower list as a sorted ``array('Q')`` of GitHub database ids
+(with logins in a parallel list) and updates it incrementally: GraphQL
+``followers`` pages arrive newest first, so paging stops at the first id
+already known. A full resync runs only when the counts stop adding up,
+which is how unfollows are detected. The newest follower id is kept too,
+so an unchanged count can be confirmed with a one-node query.
+"""
+
+from array import array
+from bisect import bisect_left
+from datetime import date
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from profile_cache import load_json, save_json
+
+FOLLOWERS_QUERY = """
+query Followers($login: String!, $cursor: String, $first: Int = 100) {
+  user(login: $login) {
+    followers(first: $first, after: $cursor) {
+      totalCount
+      pageInfo { hasNextPage endCursor }
+      nodes { databaseId login }
+    }
+  }
+}
+"""
+
+# fetch_page(cursor) returns the ``followers`` connection or None.
+PageFetcher = Callable[[Optional[str]], Optional[Dict[str, Any]]]
+
+
+def sorted_difference(left: array, right: array) -> List[int]:
+    """Return indices into sorted ``left`` whose ids are missing from sorted ``right``."""
+    missing = []
+    position = 0
+    for index, value in enumerate(left):
+        while position < len(right) and right[position] < value:
+            position += 1
+        if position == len(right) or right[position] != value:
+            missing.append(index)
+    return missing
+
+
+class FollowerSync:
+    """Sorted follower ids plus the most recent gains and losses."""
+
+    def __init__(self, path: Optional[str], recent_limit: int = 10, max_pages: int = 100):
+        self.path = path
+        self.recent_limit = recent_limit
+        self.max_pages = max_pages
+        data = load_json(path, {}) if path else {}
+        self.ids = array('Q', data.get('ids', []))
+        self.logins: List[str] = data.get('logins', [])
+        self.recent: List[Dict[str, str]] = data.get('recent', [])
+        self.lost: List[Dict[str, str]] = data.get('lost', [])
+        self.newest: Optional[int] = data.get('newest')
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, follower_id: int) -> bool:
+        index = bisect_left(self.ids, follower_id)
+        return index < len(self.ids) and self.ids[index] == follower_id
+
+    def is_current(self, head: Optional[Dict[str, Any]]) -> bool:
+        """Return True when ``head`` (a first page) starts with the newest known follower.
+
+        A matching count alone can hide an unfollow plus a new follow.
+        """
+        if not self.ids or head is None:
+            return False
+        nodes = head.get('nodes') or []
+        return bool(nodes) and nodes[0].get('databaseId') == self.newest
+
+    def _note_newest(self, connection: Dict[str, Any]) -> None:
+        for node in connection.get('nodes') or []:
+            if node.get('databaseId') is not None:
+                self.newest = node['databaseId']
+                return
+
+    def _replace(self, followers: Dict[int, str]) -> Tuple[List[str], List[str]]:
+        """Swap in a complete follower map and return (gained, lost) logins."""
+        ids = array('Q', sorted(followers))
+        gained = [followers[ids[index]] for index in sorted_difference(ids, self.ids)]
+        lost = [self.logins[index] for index in sorted_difference(self.ids, ids)]
+        self.ids = ids
+        self.logins = [followers[follower_id] for follower_id in ids]
+        return gained, lost
+
+    def _add(self, followers: Dict[int, str]) -> List[str]:
+        """Insert new followers in place, keeping the id array sorted."""
+        for follower_id, login in followers.items():
+            index = bisect_left(self.ids, follower_id)
+            self.ids.insert(index, follower_id)
+            self.logins.insert(index, login)
+        return list(followers.values())
+
+    def sync(self, fetch_page: PageFetcher, today: date) -> Optional[Dict[str, List[str]]]:
+        """Bring the id set up to date; return the gained and lost logins, or None on failure."""
+        baseline = not self.ids
+        fetched: Dict[int, str] = {}
+        new_ids: Dict[int, str] = {}
+        cursor = None
+        total = 0
+        complete = False
+        for _ in range(self.max_pages):
+            connection = fetch_page(cursor)
+            if connection is None:
+                return None
+            if cursor is None:
+                self._note_newest(connection)
+            total = int(connection.get('totalCount', 0) or 0)
+            reached_known = False
+            for node in connection.get('nodes') or []:
+                follower_id = node.get('databaseId')
+                if follower_id is None:
+                    continue
+                fetched[follower_id] = node.get('login', '')
+                if follower_id in self:
+                    reached_known = True
+                else:
+                    new_ids[follower_id] = fetched[follower_id]
+            page_info = connection.get('pageInfo') or {}
+            if not page_info.get('hasNextPage'):
+                complete = True
+                break
+            if reached_known and not baseline:
+                break
+            cursor = page_info.get('endCursor')
+
+        if complete:
+            # Every follower was listed, so the fetched map is authoritative.
+            gained, lost = self._replace(fetched)
+        elif len(self) + len(new_ids) == total:
+            gained, lost = self._add(new_ids), []
+        else:
+            # Counts disagree, so someone unfollowed: rebuild from a full listing.
+            return self._full_resync(fetch_page, today, baseline)
+
+        return self._remember(gained, lost, today, baseline)
+
+    def _full_resync(self, fetch_page: PageFetcher, today: date, baseline: bool) -> Optional[Dict[str, List[str]]]:
+        followers: Dict[int, str] = {}
+        cursor = None
+        for _ in range(self.max_pages):
+            connection = fetch_page(cursor)
+            if connection is None:
+                return None
+            if cursor is None:
+                self._note_newest(connection)
+            for node in connection.get('nodes') or []:
+                if node.get('databaseId') is not None:
+                    followers[node['databaseId']] = node.get('login', '')
+            page_info = connection.get('pageInfo') or {}
+            if not page_info.get('hasNextPage'):
+                break
+            cursor = page_info.get('endCursor')
+        else:
+            return None
+        gained, lost = self._replace(followers)
+        return self._remember(gained, lost, today, baseline)
+
+    def _remember(self, gained: List[str], lost: List[str], today: date, baseline: bool) -> Dict[str, List[str]]:
+        if baseline:
+            # The first sync establishes the set; nobody is "new" yet.
+            return {'gained': [], 'lost': []}
+        day = today.isoformat()
+        self.recent = ([{'login': login, 'date': day} for login in gained] + self.recent)[:self.recent_limit]
+        self.lost = ([{'login': login, 'date': day} for login in lost] + self.lost)[:self.recent_limit]
+        return {'gained': gained, 'lost': lost}
+
+    def save(self) -> None:
+        if self.path:
+            save_json(self.path, {
+                'ids': list(self.ids),
+                'logins': self.logins,
+                'recent': self.recent,
+                'lost': self.lost,
+                'newest': self.newest,
+            })
@@ -5,20 +5,42 @@ Updates README.md with real-time GitHub statistics and activity
 Designed to work with GitHub Actions for automated updates every 12 hours
 """
 
+import logging
 import os
 import re
 import requests
 import subprocess
 import sys
+import time
 from datetime import datetime
 from typing import Dict, Any, Optional
 
+from adaptive_timeouts import LatencyBook, endpoint_key
+from run_logging import configure_logger, shutdown as shutdown_logging
+from tracing import Tracer, span, traced_request
+
 class GitHubStatsUpdater:
+    tracer: Optional[Tracer] = None
+    github_api_url = 'https://api.github.com'
+    logger: Optional[logging.Logger] = None
+    latency_book: Optional[LatencyBook] = None
+
     def __init__(self):
+        self.log_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'github_stats.log')
+        self.logger = configure_logger('github_stats_updater', self.log_file)
         self.GH_TOKEN = os.getenv('GH_TOKEN') or os.getenv('GITHUB_TOKEN')
         self.username = 'Rayyan9477'
+        self.github_api_url = os.getenv('GITHUB_API_URL') or self.github_api_url
         self.readme_file = self._find_readme()
-        self.log_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'github_stats.log')
+        self.tracer = Tracer('github_stats_updater')
+        self.trace_file = os.getenv('TRACE_FILE') or os.path.join(
+            os.path.dirname(os.path.abspath(__file__)), 'github_stats.trace.json'
+        )
+        # Shares the response-time history kept by daily_update.py.
+        cache_dir = os.getenv('PROFILE_CACHE_DIR') or os.path.join(
+            os.path.dirname(os.path.abspath(__file__)), 'cache'
+        )
+        self.latency_book = LatencyBook(os.path.join(cache_dir, 'latency.json'))
         
         self.log("🚀 GitHub Stats Updater Started")
     
@@ -41,27 +63,48 @@ class GitHubStatsUpdater:
         return possible_paths[0]
     
     def log(self, message: str, level: str = "INFO"):
-        """Log messages with timestamp"""
+        """Log a message through the queue-backed logger (console + JSON lines)"""
+        levelno = logging.getLevelName(level.upper())
+        if not isinstance(levelno, int):
+            levelno = logging.INFO
+        if self.logger is not None:
+            self.logger.log(levelno, message)
+            return
+
+        # Not configured (e.g. partially constructed in tests): console only.
+        if levelno < logging.INFO:
+            return
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         log_message = f"[{timestamp}] {level}: {message}"
         try:
             print(log_message)
         except UnicodeEncodeError:
             # Fallback for terminals that cannot render emojis
-            safe_message = log_message.encode("ascii", "ignore").decode("ascii")
             try:
-                print(safe_message)
+                print(log_message.encode("ascii", "ignore").decode("ascii"))
             except Exception:
                 pass
-        
-        try:
-            with open(self.log_file, 'a', encoding='utf-8') as f:
-                f.write(log_message + '\n')
-        except (PermissionError, OSError):
-            pass  # Ignore logging errors
-        except Exception:
-            pass  # Ignore any other logging errors
     
+    def _span(self, name: str, category: str = 'phase', **args: Any):
+        """Open a tracing span; a no-op when tracing is not set up."""
+        return span(self.tracer, name, category, **args)
+
+    def _request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Send an HTTP request through the tracer; the call site's timeout is a ceiling."""
+        if self.latency_book is None:
+            return traced_request(self.tracer, method, url, **kwargs)
+        key = endpoint_key(method, url, kwargs.get('json'))
+        if not isinstance(kwargs.get('timeout'), tuple):
+            kwargs['timeout'] = self.latency_book.timeout(key, kwargs.get('timeout'))
+        started = time.perf_counter()
+        try:
+            response = traced_request(self.tracer, method, url, **kwargs)
+        except requests.exceptions.Timeout:
+            self.latency_book.record_timeout(key, time.perf_counter() - started)
+            raise
+        self.latency_book.record(key, time.perf_counter() - started)
+        return response
+
     def get_github_user_stats(self) -> Dict[str, Any]:
         """Fetch comprehensive GitHub user statistics"""
         if not self.GH_TOKEN:
@@ -75,8 +118,8 @@ class GitHubStatsUpdater:
         
         try:
             # Get user information
-            user_url = f'https://api.github.com/users/{self.username}'
-            response = requests.get(user_url, headers=headers, timeout=15)
+            user_url = f'{self.github_api_url}/users/{self.username}'
+            response = self._request('GET', user_url, headers=headers, timeout=15)
             
             if response.status_code == 403:
                 self.log("⚠️ GitHub API rate limit exceeded", "WARNING")
@@ -122,14 +165,14 @@ class GitHubStatsUpdater:
     
     def _get_repository_stats(self, headers: Dict[str, str]) -> Dict[str, int]:
         """Get total stars and forks across all repositories"""
-        url = f'https://api.github.com/users/{self.username}/repos'
+        url = f'{self.github_api_url}/users/{self.username}/repos'
         total_stars = 0
         total_forks = 0
         page = 1
         
         try:
             while True:
-                response = requests.get(f'{url}?page={page}&per_page=100&sort=updated', headers=headers, timeout=15)
+                response = self._request('GET', f'{url}?page={page}&per_page=100&sort=updated', headers=headers, timeout=15)
                 if response.status_code != 200:
                     break
                 
@@ -194,7 +237,7 @@ class GitHubStatsUpdater:
             
             for streak_url in streak_urls:
                 try:
-                    response = requests.get(streak_url, timeout=15)
+                    response = self._request('GET', streak_url, timeout=15)
                     if response.status_code == 200:
                         svg_content = response.text
                         # Parse current streak from SVG - try multiple patterns
@@ -242,7 +285,7 @@ class GitHubStatsUpdater:
         one_year_ago = today - timedelta(days=365)
         
         query = """
-        query($username: String!, $from: DateTime!, $to: DateTime!) {
+        query ContributionCalendar($username: String!, $from: DateTime!, $to: DateTime!) {
           user(login: $username) {
             contributionsCollection(from: $from, to: $to) {
               contributionCalendar {
@@ -267,8 +310,9 @@ class GitHubStatsUpdater:
         
         try:
             self.log("🔍 Querying GitHub GraphQL API for contribution data...")
-            response = requests.post(
-                'https://api.github.com/graphql',
+            response = self._request(
+                'POST',
+                f'{self.github_api_url}/graphql',
                 json={'query': query, 'variables': variables},
                 headers=headers,
                 timeout=20
@@ -383,7 +427,8 @@ class GitHubStatsUpdater:
                 self.log("✅ Updated profile views badge")
             
             # Update current streak badge
-            current_streak = self._get_current_streak()
+            with self._span('current_streak', 'fetch'):
+                current_streak = self._get_current_streak()
             if current_streak:  # Only update if we successfully fetched the streak
                 current_streak_pattern = r'https://img\.shields\.io/badge/[^\"]*Current_Streak-[\d_]+Days-[^\"]*'
                 current_streak_replacement = f'https://img.shields.io/badge/Current_Streak-{current_streak}-F85D7F?style=flat-square&logo=github&logoColor=white'
@@ -435,10 +480,13 @@ class GitHubStatsUpdater:
                 return False
             
             # Get GitHub statistics
-            stats = self.get_github_user_stats()
+            with self._span('github_stats', 'fetch'):
+                stats = self.get_github_user_stats()
             
             # Update README content
-            if not self.update_readme_stats(stats):
+            with self._span('update_readme', 'write') as phase:
+                phase['status'] = 'ok' if self.update_readme_stats(stats) else 'failed'
+            if phase['status'] != 'ok':
                 self.log("❌ README stats update failed", "ERROR")
                 return False
             
@@ -448,11 +496,17 @@ class GitHubStatsUpdater:
         except Exception as e:
             self.log(f"❌ GitHub stats update failed: {e}", "ERROR")
             return False
+        finally:
+            if self.latency_book is not None:
+                self.latency_book.save()
+            if self.tracer:
+                self.tracer.write(self.trace_file)
 
 def main():
     """Main entry point"""
     updater = GitHubStatsUpdater()
     success = updater.run_stats_update()
+    shutdown_logging()
     
     try:
         if success:
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Metrics Exporter
+Turns a run's trace (phase spans, HTTP spans, cache events) and the values
+it published into a Prometheus text-format (0.0.4) file that node-exporter's
+textfile collector, or any file-based scraper, can pick up. Every family is a
+gauge: the file describes one run and is replaced by the next, so nothing in
+it accumulates the way a counter must.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from tracing import Tracer
+
+PREFIX = 'profile_update'
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace('\\', r'\\').replace('"', r'\"').replace('\n', r'\n')
+
+
+class MetricFamily:
+    """One metric name with its type, help text and labelled samples."""
+
+    def __init__(self, name: str, metric_type: str, help_text: str):
+        self.name = f'{PREFIX}_{name}'
+        self.metric_type = metric_type
+        self.help_text = help_text
+        self.samples: Dict[Labels, float] = {}
+
+    def add(self, value: float, **labels: Any) -> None:
+        key = tuple(sorted((name, str(label)) for name, label in labels.items()))
+        self.samples[key] = self.samples.get(key, 0) + value
+
+    def render(self) -> List[str]:
+        lines = [f'# HELP {self.name} {self.help_text}', f'# TYPE {self.name} {self.metric_type}']
+        for labels, value in sorted(self.samples.items()):
+            label_text = ','.join(f'{name}="{_escape(label)}"' for name, label in labels)
+            label_text = f'{{{label_text}}}' if label_text else ''
+            lines.append(f'{self.name}{label_text} {value:g}')
+        return lines
+
+
+def build_metrics(
+    tracer: Tracer,
+    published: Dict[str, Optional[float]],
+    run_succeeded: bool,
+    fallbacks: Iterable[str] = (),
+    degraded: Iterable[str] = (),
+    deadline: Optional[Tuple[float, float]] = None,
+) -> str:
+    """Render one run in the Prometheus text exposition format.
+
+    ``deadline`` is the run budget and the seconds left of it, when one is set.
+    """
+    phase_seconds = MetricFamily('phase_duration_seconds', 'gauge', 'Wall time spent in each run phase.')
+    api_calls = MetricFamily('api_calls', 'gauge', 'HTTP requests made this run by host and status code.')
+    api_seconds = MetricFamily('api_duration_seconds', 'gauge', 'Total HTTP request time by host.')
+    transferred = MetricFamily('bytes_transferred', 'gauge', 'Response body bytes received this run by host.')
+    rate_limit_used = MetricFamily('rate_limit_points_consumed', 'gauge', 'Rate-limit points used during the run by resource.')
+    rate_limit_left = MetricFamily('rate_limit_remaining', 'gauge', 'Lowest rate-limit remaining seen by resource.')
+    cache_hits = MetricFamily('cache_hits', 'gauge', 'Cache lookups answered locally this run.')
+    cache_misses = MetricFamily('cache_misses', 'gauge', 'Cache lookups that needed a fetch this run.')
+    cache_ratio = MetricFamily('cache_hit_ratio', 'gauge', 'Share of cache lookups answered locally.')
+    published_values = MetricFamily('published_value', 'gauge', 'Values written to the profile README.')
+    fallback_used = MetricFamily('fallback_used', 'gauge', 'Sections served from a fallback this run.')
+    degraded_sections = MetricFamily('section_degraded', 'gauge', 'Sections served from cache because of the run deadline.')
+    deadline_budget = MetricFamily('run_deadline_seconds', 'gauge', 'Wall-clock budget for the run.')
+    deadline_left = MetricFamily('run_deadline_remaining_seconds', 'gauge', 'Budget left when the run finished.')
+    success = MetricFamily('run_success', 'gauge', '1 when the run completed successfully.')
+
+    # resource -> rate-limit window (its reset time) -> remaining values seen in it
+    remaining_seen: Dict[str, Dict[Any, List[int]]] = {}
+    for event in tracer.events:
+        args = event.get('args', {})
+        if event['ph'] == 'X' and event['cat'] == 'http':
+            host = args.get('host', 'unknown')
+            api_calls.add(1, host=host, status=args.get('status', 'error'))
+            api_seconds.add(event['dur'] / 1e6, host=host)
+            transferred.add(args.get('bytes', 0), host=host)
+            if 'rate_limit_remaining' in args:
+                resource = f"{host}/{args.get('rate_limit_resource', 'core')}"
+                windows = remaining_seen.setdefault(resource, {})
+                windows.setdefault(args.get('rate_limit_reset'), []).append(args['rate_limit_remaining'])
+            cache_name = 'http'
+        elif event['ph'] == 'X':
+            phase_seconds.add(event['dur'] / 1e6, phase=event['name'], kind=event['cat'])
+            cache_name = event['name']
+        else:
+            cache_name = event['name']
+        if args.get('cache') in ('hit', 'miss'):
+            (cache_hits if args['cache'] == 'hit' else cache_misses).add(1, cache=cache_name)
+        if 'hits' in args or 'misses' in args:
+            cache_hits.add(args.get('hits', 0), cache=cache_name)
+            cache_misses.add(args.get('misses', 0), cache=cache_name)
+
+    for resource, windows in remaining_seen.items():
+        # The allowance refills when a window resets, so the spread is only
+        # meaningful within one window; the first call in each costs a point too.
+        for remaining in windows.values():
+            rate_limit_used.add(max(remaining) - min(remaining) + 1, resource=resource)
+        latest = windows[max(windows, key=lambda reset: reset or 0)]
+        rate_limit_left.add(min(latest), resource=resource)
+
+    for labels, hits in cache_hits.samples.items():
+        total = hits + cache_misses.samples.get(labels, 0)
+        if total:
+            cache_ratio.add(hits / total, **dict(labels))
+    for labels in cache_misses.samples:
+        if labels not in cache_hits.samples:
+            cache_ratio.add(0, **dict(labels))
+
+    for name, value in published.items():
+        if value is not None:
+            published_values.add(value, metric=name)
+    for section in fallbacks:
+        fallback_used.add(1, section=section)
+    for section in degraded:
+        degraded_sections.add(1, section=section)
+    if deadline is not None:
+        deadline_budget.add(deadline[0])
+        deadline_left.add(deadline[1])
+    success.add(1 if run_succeeded else 0)
+
+    lines: List[str] = []
+    for family in (
+        success, phase_seconds, api_calls, api_seconds, transferred, rate_limit_used,
+        rate_limit_left, cache_hits, cache_misses, cache_ratio, published_values, fallback_used,
+        degraded_sections, deadline_budget, deadline_left,
+    ):
+        lines.extend(family.render())
+    return '\n'.join(lines) + '\n'
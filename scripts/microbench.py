@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Function Microbenchmarks
+Times the pure helpers of the daily update with ``timeit`` on synthetic
+inputs from small to pathological (a 200 KB README full of markers, decades
+of contribution days, thousands of languages). Results are stored per commit
+in ``benchmarks/microbench.json`` so a slowdown shows up at function level,
+and each run is compared with the previous commit on record.
+
+    python scripts/microbench.py                  # run, record and compare
+    python scripts/microbench.py --filter streak  # only matching cases
+    python scripts/microbench.py --no-record      # print without storing
+"""
+
+import argparse
+import json
+import random
+import subprocess
+import sys
+import tempfile
+import timeit
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from calendar_file import CalendarFile, write_calendar
+from contribution_analytics import ContributionSeries
+from daily_update import BADGE_PATTERNS, DailyUpdater
+from wakatime_analytics import DEFAULT_WINDOWS, WakaTimeAnalytics
+from wakatime_cache import WakaTimeDayCache
+
+HISTORY_PATH = SCRIPTS_DIR / 'benchmarks' / 'microbench.json'
+MARKERS = ('FOLLOWERS', 'TOTAL_STARS', 'CURRENT_STREAK', 'STARS_THIS_WEEK', 'LONGEST_STREAK')
+BADGES = (
+    '<img src="https://img.shields.io/badge/Followers-94-22c55e?style=flat-square" alt="Followers"/>',
+    '<img src="https://img.shields.io/badge/Total_Stars-220-FFC107?style=flat-square" alt="Total Stars"/>',
+    '<img src="https://komarev.com/ghpvc/?username=Rayyan9477&label=Profile%20Views" alt="Profile Views"/>',
+    '<img src="https://img.shields.io/badge/Current_Streak-391_Days-F85D7F?style=flat-square" alt="Streak"/>',
+)
+TODAY = date(2026, 1, 1)
+
+
+def synthetic_readme(size: int, marker_every: int = 40) -> str:
+    """A README of about ``size`` bytes with the dashboard markers at the end.
+
+    Every ``marker_every``-th line carries a badge and a decoy marker pair, so
+    regexes must scan the whole document before they reach the real markers.
+    """
+    lines: List[str] = []
+    length = 0
+    index = 0
+    while length < size:
+        if index % marker_every == 0:
+            line = f'{BADGES[index % len(BADGES)]} <!--DECOY_{index}-->{index}<!--/DECOY_{index}-->'
+        else:
+            line = f'<p>Line {index}: building things with Python, TypeScript and a lot of coffee.</p>'
+        lines.append(line)
+        length += len(line) + 1
+        index += 1
+    lines.extend(f'<strong><!--{marker}-->0<!--/{marker}--></strong>' for marker in MARKERS)
+    return '\n'.join(lines) + '\n'
+
+
+def contribution_days(count: int) -> List[Dict[str, Any]]:
+    """Newest-first contribution days, all active so the streak walks them all."""
+    return [
+        {'date': (TODAY - timedelta(days=offset)).isoformat(), 'contributionCount': 1 + offset % 7}
+        for offset in range(count)
+    ]
+
+
+def language_totals(count: int) -> Dict[str, int]:
+    rng = random.Random(count)
+    return {f'Language{index}': rng.randint(1, 10_000_000) for index in range(count)}
+
+
+def wakatime_days(days: int, names: int) -> Dict[str, Dict[str, Any]]:
+    """Per-day cache entries shaped like ``WakaTimeDayCache.summarize_day`` output."""
+    rng = random.Random(days * 1000 + names)
+    result = {}
+    for offset in range(days):
+        languages = {f'Lang{rng.randrange(names)}': rng.randint(60, 7200) for _ in range(min(names, 8))}
+        result[(TODAY - timedelta(days=offset)).isoformat()] = {
+            'total_seconds': sum(languages.values()),
+            'languages': languages,
+            'editors': {'VS Code': sum(languages.values())},
+            'projects': {f'project-{rng.randrange(names)}': sum(languages.values())},
+        }
+    return result
+
+
+def wakatime_summary(names: int) -> Dict[str, Any]:
+    """One raw ``summaries`` API entry with ``names`` items per category."""
+    items = [{'name': f'Name{index}', 'total_seconds': 30.5 + index} for index in range(names)]
+    return {'grand_total': {'total_seconds': 30.5 * names}, 'languages': items, 'editors': items, 'projects': items}
+
+
+def rewrite_badges(content: str) -> str:
+    """The badge rewrite step of ``update_readme`` on its own."""
+    replacements = {
+        'followers': 'https://img.shields.io/badge/Followers-120-22c55e?style=flat-square&logo=github&logoColor=white',
+        'stars': 'https://img.shields.io/badge/Total_Stars-300-FFC107?style=flat-square&logo=github&logoColor=white',
+        'profile_views': 'https://komarev.com/ghpvc/?username=Rayyan9477&label=Profile%20Views&color=0e75b6&style=flat-square',
+        'current_streak': 'https://img.shields.io/badge/Current_Streak-400_Days-F85D7F?style=flat-square&logo=github&logoColor=white',
+    }
+    for name, replacement in replacements.items():
+        if BADGE_PATTERNS[name].search(content):
+            content = BADGE_PATTERNS[name].sub(replacement, content)
+    return content
+
+
+def replace_all_markers(content: str) -> str:
+    for marker in MARKERS:
+        content = DailyUpdater._replace_stat_marker(content, marker, 42)
+    return content
+
+
+def series_streak(series: ContributionSeries) -> int:
+    """``ContributionSeries.current_streak`` on a fresh view, so the active mask is rebuilt as in a run."""
+    return ContributionSeries(series.epoch, series.counts).current_streak(TODAY)
+
+
+def calendar_streak(path: str) -> int:
+    """Open the binary calendar and walk its tail, as the streak fast path does."""
+    with CalendarFile(path) as calendar:
+        return calendar.current_streak(TODAY)
+
+
+def build_cases(workdir: str) -> Dict[str, Callable[[], Any]]:
+    """Name -> zero-argument callable; inputs are built once, outside the timing.
+
+    Calendar files for the streak cases are written under ``workdir``.
+    """
+    cases: Dict[str, Callable[[], Any]] = {}
+
+    for days in (30, 365, 3650, 36500):
+        series = ContributionSeries.from_days(contribution_days(days))
+        path = str(Path(workdir) / f'calendar-{days}.bin')
+        write_calendar(path, series)
+        cases[f'series_streak/{days}d'] = lambda series=series: series_streak(series)
+        cases[f'calendar_streak/{days}d'] = lambda path=path: calendar_streak(path)
+
+    repo_readme = (SCRIPTS_DIR.parent / 'README.md').read_text(encoding='utf-8')
+    readmes = {
+        'repo': repo_readme,
+        '20KB': synthetic_readme(20_000),
+        '200KB': synthetic_readme(200_000),
+        '200KB-dense': synthetic_readme(200_000, marker_every=2),
+    }
+    for label, content in readmes.items():
+        if label == 'repo':
+            cases['replace_stat_marker/repo'] = lambda content=content: DailyUpdater._replace_stat_marker(
+                content, 'FOLLOWERS', 42
+            )
+        else:
+            cases[f'replace_stat_marker/{label}'] = lambda content=content: replace_all_markers(content)
+        cases[f'badge_rewrite/{label}'] = lambda content=content: rewrite_badges(content)
+
+    for count in (5, 100, 5000):
+        languages = language_totals(count)
+        cases[f'languages_card/{count}'] = lambda languages=languages: DailyUpdater._build_languages_card(languages)
+
+    for names in (10, 500):
+        summary = wakatime_summary(names)
+        cases[f'wakatime_summarize_day/{names}'] = lambda summary=summary: WakaTimeDayCache.summarize_day(summary)
+    for days, names in ((30, 10), (365, 40), (365, 400)):
+        cache_days = wakatime_days(days, names)
+        cases[f'wakatime_windows/{days}d-{names}'] = lambda cache_days=cache_days: WakaTimeAnalytics(
+            cache_days, TODAY, span=max(DEFAULT_WINDOWS)
+        ).windows()
+
+    return cases
+
+
+def time_case(function: Callable[[], Any], repeat: int = 5, min_time: float = 0.2) -> float:
+    """Best seconds per call over ``repeat`` rounds of an auto-sized loop."""
+    timer = timeit.Timer(function)
+    number, elapsed = timer.autorange()
+    if elapsed < min_time:
+        number = max(1, int(number * min_time / max(elapsed, 1e-9)))
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def current_commit() -> str:
+    """HEAD's commit id, suffixed with ``-dirty`` when the tree has changes."""
+    try:
+        commit = subprocess.run(
+            ['git', 'rev-parse', 'HEAD'], cwd=SCRIPTS_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+        status = subprocess.run(
+            ['git', 'status', '--porcelain', '--untracked-files=no'],
+            cwd=SCRIPTS_DIR, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+    return f'{commit}-dirty' if status else commit
+
+
+def previous_run(history: Dict[str, Any], commit: str) -> Optional[Dict[str, Any]]:
+    """The latest recorded run from a different commit, to compare against."""
+    return next((run for run in reversed(history.get('runs', [])) if run['commit'] != commit), None)
+
+
+def record(history: Dict[str, Any], commit: str, results: Dict[str, float]) -> None:
+    """Store ``results`` under ``commit``, replacing an earlier run of the same commit."""
+    runs = [run for run in history.get('runs', []) if run['commit'] != commit]
+    runs.append({
+        'commit': commit,
+        'recorded_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': sys.version.split()[0],
+        'results': {name: round(seconds, 9) for name, seconds in results.items()},
+    })
+    history['runs'] = runs
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Time the daily update helpers on synthetic inputs.')
+    parser.add_argument('--filter', help='only run cases whose name contains this text')
+    parser.add_argument('--repeat', type=int, default=5, help='timing rounds per case (best is kept)')
+    parser.add_argument('--no-record', action='store_true', help='do not write results to the history file')
+    parser.add_argument('--history', default=str(HISTORY_PATH), help='per-commit results file')
+    args = parser.parse_args()
+
+    history_path = Path(args.history)
+    history = json.loads(history_path.read_text(encoding='utf-8')) if history_path.exists() else {}
+    commit = current_commit()
+
+    results: Dict[str, float] = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        for name, function in build_cases(workdir).items():
+            if args.filter and args.filter not in name:
+                continue
+            results[name] = time_case(function, repeat=args.repeat)
+
+    previous = previous_run(history, commit)
+    baseline = previous['results'] if previous else {}
+
+    print(f"{'case':<34} {'per call':>12} {'vs ' + (previous['commit'][:10] if previous else 'none'):>14}")
+    for name, seconds in results.items():
+        before = baseline.get(name)
+        change = f'{seconds / before:>13.2f}x' if before else f"{'-':>14}"
+        print(f'{name:<34} {seconds * 1e6:>10.1f}us {change}')
+
+    if not args.no_record:
+        record(history, commit, results)
+        history_path.parent.mkdir(parents=True, exist_ok=True)
+        history_path.write_text(json.dumps(history, indent=1) + '\n', encoding='utf-8')
+        print(f'\nRecorded {len(results)} cases for {commit[:12]} in {history_path}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Profile Cache Helpers
+Small JSON cache shared by the profile update scripts.
+
+The cache directory lives beside the scripts and is committed by the daily
+workflow, so state survives between scheduled runs without extra services.
+Files that are private (WakaTime days with project names, follower ids) or
+that change on every run (request latencies) are gitignored instead and
+carried between runs with ``actions/cache``.
+"""
+
+import json
+import os
+import tempfile
+from typing import Any
+
+
+def load_json(path: str, default: Any) -> Any:
+    """Load a cached JSON document, returning ``default`` when unavailable."""
+    try:
+        with open(path, 'r', encoding='utf-8') as file:
+            return json.load(file)
+    except (FileNotFoundError, json.JSONDecodeError, OSError):
+        return default
+
+
+def atomic_write_text(path: str, text: str) -> None:
+    """Replace ``path`` via a temporary file so readers never see a partial write."""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as file:
+            file.write(text)
+        os.replace(temp_path, path)
+    except Exception:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def save_json(path: str, data: Any) -> None:
+    """Atomically write a JSON document so a crashed run never truncates it."""
+    atomic_write_text(path, json.dumps(data, indent=1, sort_keys=True) + '\n')
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Run Deadline
+A wall-clock budget for one update run. Network sections are ranked by
+priority (stats markers, then streak, WakaTime and the quote); while a
+higher-priority section is still pending, lower ones may only spend the
+budget left over after its reserved share. A request the budget cannot
+afford raises ``DeadlineExceeded`` before it is sent, so the section falls
+back to cached values instead of waiting on the network.
+"""
+
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, Optional, Set
+
+import requests
+
+PRIORITIES = ('github_stats', 'current_streak', 'wakatime', 'quote')
+# Share of the budget held back for each section until it has run.
+DEFAULT_SHARES = {'github_stats': 0.5, 'current_streak': 0.2, 'wakatime': 0.2, 'quote': 0.1}
+
+
+class DeadlineExceeded(requests.exceptions.Timeout):
+    """The run budget has no time left for this request.
+
+    Subclasses ``Timeout`` so existing timeout handling applies its fallback.
+    """
+
+
+class RunDeadline:
+    """Tracks the remaining budget and what each section may still spend."""
+
+    def __init__(
+        self,
+        budget: float,
+        shares: Optional[Dict[str, float]] = None,
+        min_slice: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.budget = budget
+        self.shares = dict(DEFAULT_SHARES if shares is None else shares)
+        self.min_slice = min_slice
+        self.current: Optional[str] = None
+        self.completed: Set[str] = set()
+        self._clock = clock
+        self._started = clock()
+
+    def elapsed(self) -> float:
+        return self._clock() - self._started
+
+    def remaining(self) -> float:
+        return max(0.0, self.budget - self.elapsed())
+
+    def available(self, section: Optional[str]) -> float:
+        """Seconds ``section`` may spend without eating a pending higher-priority reserve."""
+        if section not in PRIORITIES:
+            return self.remaining()
+        reserve = sum(
+            self.shares.get(higher, 0.0) * self.budget
+            for higher in PRIORITIES[:PRIORITIES.index(section)]
+            if higher not in self.completed
+        )
+        return self.remaining() - reserve
+
+    def allows(self, section: Optional[str]) -> bool:
+        """Whether ``section`` can still afford a network round trip."""
+        return self.available(section) >= self.min_slice
+
+    @contextmanager
+    def section(self, name: str) -> Iterator[None]:
+        """Attribute requests to ``name``; its reserve is released on exit."""
+        previous, self.current = self.current, name
+        try:
+            yield
+        finally:
+            self.current = previous
+            self.completed.add(name)
+
+    def clamp(self, timeout: Optional[float]) -> float:
+        """Shorten ``timeout`` to what the current section can afford.
+
+        Raises ``DeadlineExceeded`` when that is less than ``min_slice``.
+        """
+        available = self.available(self.current)
+        if available < self.min_slice:
+            raise DeadlineExceeded(
+                f'Run deadline leaves {max(available, 0.0):.1f}s for {self.current or "this request"}'
+            )
+        return available if timeout is None else min(timeout, available)
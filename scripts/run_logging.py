@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Run Logging
+Queue-backed structured logging for the update scripts. Callers only put
+records on an in-memory queue; a background listener writes them as JSON
+lines to a size-rotated file and as the familiar ``[time] LEVEL: message``
+view on the console.
+"""
+
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+CONSOLE_FORMAT = '[%(asctime)s] %(levelname)s: %(message)s'
+CONSOLE_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+MAX_LOG_BYTES = 1024 * 1024
+BACKUP_COUNT = 3
+
+_listeners: Dict[str, logging.handlers.QueueListener] = {}
+_queue_handlers: Dict[str, logging.handlers.QueueHandler] = {}
+
+
+class JsonLineFormatter(logging.Formatter):
+    """One JSON object per record, for grep/jq and log shippers."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'ts': datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        if record.exc_info:
+            entry['exc_info'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class ConsoleHandler(logging.StreamHandler):
+    """Stream handler that drops emojis on terminals that cannot encode them."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            message = self.format(record)
+            try:
+                self.stream.write(message + self.terminator)
+            except UnicodeEncodeError:
+                self.stream.write(message.encode('ascii', 'ignore').decode('ascii') + self.terminator)
+            self.flush()
+        except Exception:
+            self.handleError(record)
+
+
+def configure_logger(name: str, log_file: Optional[str], level: Optional[str] = None) -> logging.Logger:
+    """Return a queue-backed logger; repeated calls reuse the running listener.
+
+    ``level`` defaults to the ``LOG_LEVEL`` environment variable, else INFO.
+    """
+    logger = logging.getLogger(name)
+    logger.setLevel(getattr(logging, (level or os.getenv('LOG_LEVEL') or 'INFO').upper(), logging.INFO))
+    if name in _listeners:
+        return logger
+
+    console = ConsoleHandler(sys.stdout)
+    console.setFormatter(logging.Formatter(CONSOLE_FORMAT, CONSOLE_DATE_FORMAT))
+    handlers = [console]
+    if log_file:
+        try:
+            file_handler = logging.handlers.RotatingFileHandler(
+                log_file, maxBytes=MAX_LOG_BYTES, backupCount=BACKUP_COUNT, encoding='utf-8', delay=True
+            )
+            file_handler.setFormatter(JsonLineFormatter())
+            handlers.append(file_handler)
+        except OSError:
+            pass  # Logging must never stop a run
+
+    records: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(records)
+    logger.addHandler(queue_handler)
+    _queue_handlers[name] = queue_handler
+    logger.propagate = False
+    listener = logging.handlers.QueueListener(records, *handlers)
+    listener.start()
+    _listeners[name] = listener
+    return logger
+
+
+def shutdown() -> None:
+    """Drain every queue and stop the listener threads."""
+    while _listeners:
+        name, listener = _listeners.popitem()
+        logging.getLogger(name).removeHandler(_queue_handlers.pop(name))
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+
+atexit.register(shutdown)
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Run Profiler
+Wraps each top-level run phase in cProfile and tracemalloc and writes, per
+phase, a ``.pstats`` file (open with ``python -m pstats`` or snakeviz) and a
+top-allocations report, plus a summary of time and peak memory per phase.
+"""
+
+import cProfile
+import io
+import os
+import pstats
+import re
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Iterator, List, Tuple
+
+
+class PhaseProfiler:
+    """Profiles only the outermost active phase; nested phases fold into it."""
+
+    def __init__(self, output_dir: str, top_allocations: int = 25, top_functions: int = 30):
+        self.output_dir = output_dir
+        self.top_allocations = top_allocations
+        self.top_functions = top_functions
+        self.results: List[Tuple[str, float, int, int]] = []
+        self._depth = 0
+        os.makedirs(output_dir, exist_ok=True)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        if self._depth:
+            self._depth += 1
+            try:
+                yield
+            finally:
+                self._depth -= 1
+            return
+
+        self._depth = 1
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start(10)
+        tracemalloc.reset_peak()
+        before = tracemalloc.take_snapshot()
+        profile = cProfile.Profile()
+        start = time.perf_counter()
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            elapsed = time.perf_counter() - start
+            after = tracemalloc.take_snapshot()
+            _, peak = tracemalloc.get_traced_memory()
+            if started_tracing:
+                tracemalloc.stop()
+            self._depth = 0
+            self._write_phase(name, profile, before, after, elapsed, peak)
+
+    def _write_phase(self, name, profile, before, after, elapsed: float, peak: int) -> None:
+        index = len(self.results) + 1
+        stem = os.path.join(self.output_dir, f"{index:02d}-{re.sub(r'[^A-Za-z0-9_.-]+', '_', name)}")
+        profile.dump_stats(f'{stem}.pstats')
+
+        report = io.StringIO()
+        stats = pstats.Stats(profile, stream=report)
+        stats.sort_stats('cumulative').print_stats(self.top_functions)
+
+        differences = after.compare_to(before, 'lineno')
+        allocated = sum(diff.size_diff for diff in differences if diff.size_diff > 0)
+        with open(f'{stem}.txt', 'w', encoding='utf-8') as file:
+            file.write(f'Phase: {name}\nWall time: {elapsed:.4f}s\nPeak traced memory: {peak / 1024:.1f} KiB\n')
+            file.write(f'\nTop {self.top_allocations} allocation sites (net growth during the phase):\n')
+            for diff in differences[:self.top_allocations]:
+                file.write(f'  {diff}\n')
+            file.write(f'\nTop {self.top_functions} functions by cumulative time:\n')
+            file.write(report.getvalue())
+        self.results.append((name, elapsed, peak, allocated))
+
+    def write_summary(self) -> str:
+        """Write ``summary.txt`` with one line per phase and return its path."""
+        path = os.path.join(self.output_dir, 'summary.txt')
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write(f"{'phase':<24} {'seconds':>9} {'peak KiB':>10} {'net KiB':>10}\n")
+            for name, elapsed, peak, allocated in self.results:
+                file.write(f'{name:<24} {elapsed:>9.4f} {peak / 1024:>10.1f} {allocated / 1024:>10.1f}\n')
+        return path
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Stargazer Tracker
+Follows each repository's stargazers in ``STARRED_AT`` order and remembers
+the GraphQL cursor of the newest star seen, so every run pages only the stars
+added since the previous one. Repositories whose star count is unchanged are
+not queried at all, and the rest are paged together in aliased batches.
+"""
+
+from datetime import date, timedelta
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from profile_cache import load_json, save_json
+
+STARGAZERS_FIELDS = """
+  r{index}: repository(owner: $owner{index}, name: $name{index}) {{
+    stargazers(first: 100, after: $cursor{index}, orderBy: {{field: STARRED_AT, direction: ASC}}) {{
+      totalCount
+      pageInfo {{ hasNextPage endCursor }}
+      edges {{ starredAt }}
+    }}
+  }}"""
+
+
+def stargazers_query(count: int) -> str:
+    """One query for the next stargazer page of ``count`` repositories.
+
+    Repository ``i`` is aliased ``r{i}`` and reads the variables
+    ``owner{i}``, ``name{i}`` and ``cursor{i}``.
+    """
+    parameters = ', '.join(
+        f'$owner{index}: String!, $name{index}: String!, $cursor{index}: String' for index in range(count)
+    )
+    fields = ''.join(STARGAZERS_FIELDS.format(index=index) for index in range(count))
+    return f'query Stargazers({parameters}) {{{fields}\n}}\n'
+
+
+# fetch_page(owner, name, cursor) returns the ``stargazers`` connection or None.
+PageFetcher = Callable[[str, str, Optional[str]], Optional[Dict[str, Any]]]
+# fetch_batch([(owner, name, cursor), ...]) returns one connection (or None) per
+# repository, or None when the whole request failed.
+BatchFetcher = Callable[[Sequence[Tuple[str, str, Optional[str]]]], Optional[List[Optional[Dict[str, Any]]]]]
+
+
+class StargazerTracker:
+    """Per-repository stargazer cursors and recent daily star counts."""
+
+    def __init__(self, path: Optional[str], retention_days: int = 90, max_pages: int = 50):
+        self.path = path
+        self.retention_days = retention_days
+        self.max_pages = max_pages
+        # full_name -> {'cursor': str|None, 'count': int, 'daily': {iso date: stars}}
+        self.repos: Dict[str, Dict[str, Any]] = {}
+        if path:
+            self.repos = load_json(path, {}).get('repos', {})
+
+    def needs_sync(self, full_name: str, star_count: int) -> bool:
+        """Return True when the listing's star count differs from the tracked one.
+
+        An untracked repository without stars has nothing to page yet.
+        """
+        state = self.repos.get(full_name)
+        if state is None:
+            return star_count > 0
+        return state.get('count') != star_count
+
+    def _state(self, full_name: str) -> Dict[str, Any]:
+        return self.repos.setdefault(full_name, {'cursor': None, 'count': 0, 'daily': {}})
+
+    @staticmethod
+    def _record_page(state: Dict[str, Any], connection: Dict[str, Any], star_count: int) -> Tuple[int, bool]:
+        """Count one page into ``state``; return the stars added and whether it was the last page."""
+        added = 0
+        for edge in connection.get('edges') or []:
+            starred_on = (edge.get('starredAt') or '')[:10]
+            if starred_on:
+                state['daily'][starred_on] = state['daily'].get(starred_on, 0) + 1
+                added += 1
+        page_info = connection.get('pageInfo') or {}
+        if page_info.get('endCursor'):
+            state['cursor'] = page_info['endCursor']
+        if page_info.get('hasNextPage'):
+            return added, False
+        state['count'] = int(connection.get('totalCount', star_count) or 0)
+        return added, True
+
+    def sync(self, full_name: str, star_count: int, fetch_page: PageFetcher) -> Optional[int]:
+        """Page stargazers added after the stored cursor; return how many were new.
+
+        Returns None when a page could not be fetched; the cursor then stays at
+        the last fully recorded page so the next run resumes from there.
+        """
+        owner, _, name = full_name.partition('/')
+        state = self._state(full_name)
+        added = 0
+        for _ in range(self.max_pages):
+            connection = fetch_page(owner, name, state.get('cursor'))
+            if connection is None:
+                return None
+            new, done = self._record_page(state, connection, star_count)
+            added += new
+            if done:
+                break
+        return added
+
+    def sync_batch(
+        self, star_counts: Dict[str, int], fetch_batch: BatchFetcher
+    ) -> Optional[Tuple[int, List[str]]]:
+        """Page several repositories together, one ``fetch_batch`` call per round.
+
+        Each round asks for the next page of every repository that still has
+        one. Returns the stars added and the repositories that did not catch
+        up: those missing from an answer, or still paging after ``max_pages``
+        rounds. Their cursors are kept, so the next run resumes them. Returns
+        None when a round failed; pages recorded before it keep their
+        cursors, as in ``sync``.
+        """
+        pending = dict(star_counts)
+        unfinished: List[str] = []
+        added = 0
+        for _ in range(self.max_pages):
+            if not pending:
+                break
+            names = list(pending)
+            pages = []
+            for full_name in names:
+                owner, _, name = full_name.partition('/')
+                pages.append((owner, name, self._state(full_name).get('cursor')))
+            connections = fetch_batch(pages)
+            if connections is None:
+                return None
+            for full_name, connection in zip(names, connections):
+                if connection is None:
+                    del pending[full_name]
+                    unfinished.append(full_name)
+                    continue
+                new, done = self._record_page(self.repos[full_name], connection, pending[full_name])
+                added += new
+                if done:
+                    del pending[full_name]
+        unfinished.extend(pending)
+        return added, unfinished
+
+    def forget_missing(self, full_names) -> None:
+        """Drop repositories that no longer appear in the listing."""
+        keep = set(full_names)
+        for full_name in list(self.repos):
+            if full_name not in keep:
+                del self.repos[full_name]
+
+    def gained(self, today: date, days: int = 7) -> Dict[str, int]:
+        """Return stars gained per repository over the last ``days`` days."""
+        since = (today - timedelta(days=days - 1)).isoformat()
+        growth = {}
+        for full_name, state in self.repos.items():
+            stars = sum(count for day, count in state.get('daily', {}).items() if day >= since)
+            if stars:
+                growth[full_name] = stars
+        return growth
+
+    def prune(self, today: date) -> None:
+        """Forget daily counts older than the retention window."""
+        cutoff = (today - timedelta(days=self.retention_days)).isoformat()
+        for state in self.repos.values():
+            state['daily'] = {day: count for day, count in state.get('daily', {}).items() if day >= cutoff}
+
+    def save(self) -> None:
+        if self.path:
+            save_json(self.path, {'repos': self.repos})
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Stats History
+Appends every published statistic to a local SQLite time series so trends
+(week-over-week growth, all-time highs) are instant local lookups.
+"""
+
+import sqlite3
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Tuple
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS metrics (
+    user   TEXT    NOT NULL,
+    metric TEXT    NOT NULL,
+    date   TEXT    NOT NULL,
+    value  INTEGER NOT NULL,
+    PRIMARY KEY (user, metric, date)
+) WITHOUT ROWID
+"""
+
+
+class StatsHistory:
+    """WAL-mode SQLite store keyed by (user, metric, date)."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        self.connection.execute(SCHEMA)
+        self.connection.commit()
+
+    def __enter__(self) -> 'StatsHistory':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        # Fold the WAL back into the main file so the committed database is self-contained.
+        self.connection.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+        self.connection.close()
+
+    def record_snapshot(self, user: str, day: date, values: Dict[str, Optional[int]]) -> int:
+        """Write one run's values in a single transaction; re-runs on the same day overwrite."""
+        rows = [
+            (user, metric, day.isoformat(), int(value))
+            for metric, value in values.items()
+            if value is not None
+        ]
+        with self.connection:
+            self.connection.executemany(
+                'INSERT OR REPLACE INTO metrics (user, metric, date, value) VALUES (?, ?, ?, ?)',
+                rows,
+            )
+        return len(rows)
+
+    def value_on(self, user: str, metric: str, day: date) -> Optional[int]:
+        """Return the latest value recorded on or before ``day``."""
+        row = self.connection.execute(
+            'SELECT value FROM metrics WHERE user = ? AND metric = ? AND date <= ? '
+            'ORDER BY date DESC LIMIT 1',
+            (user, metric, day.isoformat()),
+        ).fetchone()
+        return row[0] if row else None
+
+    def growth(self, user: str, metric: str, today: date, days: int = 7) -> Optional[int]:
+        """Return the change over the last ``days`` days, e.g. week-over-week growth."""
+        current = self.value_on(user, metric, today)
+        previous = self.value_on(user, metric, today - timedelta(days=days))
+        if current is None or previous is None:
+            return None
+        return current - previous
+
+    def all_time_high(self, user: str, metric: str) -> Optional[Tuple[int, str]]:
+        """Return the highest value ever recorded and the first date it was reached."""
+        row = self.connection.execute(
+            'SELECT value, date FROM metrics WHERE user = ? AND metric = ? '
+            'ORDER BY value DESC, date ASC LIMIT 1',
+            (user, metric),
+        ).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def series(self, user: str, metric: str, since: Optional[date] = None) -> List[Tuple[str, int]]:
+        """Return (date, value) pairs in date order, optionally from ``since``."""
+        return self.connection.execute(
+            'SELECT date, value FROM metrics WHERE user = ? AND metric = ? AND date >= ? ORDER BY date',
+            (user, metric, since.isoformat() if since else ''),
+        ).fetchall()
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Streak History
+Tracks every contribution streak as a run-length segment (start day, length)
+so each new day is an O(1) update and the longest streak, streak starts and
+streak count never require rescanning years of days.
+"""
+
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from contribution_analytics import ContributionSeries
+from profile_cache import load_json, save_json
+
+
+class StreakHistory:
+    """Run-length encoded active-day segments with an incremental longest pointer."""
+
+    def __init__(self):
+        # Each segment is [start ordinal, length in days].
+        self.segments: List[List[int]] = []
+        self.last_day: Optional[int] = None
+        self.last_active = False
+        self.longest_index: Optional[int] = None
+        # Oldest day observed, and whether that reaches the account's first year.
+        self.first_day: Optional[int] = None
+        self.backfilled = False
+
+    @classmethod
+    def from_series(cls, series: ContributionSeries) -> 'StreakHistory':
+        """Build the history in one pass over a series' activity mask."""
+        history = cls()
+        if series.epoch is None:
+            return history
+        mask = series.active_mask()
+        base = series.epoch.toordinal()
+        position = 0
+        for run in mask.split(b'\x00'):
+            if run:
+                history._append_segment(base + position, len(run))
+            position += len(run) + 1
+        history.first_day = base
+        history.last_day = base + len(mask) - 1
+        history.last_active = bool(mask and mask[-1])
+        return history
+
+    def _append_segment(self, start: int, length: int) -> None:
+        self.segments.append([start, length])
+        self._consider_longest(len(self.segments) - 1)
+
+    def _consider_longest(self, index: int) -> None:
+        if self.longest_index is None or self.segments[index][1] > self.segments[self.longest_index][1]:
+            self.longest_index = index
+
+    def observe(self, day: date, count: int) -> None:
+        """Record one day's count; days must arrive in order, the newest may be revised."""
+        ordinal = day.toordinal()
+        active = count > 0
+        if self.last_day is not None and ordinal < self.last_day:
+            raise ValueError(f'Days must arrive in order: {day} precedes the last observed day')
+
+        if self.last_day is not None and ordinal == self.last_day:
+            # Revision of the newest day, e.g. today's count grew since the last run.
+            if active and not self.last_active:
+                self.last_day -= 1
+                self.last_active = bool(self.segments) and self.segments[-1][0] + self.segments[-1][1] - 1 == self.last_day
+            elif not active and self.last_active:
+                self.segments[-1][1] -= 1
+                if not self.segments[-1][1]:
+                    self.segments.pop()
+                self._recompute_longest()
+                self.last_active = False
+                return
+            else:
+                return
+
+        if self.first_day is None:
+            self.first_day = ordinal
+        contiguous = self.last_day is not None and ordinal == self.last_day + 1
+        if active:
+            if contiguous and self.last_active:
+                self.segments[-1][1] += 1
+                self._consider_longest(len(self.segments) - 1)
+            else:
+                self._append_segment(ordinal, 1)
+        self.last_day = ordinal
+        self.last_active = active
+
+    def rewind(self, day: date) -> None:
+        """Forget ``day`` and every later day so they can be observed again."""
+        cut = day.toordinal()
+        if self.last_day is None or cut > self.last_day:
+            return
+        while self.segments and self.segments[-1][0] >= cut:
+            self.segments.pop()
+        if self.segments and self.segments[-1][0] + self.segments[-1][1] > cut:
+            self.segments[-1][1] = cut - self.segments[-1][0]
+        self.last_day = cut - 1
+        self.last_active = bool(self.segments) and self.segments[-1][0] + self.segments[-1][1] == cut
+        self._recompute_longest()
+
+    def _recompute_longest(self) -> None:
+        # Only reached when recent days are revised; rare, so O(n) is fine.
+        self.longest_index = max(
+            range(len(self.segments)),
+            key=lambda index: (self.segments[index][1], -index),
+            default=None,
+        )
+
+    def longest(self) -> Tuple[int, Optional[date], Optional[date]]:
+        """Return the longest streak's length, first day and last day."""
+        if self.longest_index is None:
+            return 0, None, None
+        start, length = self.segments[self.longest_index]
+        return length, date.fromordinal(start), date.fromordinal(start + length - 1)
+
+    def current(self, today: date) -> int:
+        """Return the streak ending today, or yesterday while today is still empty."""
+        if not self.segments:
+            return 0
+        start, length = self.segments[-1]
+        end = start + length - 1
+        return length if end >= today.toordinal() - 1 else 0
+
+    def count(self) -> int:
+        """Return how many separate streaks have been recorded."""
+        return len(self.segments)
+
+    def starts(self) -> List[date]:
+        """Return the first day of every streak, oldest first."""
+        return [date.fromordinal(start) for start, _ in self.segments]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'segments': [[date.fromordinal(start).isoformat(), length] for start, length in self.segments],
+            'last_date': date.fromordinal(self.last_day).isoformat() if self.last_day else None,
+            'last_active': self.last_active,
+            'first_date': date.fromordinal(self.first_day).isoformat() if self.first_day else None,
+            'backfilled': self.backfilled,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'StreakHistory':
+        history = cls()
+        for start, length in data.get('segments', []):
+            history._append_segment(date.fromisoformat(start).toordinal(), int(length))
+        if data.get('last_date'):
+            history.last_day = date.fromisoformat(data['last_date']).toordinal()
+        history.last_active = bool(data.get('last_active'))
+        if data.get('first_date'):
+            history.first_day = date.fromisoformat(data['first_date']).toordinal()
+        elif history.segments:
+            history.first_day = history.segments[0][0]
+        history.backfilled = bool(data.get('backfilled'))
+        return history
+
+    @classmethod
+    def load(cls, path: Optional[str]) -> 'StreakHistory':
+        return cls.from_dict(load_json(path, {})) if path else cls()
+
+    def save(self, path: Optional[str]) -> None:
+        if path:
+            save_json(path, self.to_dict())
+
+    def sync(self, series: ContributionSeries, rescan_days: int = 7) -> 'StreakHistory':
+        """Feed the days of ``series`` newer than the history, one O(1) step each.
+
+        The last ``rescan_days`` observed days are replayed too, since GitHub
+        may still add contributions to them after a run has seen them. When
+        the series starts after the newest observed day, the missing days are
+        treated as inactive and the older segments are kept, so a backfilled
+        history stays backfilled. Returns a rebuilt history when the series
+        covers everything observed so far.
+        """
+        if series.epoch is None:
+            return self
+        epoch = series.epoch.toordinal()
+        if self.last_day is None:
+            return StreakHistory.from_series(series)
+        if epoch > self.last_day:
+            start = epoch
+        else:
+            start = max(self.last_day - max(rescan_days, 1) + 1, epoch)
+            if self.first_day is None or start <= self.first_day:
+                rebuilt = StreakHistory.from_series(series)
+                rebuilt.backfilled = self.backfilled
+                return rebuilt
+            self.rewind(date.fromordinal(start))
+        current = date.fromordinal(start)
+        end = series.last_date
+        while current <= end:
+            self.observe(current, series.get(current))
+            current += timedelta(days=1)
+        return self
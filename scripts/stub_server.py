@@ -0,0 +1,598 @@
+#!/usr/bin/env python3
+"""
+Stub Upstream Server
+A local stand-in for the GitHub REST/GraphQL APIs, the GitHub contributions
+page, WakaTime and the quote API, so the whole pipeline can run (and be
+benchmarked) on an offline machine. Responses are generated deterministically
+from a ``StubDataset`` and support pagination, ETags, rate-limit headers,
+injected latency and per-route faults (delays, 5xx responses, truncated
+bodies and connection resets).
+
+    python scripts/stub_server.py --repos 1000 --streak-days 365
+
+prints the environment variables that point ``daily_update.py`` at it.
+"""
+
+import argparse
+import contextlib
+import hashlib
+import json
+import os
+import random
+import socket
+import struct
+import sys
+import threading
+import time
+from datetime import date, datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+LANGUAGES = ['Python', 'TypeScript', 'JavaScript', 'Go', 'Rust', 'C++', 'Jupyter Notebook', 'Shell']
+EDITORS = ['VS Code', 'PyCharm', 'Vim']
+
+
+class StubDataset:
+    """Deterministic synthetic profile data for one user."""
+
+    def __init__(
+        self,
+        username: str = 'Rayyan9477',
+        repos: int = 30,
+        streak_days: int = 30,
+        followers: int = 120,
+        today: Optional[date] = None,
+        seed: int = 7,
+    ):
+        self.username = username
+        self.user_id = 1000
+        self.streak_days = streak_days
+        self.today = today or datetime.now(timezone.utc).date()
+        self.seed = seed
+        rng = random.Random(seed)
+
+        self.repos: List[Dict[str, Any]] = []
+        for index in range(repos):
+            stars = int(rng.paretovariate(1.2)) - 1
+            pushed = self.today - timedelta(days=rng.randrange(0, 900))
+            self.repos.append({
+                'id': 10_000 + index,
+                'name': f'repo-{index:04d}',
+                'full_name': f'{username}/repo-{index:04d}',
+                'fork': index % 10 == 9,
+                'description': f'Synthetic repository number {index}',
+                'stargazers_count': stars,
+                'forks_count': stars // 3,
+                'pushed_at': f'{pushed.isoformat()}T12:00:00Z',
+                'languages': {
+                    language: rng.randrange(1_000, 500_000)
+                    for language in rng.sample(LANGUAGES, rng.randrange(1, 4))
+                },
+            })
+        self.followers = [
+            {'databaseId': 50_000 + index, 'login': f'follower{index:05d}'}
+            for index in range(followers)
+        ][::-1]  # GraphQL lists newest followers first
+
+    @property
+    def total_stars(self) -> int:
+        return sum(repo['stargazers_count'] for repo in self.repos)
+
+    def contributions(self, day: date) -> int:
+        """Active every day of the current streak, zero the day before it."""
+        age = (self.today - day).days
+        if age < 0:
+            return 0
+        if age < self.streak_days:
+            return 1 + (day.toordinal() * 7 + self.seed) % 5
+        if age == self.streak_days:
+            return 0
+        return (day.toordinal() * 13 + self.seed) % 6 // 2
+
+    def user(self) -> Dict[str, Any]:
+        return {
+            'login': self.username,
+            'id': self.user_id,
+            'followers': len(self.followers),
+            'following': 12,
+            'public_repos': len(self.repos),
+        }
+
+    def wakatime_day(self, day: date) -> Dict[str, Any]:
+        rng = random.Random(day.toordinal() * 31 + self.seed)
+        languages = [
+            {'name': name, 'total_seconds': rng.randrange(0, 7200)}
+            for name in LANGUAGES[:4]
+        ]
+        total = sum(item['total_seconds'] for item in languages)
+        return {
+            'range': {'date': day.isoformat()},
+            'grand_total': {'total_seconds': total},
+            'languages': languages,
+            'editors': [{'name': EDITORS[day.toordinal() % len(EDITORS)], 'total_seconds': total}],
+            'projects': [{'name': self.repos[0]['name'] if self.repos else 'misc', 'total_seconds': total}],
+        }
+
+
+class Fault:
+    """A failure injected into a route's responses.
+
+    ``kind`` is ``delay`` (sleep ``delay`` seconds, then answer normally),
+    ``error`` (answer with ``status``), ``partial`` (send the headers and only
+    half of the body, then close) or ``reset`` (abort the connection with a
+    TCP reset before answering). Each request is hit with ``probability``.
+    """
+
+    KINDS = ('delay', 'error', 'partial', 'reset')
+
+    def __init__(self, kind: str, probability: float = 1.0, delay: float = 0.0, status: int = 503):
+        if kind not in self.KINDS:
+            raise ValueError(f'Unknown fault kind: {kind}')
+        self.kind = kind
+        self.probability = probability
+        self.delay = delay
+        self.status = status
+
+    def __repr__(self) -> str:
+        return f'Fault({self.kind!r}, probability={self.probability}, delay={self.delay}, status={self.status})'
+
+
+class _StubHTTPServer(ThreadingHTTPServer):
+    # socketserver's default backlog of 5 drops SYNs under parallel fetches,
+    # which shows up as one-second retransmit stalls in the client.
+    request_queue_size = 128
+    daemon_threads = True
+
+    def handle_error(self, request, client_address) -> None:
+        # Clients that hang up mid-request are expected under fault injection.
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+class StubServer:
+    """Threaded HTTP server serving a ``StubDataset`` under per-service prefixes.
+
+    ``latency`` delays every response; ``route_latency`` overrides it per
+    route name (``user``, ``repos``, ``languages``, ``events``, ``graphql``,
+    ``contributions``, ``wakatime``, ``quote``). ``faults`` maps route names
+    to a ``Fault``; it may be replaced between runs, and ``fault_seed`` makes
+    probabilistic faults repeatable.
+    """
+
+    def __init__(
+        self,
+        dataset: Optional[StubDataset] = None,
+        latency: float = 0.0,
+        route_latency: Optional[Dict[str, float]] = None,
+        rate_limit: int = 5000,
+        host: str = '127.0.0.1',
+        port: int = 0,
+        faults: Optional[Dict[str, Fault]] = None,
+        fault_seed: int = 0,
+    ):
+        self.dataset = dataset or StubDataset()
+        self.latency = latency
+        self.route_latency = dict(route_latency or {})
+        self.faults: Dict[str, Fault] = dict(faults or {})
+        self._fault_rng = random.Random(fault_seed)
+        self.rate_limit = rate_limit
+        self.remaining = {'core': rate_limit, 'graphql': rate_limit}
+        self.reset_at = int(time.time()) + 3600
+        self.requests: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._httpd = _StubHTTPServer((host, port), _Handler)
+        self._httpd.stub = self
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def env(self) -> Dict[str, str]:
+        """Environment variables that point the updaters at this server."""
+        return {
+            'GITHUB_API_URL': f'{self.base_url}/api',
+            'GITHUB_WEB_URL': f'{self.base_url}/web',
+            'WAKATIME_API_URL': f'{self.base_url}/wakatime/api/v1',
+            'QUOTES_API_URL': f'{self.base_url}/quotes/random',
+        }
+
+    def start(self) -> 'StubServer':
+        self._thread = threading.Thread(target=self._httpd.serve_forever, args=(0.05,), daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def serve_forever(self) -> None:
+        """Serve in the calling thread until interrupted."""
+        try:
+            self._httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._httpd.server_close()
+
+    def __enter__(self) -> 'StubServer':
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def record(self, entry: Dict[str, Any]) -> None:
+        with self._lock:
+            self.requests.append(entry)
+
+    def pick_fault(self, route: str) -> Optional[Fault]:
+        """Return the fault to apply to this request to ``route``, if any."""
+        fault = self.faults.get(route)
+        if fault is None:
+            return None
+        with self._lock:
+            hit = self._fault_rng.random() < fault.probability
+        return fault if hit else None
+
+    def consume(self, resource: str, charge: bool = True) -> Tuple[bool, Dict[str, str]]:
+        """Spend one rate-limit point unless ``charge`` is False; return (allowed, headers).
+
+        Like GitHub, a conditional request answered with 304 is not charged.
+        """
+        with self._lock:
+            allowed = self.remaining[resource] > 0
+            if allowed and charge:
+                self.remaining[resource] -= 1
+            remaining = self.remaining[resource]
+        return allowed, {
+            'X-RateLimit-Limit': str(self.rate_limit),
+            'X-RateLimit-Remaining': str(remaining),
+            'X-RateLimit-Used': str(self.rate_limit - remaining),
+            'X-RateLimit-Reset': str(self.reset_at),
+            'X-RateLimit-Resource': resource,
+        }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass  # Keep benchmark and test output clean
+
+    @property
+    def stub(self) -> StubServer:
+        return self.server.stub
+
+    def do_GET(self) -> None:
+        self._dispatch('GET')
+
+    def do_POST(self) -> None:
+        self._dispatch('POST')
+
+    def _dispatch(self, method: str) -> None:
+        started = time.perf_counter()
+        parts = urlsplit(self.path)
+        query = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+        body = b''
+        if method == 'POST':
+            body = self.rfile.read(int(self.headers.get('Content-Length', 0) or 0))
+
+        route, status, payload, headers = self._route(method, parts.path, query, body)
+        fault = self.stub.pick_fault(route)
+        delay = self.stub.route_latency.get(route, self.stub.latency)
+        if fault and fault.kind == 'delay':
+            delay += fault.delay
+        if delay:
+            time.sleep(delay)
+
+        if fault and fault.kind == 'reset':
+            self._reset()
+            status, sent = 0, 0
+        else:
+            if fault and fault.kind == 'error':
+                status, payload = fault.status, {'message': 'Injected upstream failure'}
+            sent = self._send(
+                status, payload, headers,
+                truncate=bool(fault and fault.kind == 'partial'),
+                resource=self._rate_limit_resource(parts.path),
+            )
+        self.stub.record({
+            'method': method,
+            'path': parts.path,
+            'route': route,
+            'status': status,
+            'bytes': sent,
+            'seconds': time.perf_counter() - started,
+            'fault': fault.kind if fault else None,
+        })
+
+    def _reset(self) -> None:
+        """Close the connection with an RST instead of a response."""
+        self.connection.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack('ii', 1, 0))
+        self.connection.close()
+        self.close_connection = True
+
+    @staticmethod
+    def _rate_limit_resource(path: str) -> Optional[str]:
+        """The rate-limit bucket ``path`` draws from; None outside the GitHub API."""
+        segments = [segment for segment in path.split('/') if segment]
+        if segments[:1] != ['api']:
+            return None
+        return 'graphql' if segments[1:] == ['graphql'] else 'core'
+
+    def _send(
+        self,
+        status: int,
+        payload: Any,
+        headers: Dict[str, str],
+        truncate: bool = False,
+        resource: Optional[str] = None,
+    ) -> int:
+        if isinstance(payload, (bytes, str)):
+            data = payload.encode('utf-8') if isinstance(payload, str) else payload
+            content_type = headers.pop('Content-Type', 'text/html; charset=utf-8')
+        else:
+            data = json.dumps(payload).encode('utf-8')
+            content_type = 'application/json; charset=utf-8'
+
+        if status == 200 and self.command == 'GET':
+            etag = f'W/"{hashlib.sha1(data).hexdigest()}"'
+            headers['ETag'] = etag
+            if self.headers.get('If-None-Match') == etag:
+                status, data = 304, b''
+        if resource is not None:
+            headers.update(self.stub.consume(resource, charge=status != 304)[1])
+
+        if truncate:
+            # Content-Length promises the whole body; the client sees it cut short.
+            body = data[:len(data) // 2]
+            self.close_connection = True
+        else:
+            body = data
+        try:
+            self.send_response(status)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(data)))
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            # The client gave up (timeout, or a reset on a pooled connection).
+            self.close_connection = True
+            return 0
+        return len(body)
+
+    def _route(self, method: str, path: str, query: Dict[str, str], body: bytes):
+        dataset = self.stub.dataset
+        segments = [segment for segment in path.split('/') if segment]
+
+        if segments[:1] == ['quotes']:
+            return 'quote', 200, {'content': 'Make it work, make it right, make it fast.', 'author': 'Kent Beck'}, {}
+
+        if segments[:3] == ['wakatime', 'api', 'v1']:
+            return ('wakatime',) + self._wakatime(segments[3:], query)
+
+        if segments[:1] == ['web'] and segments[1:2] == ['users'] and segments[3:] == ['contributions']:
+            return 'contributions', 200, self._contributions_html(), {}
+
+        if segments[:1] != ['api']:
+            return 'unknown', 404, {'message': 'Not Found'}, {}
+
+        segments = segments[1:]
+        resource = self._rate_limit_resource(path)
+        # Points are charged in ``_send``, once it is known whether the answer is a 304.
+        if not self.stub.consume(resource, charge=False)[0]:
+            return resource, 403, {'message': 'API rate limit exceeded'}, {}
+        headers: Dict[str, str] = {}
+
+        if method == 'POST' and segments == ['graphql']:
+            return ('graphql',) + self._graphql(json.loads(body or b'{}'), headers)
+        if segments == ['user'] or (segments[:1] == ['users'] and len(segments) == 2):
+            return 'user', 200, dataset.user(), headers
+        if segments[:1] == ['users'] and segments[2:] == ['repos']:
+            return ('repos',) + self._repos(query, headers)
+        if segments[:1] == ['users'] and segments[2:] == ['events', 'public']:
+            headers['X-Poll-Interval'] = '60'
+            return 'events', 200, [{'id': '1001', 'type': 'PushEvent'}], headers
+        if segments[:1] == ['repos'] and segments[3:] == ['languages']:
+            full_name = '/'.join(segments[1:3])
+            for repo in dataset.repos:
+                if repo['full_name'] == full_name:
+                    return 'languages', 200, repo['languages'], headers
+            return 'languages', 404, {'message': 'Not Found'}, headers
+        return 'unknown', 404, {'message': 'Not Found'}, headers
+
+    def _repos(self, query: Dict[str, str], headers: Dict[str, str]):
+        per_page = min(int(query.get('per_page', 30)), 100)
+        page = max(int(query.get('page', 1)), 1)
+        repos = self.stub.dataset.repos
+        chunk = repos[(page - 1) * per_page:page * per_page]
+        if page * per_page < len(repos):
+            headers['Link'] = f'<{self.stub.base_url}/api/users/{self.stub.dataset.username}/repos?page={page + 1}&per_page={per_page}>; rel="next"'
+        public_fields = ('id', 'name', 'full_name', 'fork', 'description', 'stargazers_count', 'forks_count', 'pushed_at')
+        return 200, [{field: repo[field] for field in public_fields} for repo in chunk], headers
+
+    def _profile_summary(self, text: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+        """Contribution totals and/or one repository page, as the contributions fetcher asks."""
+        dataset = self.stub.dataset
+        user: Dict[str, Any] = {}
+        if 'totalCommitContributions' in text:
+            year_start = dataset.today.replace(month=1, day=1)
+            this_year = sum(
+                dataset.contributions(year_start + timedelta(days=offset))
+                for offset in range((dataset.today - year_start).days + 1)
+            )
+            user['contributionsCollection'] = {
+                'contributionCalendar': {'totalContributions': this_year},
+                'restrictedContributionsCount': 0,
+                'totalCommitContributions': this_year * 3 // 4,
+                'totalIssueContributions': this_year // 20,
+                'totalPullRequestContributions': this_year // 10,
+                'totalPullRequestReviewContributions': this_year // 20,
+            }
+            user['followers'] = {'totalCount': len(dataset.followers)}
+        if 'repositories(' in text:
+            offset = int(variables.get('cursor') or 0)
+            chunk = dataset.repos[offset:offset + 100]
+            user['repositories'] = {
+                'totalCount': len(dataset.repos),
+                'pageInfo': {'hasNextPage': offset + 100 < len(dataset.repos), 'endCursor': str(offset + len(chunk))},
+                'nodes': [{
+                    'stargazerCount': repo['stargazers_count'],
+                    'forkCount': repo['forks_count'],
+                    'languages': {'edges': [
+                        {'size': size, 'node': {'name': name}} for name, size in repo['languages'].items()
+                    ]},
+                } for repo in chunk],
+            }
+        return user
+
+    def _graphql(self, request: Dict[str, Any], headers: Dict[str, str]):
+        text = request.get('query', '')
+        variables = request.get('variables') or {}
+        dataset = self.stub.dataset
+
+        if 'totalCommitContributions' in text or 'repositories(' in text:
+            return 200, {'data': {'user': self._profile_summary(text, variables)}}, headers
+
+        if 'contributionsCollection' in text and 'contributionCalendar' in text:
+            start = date.fromisoformat(variables['from'][:10])
+            end = date.fromisoformat(variables['to'][:10])
+            days = []
+            current = start
+            while current <= end:
+                days.append({'date': current.isoformat(), 'contributionCount': dataset.contributions(current)})
+                current += timedelta(days=1)
+            weeks = [{'contributionDays': days[index:index + 7]} for index in range(0, len(days), 7)]
+            return 200, {'data': {'user': {'contributionsCollection': {
+                'contributionCalendar': {'totalContributions': sum(day['contributionCount'] for day in days), 'weeks': weeks},
+            }}}}, headers
+
+        if 'createdAt' in text:
+            created = dataset.today - timedelta(days=dataset.streak_days + 400)
+            return 200, {'data': {'user': {'createdAt': f'{created.isoformat()}T00:00:00Z'}}}, headers
+
+        if 'stargazers' in text:
+            # Aliased batches: r{i} reads owner{i}, name{i} and cursor{i}.
+            result = {}
+            index = 0
+            while f'owner{index}' in variables:
+                full_name = f"{variables[f'owner{index}']}/{variables[f'name{index}']}"
+                result[f'r{index}'] = self._stargazers(full_name, variables.get(f'cursor{index}'))
+                index += 1
+            return 200, {'data': result}, headers
+
+        if 'followers' in text:
+            offset = int(variables.get('cursor') or 0)
+            first = int(variables.get('first') or 100)
+            nodes = dataset.followers[offset:offset + first]
+            return 200, {'data': {'user': {'followers': {
+                'totalCount': len(dataset.followers),
+                'pageInfo': {'hasNextPage': offset + first < len(dataset.followers), 'endCursor': str(offset + len(nodes))},
+                'nodes': nodes,
+            }}}}, headers
+
+        return 200, {'errors': [{'message': 'Unsupported query in stub server'}]}, headers
+
+    def _stargazers(self, full_name: str, cursor: Optional[str]) -> Optional[Dict[str, Any]]:
+        dataset = self.stub.dataset
+        repo = next((repo for repo in dataset.repos if repo['full_name'] == full_name), None)
+        if repo is None:
+            return None
+        total = repo['stargazers_count']
+        offset = int(cursor or 0)
+        edges = [
+            {'starredAt': f"{(dataset.today - timedelta(days=total - index)).isoformat()}T08:00:00Z"}
+            for index in range(offset, min(offset + 100, total))
+        ]
+        return {'stargazers': {
+            'totalCount': total,
+            'pageInfo': {'hasNextPage': offset + 100 < total, 'endCursor': str(offset + len(edges)) if edges else None},
+            'edges': edges,
+        }}
+
+    def _wakatime(self, segments: List[str], query: Dict[str, str]):
+        dataset = self.stub.dataset
+        if segments[-1:] == ['summaries']:
+            start = date.fromisoformat(query['start'])
+            end = date.fromisoformat(query['end'])
+            days = []
+            current = start
+            while current <= end:
+                days.append(dataset.wakatime_day(current))
+                current += timedelta(days=1)
+            return 200, {'data': days}, {}
+        if segments == ['users', 'current']:
+            return 200, {'data': {'username': dataset.username, 'timezone': 'UTC'}}, {}
+        if segments[-1:] == ['durations']:
+            day = date.fromisoformat(query['date'])
+            start = datetime(day.year, day.month, day.day, 9, tzinfo=timezone.utc).timestamp()
+            return 200, {'data': [{'time': start, 'duration': 5400.0}, {'time': start + 14400, 'duration': 1800.0}]}, {}
+        return 404, {'error': 'Not found'}, {}
+
+    def _contributions_html(self) -> str:
+        dataset = self.stub.dataset
+        cells = []
+        tooltips = []
+        for offset in range(364, -1, -1):
+            day = dataset.today - timedelta(days=offset)
+            count = dataset.contributions(day)
+            cell_id = f'contribution-day-component-{day.weekday()}-{offset}'
+            cells.append(f'<td data-date="{day.isoformat()}" id="{cell_id}" data-level="{min(count, 4)}" class="ContributionCalendar-day"></td>')
+            label = f'{count} contribution{"s" if count != 1 else ""}' if count else 'No contributions'
+            tooltips.append(f'<tool-tip for="{cell_id}">{label} on {day.strftime("%B %d")}.</tool-tip>')
+        return '<table><tbody><tr>' + ''.join(cells) + '</tr></tbody></table>' + ''.join(tooltips)
+
+
+@contextlib.contextmanager
+def stub_environment(dataset: Optional[StubDataset] = None, **overrides: str) -> Iterator[StubServer]:
+    """Serve ``dataset`` and point the process environment at it until exit.
+
+    Placeholder credentials are set as well, so scripts that need a token take
+    their authenticated path against the stub; ``overrides`` adds or replaces
+    variables. The previous environment is restored afterwards.
+    """
+    with StubServer(dataset) as server:
+        values = dict(server.env(), GH_TOKEN='stub-token', WAKATIME_API_KEY='stub-key', **overrides)
+        saved = {name: os.environ.get(name) for name in values}
+        os.environ.update(values)
+        try:
+            yield server
+        finally:
+            for name, value in saved.items():
+                if value is None:
+                    os.environ.pop(name, None)
+                else:
+                    os.environ[name] = value
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve stub GitHub/WakaTime/quote APIs for offline runs.')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--repos', type=int, default=30)
+    parser.add_argument('--streak-days', type=int, default=30)
+    parser.add_argument('--followers', type=int, default=120)
+    parser.add_argument('--latency', type=float, default=0.0, help='seconds added to every response')
+    parser.add_argument(
+        '--fault', action='append', default=[], metavar='ROUTE=KIND',
+        help='inject a fault into a route, e.g. quote=reset or repos=error (repeatable)',
+    )
+    parser.add_argument('--fault-delay', type=float, default=5.0, help='seconds used by delay faults')
+    args = parser.parse_args()
+
+    faults = {}
+    for spec in args.fault:
+        route, _, kind = spec.partition('=')
+        faults[route] = Fault(kind, delay=args.fault_delay)
+    dataset = StubDataset(repos=args.repos, streak_days=args.streak_days, followers=args.followers)
+    server = StubServer(dataset, latency=args.latency, port=args.port, faults=faults)
+    for name, value in server.env().items():
+        print(f'export {name}={value}')
+    server.serve_forever()
+
+
+if __name__ == '__main__':
+    main()
@@ -1,16 +1,22 @@
 #!/usr/bin/env python3
 """
 Test script to verify GitHub contributions fetcher
+
+Runs against the local stub server by default; pass a token (or --live)
+to query the real GitHub API.
 """
 
 import os
 import sys
 
+LIVE = len(sys.argv) > 1
+
 # Set a test token if available
-if len(sys.argv) > 1:
+if LIVE and sys.argv[1] != '--live':
     os.environ['GITHUB_TOKEN'] = sys.argv[1]
 
 from fetch_github_contributions import GitHubContributionsFetcher
+from stub_server import stub_environment
 
 def main():
     print("=" * 60)
@@ -69,4 +75,8 @@ def main():
     print("=" * 60)
 
 if __name__ == "__main__":
-    main()
+    if LIVE:
+        main()
+    else:
+        with stub_environment():
+            main()
@@ -1,8 +1,12 @@
 #!/usr/bin/env python3
 """Focused regression tests for profile statistic updates."""
 
+import json
+import os
 import re
 import sys
+import tempfile
+import time
 import unittest
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
@@ -10,6 +14,28 @@ from unittest.mock import Mock, patch
 
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 from daily_update import DailyUpdater
+from adaptive_timeouts import LatencyBook, endpoint_key
+from calendar_file import CalendarFile, write_calendar
+from contribution_analytics import ContributionSeries
+from contribution_calendar import parse_contributions_html
+from stats_history import StatsHistory
+from stub_server import Fault, StubDataset, StubServer, stub_environment
+from benchmark_pipeline import compare as compare_benchmarks
+import chaos_harness
+import microbench
+from stargazer_tracker import StargazerTracker, stargazers_query
+from streak_history import StreakHistory
+from metrics_exporter import build_metrics
+from run_deadline import DeadlineExceeded, RunDeadline
+from run_profiler import PhaseProfiler
+from run_logging import configure_logger, shutdown as shutdown_logging
+from tracing import Tracer
+from trend_charts import bucket_weekly, series_digest, write_trend_charts
+from follower_sync import FOLLOWERS_QUERY, FollowerSync
+from fetch_github_contributions import GitHubContributionsFetcher
+from wakatime_analytics import WakaTimeAnalytics
+from wakatime_cache import WakaTimeDayCache
+from wakatime_heatmap import build_hour_heatmap, build_year_heatmap
 
 
 class ProfileStatsTests(unittest.TestCase):
@@ -80,7 +106,7 @@ class ProfileStatsTests(unittest.TestCase):
             }
             return response
 
-        updater = DailyUpdater.__new__(DailyUpdater)
+        updater = DailyUpdater(configure=False)
         updater.GH_TOKEN = 'test-token'
         updater.username = 'Rayyan9477'
         updater.log = lambda *args, **kwargs: None
@@ -93,7 +119,7 @@ class ProfileStatsTests(unittest.TestCase):
             self.assertEqual(post.call_count, 2)
 
     def test_failed_repository_page_does_not_publish_zero_stars(self):
-        updater = DailyUpdater.__new__(DailyUpdater)
+        updater = DailyUpdater(configure=False)
         updater.username = 'Rayyan9477'
         updater.log = lambda *args, **kwargs: None
         response = Mock(status_code=503)
@@ -114,6 +140,1272 @@ class ProfileStatsTests(unittest.TestCase):
         self.assertIn('C# &amp; .NET', card)
         self.assertIn('</svg>', card)
 
+    def test_language_card_shows_byte_shares(self):
+        card = DailyUpdater._build_languages_card({'Python': 750, 'TypeScript': 250})
+        self.assertIn('75.0%', card)
+        self.assertIn('25.0%', card)
+
+    def test_top_repos_card_is_skipped_when_ranking_is_unchanged(self):
+        updater = DailyUpdater(configure=False)
+        updater.log = lambda *args, **kwargs: None
+        updater._repo_index = {
+            f'octocat/repo{index}': {'stars': index % 4, 'pushed_at': f'2024-01-{index + 10}T00:00:00Z', 'description': '<b>'}
+            for index in range(8)
+        }
+        ranking = DailyUpdater._rank_repositories(updater._repo_index, 3)
+        self.assertEqual([repo['name'] for repo in ranking], ['repo7', 'repo3', 'repo6'])
+
+        with tempfile.TemporaryDirectory() as directory:
+            updater.cache_dir = directory
+            updater.readme_file = str(Path(directory) / 'README.md')
+            card = Path(directory) / 'assets' / 'github-top-repos.svg'
+            updater._write_top_repos_card()
+            self.assertIn('&lt;b&gt;', card.read_text(encoding='utf-8'))
+
+            card.write_text('sentinel', encoding='utf-8')
+            updater._write_top_repos_card()
+            self.assertEqual(card.read_text(encoding='utf-8'), 'sentinel')
+
+            updater._repo_index['octocat/repo0']['stars'] = 10
+            updater._write_top_repos_card()
+            self.assertIn('repo0', card.read_text(encoding='utf-8'))
+
+    def test_language_bytes_are_cached_by_pushed_at(self):
+        repos = [
+            {'full_name': 'Rayyan9477/app', 'pushed_at': '2026-08-01T00:00:00Z', 'fork': False},
+            {'full_name': 'Rayyan9477/lib', 'pushed_at': '2026-08-02T00:00:00Z', 'fork': False},
+            {'full_name': 'Rayyan9477/fork', 'pushed_at': '2026-08-03T00:00:00Z', 'fork': True},
+        ]
+        breakdowns = {
+            'Rayyan9477/app': {'Python': 900, 'TypeScript': 600},
+            'Rayyan9477/lib': {'Python': 100},
+        }
+
+        def fake_get(url, **kwargs):
+            response = Mock(status_code=200)
+            if '/languages' in url:
+                response.json.return_value = breakdowns[url.split('/repos/')[1][:-len('/languages')]]
+            else:
+                response.json.return_value = repos
+            return response
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            updater = DailyUpdater(configure=False)
+            updater.username = 'Rayyan9477'
+            updater.cache_dir = cache_dir
+            updater.dry_run = False
+            updater.log = lambda *args, **kwargs: None
+
+            with patch('daily_update.requests.get', side_effect=fake_get) as get:
+                self.assertEqual(
+                    updater._get_primary_languages({}),
+                    {'Python': 1000, 'TypeScript': 600},
+                )
+                self.assertEqual(get.call_count, 3)
+
+            repos[1]['pushed_at'] = '2026-08-05T00:00:00Z'
+            breakdowns['Rayyan9477/lib'] = {'Python': 300}
+            with patch('daily_update.requests.get', side_effect=fake_get) as get:
+                self.assertEqual(
+                    updater._get_primary_languages({}),
+                    {'Python': 1200, 'TypeScript': 600},
+                )
+                language_calls = [c for c in get.call_args_list if '/languages' in c.args[0]]
+                self.assertEqual(len(language_calls), 1)
+
+            cached = json.loads((Path(cache_dir) / 'languages.json').read_text(encoding='utf-8'))
+            self.assertEqual(set(cached['repos']), {'Rayyan9477/app', 'Rayyan9477/lib'})
+
+    def _cached_updater(self, cache_dir):
+        updater = DailyUpdater(configure=False)
+        updater.GH_TOKEN = 'test-token'
+        updater.username = 'Rayyan9477'
+        updater.cache_dir = cache_dir
+        updater.log = lambda *args, **kwargs: None
+        return updater
+
+    def test_unchanged_events_feed_costs_one_conditional_request(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            (Path(cache_dir) / 'events.json').write_text(
+                json.dumps({'etag': '"abc"', 'last_event_id': '42', 'next_poll_at': 0}),
+                encoding='utf-8',
+            )
+            updater = self._cached_updater(cache_dir)
+            response = Mock(status_code=304, headers={'ETag': '"abc"', 'X-Poll-Interval': '60'})
+
+            with patch('daily_update.requests.get', return_value=response) as get:
+                self.assertFalse(updater._check_public_activity())
+
+            self.assertEqual(get.call_count, 1)
+            self.assertEqual(get.call_args.kwargs['headers']['If-None-Match'], '"abc"')
+
+    def test_new_event_id_counts_as_activity(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            (Path(cache_dir) / 'events.json').write_text(
+                json.dumps({'etag': '"abc"', 'last_event_id': '42'}), encoding='utf-8'
+            )
+            updater = self._cached_updater(cache_dir)
+            response = Mock(status_code=200, headers={'ETag': '"def"'})
+            response.json.return_value = [{'id': '43'}]
+
+            with patch('daily_update.requests.get', return_value=response):
+                self.assertTrue(updater._check_public_activity())
+
+            updater._save_events_state()
+            state = json.loads((Path(cache_dir) / 'events.json').read_text(encoding='utf-8'))
+            self.assertEqual(state['last_event_id'], '43')
+            self.assertEqual(state['etag'], '"def"')
+
+    def test_unchanged_activity_rolls_cached_calendar_forward(self):
+        today = datetime.now(timezone.utc).date()
+        days = {
+            (today - timedelta(days=offset)).isoformat(): 0 if offset == 4 else 2
+            for offset in range(1, 8)
+        }
+        with tempfile.TemporaryDirectory() as cache_dir:
+            (Path(cache_dir) / 'calendar.json').write_text(
+                json.dumps({'days': days}), encoding='utf-8'
+            )
+            updater = self._cached_updater(cache_dir)
+            updater.activity_unchanged = True
+
+            with patch('daily_update.requests.post') as post, patch('daily_update.requests.get') as get:
+                self.assertEqual(updater._get_current_streak(), '3_Days')
+
+            post.assert_not_called()
+            get.assert_not_called()
+
+    def test_unchanged_activity_refetches_partial_or_stale_calendar(self):
+        today = datetime.now(timezone.utc).date()
+        for newest, count in ((1, 0), (3, 2)):
+            days = {
+                (today - timedelta(days=offset)).isoformat(): 0 if offset == newest else count or 2
+                for offset in range(newest, newest + 7)
+            }
+            with self.subTest(newest=newest), tempfile.TemporaryDirectory() as cache_dir:
+                (Path(cache_dir) / 'calendar.json').write_text(
+                    json.dumps({'days': days}), encoding='utf-8'
+                )
+                updater = self._cached_updater(cache_dir)
+                self.assertIsNone(updater._get_streak_from_calendar_cache(settled_only=True))
+                self.assertIsNotNone(updater._get_streak_from_calendar_cache())
+
+    def test_stats_snapshot_expires_for_reuse_only(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            updater = self._cached_updater(cache_dir)
+            updater._save_stats_snapshot({'followers': 94})
+            self.assertEqual(updater._load_stats_snapshot(max_age=3600), {'followers': 94})
+
+            snapshot = Path(cache_dir) / 'stats.json'
+            stored = json.loads(snapshot.read_text(encoding='utf-8'))
+            stored['fetched_at'] -= 2 * 24 * 3600
+            snapshot.write_text(json.dumps(stored), encoding='utf-8')
+            self.assertIsNone(updater._load_stats_snapshot(max_age=updater.stats_snapshot_max_age))
+            self.assertEqual(updater._load_stats_snapshot(), {'followers': 94})
+
+    @staticmethod
+    def _calendar_html(counts):
+        cells, tooltips = [], []
+        for index, (date, count) in enumerate(counts):
+            cells.append(
+                f'<td data-date="{date}" id="contribution-day-component-{index}" '
+                f'data-level="{min(count, 4)}" class="ContributionCalendar-day"></td>'
+            )
+            text = f'{count} contributions on {date}.' if count else f'No contributions on {date}.'
+            tooltips.append(f'<tool-tip for="contribution-day-component-{index}">{text}</tool-tip>')
+        return '<table><tbody><tr>' + ''.join(cells) + '</tr></tbody></table>' + ''.join(tooltips)
+
+    def test_contributions_html_parser_handles_split_chunks(self):
+        html = self._calendar_html([('2026-08-03', 0), ('2026-08-04', 1234), ('2026-08-05', 2)])
+        chunks = [html[i:i + 7] for i in range(0, len(html), 7)]
+        days = sorted(parse_contributions_html(chunks), key=lambda day: day['date'])
+        self.assertEqual(
+            [day['contributionCount'] for day in days],
+            [0, 1234, 2],
+        )
+
+    def test_tokenless_streak_uses_contributions_calendar(self):
+        today = datetime.now(timezone.utc).date()
+        counts = [
+            ((today - timedelta(days=offset)).isoformat(), 0 if offset in (0, 3) else 1)
+            for offset in range(10, -1, -1)
+        ]
+        html = self._calendar_html(counts)
+        response = Mock(status_code=200, encoding='utf-8')
+        response.iter_content.return_value = iter([html[:500], html[500:]])
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            updater = self._cached_updater(cache_dir)
+            updater.GH_TOKEN = None
+            with patch('daily_update.requests.get', return_value=response) as get:
+                self.assertEqual(updater._get_current_streak(), '2_Days')
+
+            self.assertEqual(get.call_count, 1)
+            self.assertIn('/users/Rayyan9477/contributions', get.call_args.args[0])
+            with CalendarFile(str(Path(cache_dir) / 'calendars' / 'Rayyan9477.bin')) as calendar_file:
+                self.assertEqual(calendar_file.login, 'Rayyan9477')
+                self.assertEqual(calendar_file.epoch.isoformat(), counts[0][0])
+                self.assertEqual(calendar_file.day_count, 11)
+
+    def test_contributions_page_streak_needs_days_before_the_page(self):
+        today = datetime.now(timezone.utc).date()
+        counts = [((today - timedelta(days=offset)).isoformat(), 1) for offset in range(10, -1, -1)]
+        html = self._calendar_html(counts)
+        html = html.replace('<td ', '<td data-count="n/a" data-date="bogus" ', 1) + (
+            '<td data-date="2020-13-40" data-count="1"></td><td data-date="2020-01-01" data-count="x"></td>'
+        )
+        self.assertEqual(len(parse_contributions_html([html])), 10)
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            updater = self._cached_updater(cache_dir)
+            updater.GH_TOKEN = None
+            response = Mock(status_code=200, encoding='utf-8')
+            response.iter_content.return_value = iter([self._calendar_html(counts)])
+            with patch('daily_update.requests.get', return_value=response):
+                self.assertIsNone(updater._get_streak_from_contributions_page())
+
+            calendar = updater._calendar_store()
+            calendar.merge(
+                {'date': (today - timedelta(days=offset)).isoformat(), 'contributionCount': int(offset < 14)}
+                for offset in range(20, 10, -1)
+            )
+            calendar.save()
+            response.iter_content.return_value = iter([self._calendar_html(counts)])
+            with patch('daily_update.requests.get', return_value=response):
+                self.assertEqual(updater._get_streak_from_contributions_page(), 14)
+
+    @staticmethod
+    def _wakatime_day(date, seconds, language='Python'):
+        return {
+            'range': {'date': date},
+            'grand_total': {'total_seconds': seconds},
+            'languages': [{'name': language, 'total_seconds': seconds}],
+            'editors': [{'name': 'VS Code', 'total_seconds': seconds}],
+            'projects': [{'name': 'profile', 'total_seconds': seconds}],
+        }
+
+    def test_wakatime_block_only_refreshes_open_days(self):
+        today = datetime.now(timezone.utc).date()
+        closed = {
+            (today - timedelta(days=offset)).isoformat(): {
+                'total_seconds': 3600,
+                'languages': {'Python': 3600},
+                'editors': {'VS Code': 3600},
+                'projects': {'profile': 3600},
+            }
+            for offset in range(2, 8)
+        }
+        response = Mock(status_code=200)
+        response.json.return_value = {'data': [
+            self._wakatime_day((today - timedelta(days=1)).isoformat(), 1800, 'Rust'),
+            self._wakatime_day(today.isoformat(), 600, 'Rust'),
+        ]}
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            (Path(cache_dir) / 'wakatime_days.json').write_text(
+                json.dumps({'days': closed}), encoding='utf-8'
+            )
+            updater = self._cached_updater(cache_dir)
+            updater.wakatime_token = 'waka-key'
+            updater.wakatime_api_base = 'https://wakatime.com/api/v1'
+
+            with patch('daily_update.requests.get', return_value=response) as get:
+                block = updater.get_wakatime_block()
+
+            self.assertEqual(get.call_count, 1)
+            self.assertIn(f'start={(today - timedelta(days=1)).isoformat()}', get.call_args.args[0])
+            self.assertIn('Total Time: 6 hrs 40 mins', block)
+            self.assertIn('Rust', block)
+            self.assertNotIn('Projects:', block)
+            self.assertNotIn('profile', block)
+            self.assertNotIn('Daily Average', block)
+            self.assertIn('profile            6 hrs 40 mins', updater.get_wakatime_projects_block())
+            windows_block = updater.get_wakatime_windows_block()
+            self.assertIn('Last   8 days  6 hrs 40 mins      50 mins/day', windows_block)
+            self.assertNotIn('Last 365 days', windows_block)
+
+            cached = json.loads((Path(cache_dir) / 'wakatime_days.json').read_text(encoding='utf-8'))
+            self.assertEqual(cached['days'][today.isoformat()]['languages'], {'Rust': 600})
+
+    def test_wakatime_projects_are_published_only_on_opt_in(self):
+        today = datetime.now(timezone.utc).date().isoformat()
+        section = '<!--START_SECTION:waka_projects-->\nkept\n<!--END_SECTION:waka_projects-->'
+        with tempfile.TemporaryDirectory() as directory:
+            (Path(directory) / 'wakatime_days.json').write_text(json.dumps({'days': {today: {
+                'total_seconds': 3600, 'languages': {}, 'editors': {}, 'projects': {'secret-repo': 3600},
+            }}}), encoding='utf-8')
+            updater = self._cached_updater(directory)
+            updater.GH_TOKEN = None
+            readme = Path(directory) / 'README.md'
+            updater.readme_file = str(readme)
+            quote = {'content': 'Ship it.', 'author': 'Someone'}
+            with patch.object(DailyUpdater, '_get_current_streak', return_value=None):
+                readme.write_text(section, encoding='utf-8')
+                self.assertTrue(updater.update_readme_content(quote, {}))
+                self.assertIn('kept', readme.read_text(encoding='utf-8'))
+                self.assertNotIn('secret-repo', readme.read_text(encoding='utf-8'))
+
+                updater.wakatime_publish_projects = True
+                self.assertTrue(updater.update_readme_content(quote, {}))
+                self.assertIn('secret-repo', readme.read_text(encoding='utf-8'))
+
+
+    def test_requests_are_traced_as_chrome_events(self):
+        updater = DailyUpdater(configure=False)
+        updater.tracer = Tracer('test')
+        response = Mock(status_code=304, content=b'')
+        with patch('daily_update.requests.get', return_value=response):
+            with updater._span('stats', 'fetch') as phase:
+                updater._request('GET', 'https://api.github.com/users/octocat?per_page=1', timeout=5)
+                phase['cache'] = 'hit'
+        updater.tracer.instant('languages', hits=3, misses=1)
+
+        trace = json.loads(json.dumps(updater.tracer.to_chrome()))
+        events = {event['name']: event for event in trace['traceEvents']}
+        request = events['GET api.github.com/users/octocat']
+        self.assertEqual(request['ph'], 'X')
+        self.assertEqual(request['args'], {'host': 'api.github.com', 'timeout': 5, 'status': 304, 'cache': 'hit', 'bytes': 0})
+        self.assertEqual(events['stats']['args'], {'cache': 'hit'})
+        self.assertGreaterEqual(events['stats']['dur'], request['dur'])
+        self.assertEqual(events['languages']['args'], {'hits': 3, 'misses': 1})
+        self.assertEqual(set(updater.tracer.durations()), {'stats', 'GET api.github.com/users/octocat'})
+
+
+    def test_logger_writes_json_lines_and_respects_level(self):
+        with tempfile.TemporaryDirectory() as directory:
+            log_file = Path(directory) / 'run.log'
+            updater = DailyUpdater(configure=False)
+            with patch('sys.stdout'):
+                updater.logger = configure_logger('test_profile_stats', str(log_file), level='INFO')
+                updater.log('✅ kept')
+                updater.log('per-day detail', 'DEBUG')
+                updater.log('rate limited', 'WARNING')
+                self.assertFalse(updater._debug_enabled())
+                shutdown_logging()
+
+            entries = [json.loads(line) for line in log_file.read_text(encoding='utf-8').splitlines()]
+        self.assertEqual([(entry['level'], entry['message']) for entry in entries], [
+            ('INFO', '✅ kept'), ('WARNING', 'rate limited'),
+        ])
+
+
+    def test_metrics_export_summarises_trace(self):
+        tracer = Tracer('test')
+        window = {'X-RateLimit-Resource': 'core', 'X-RateLimit-Reset': '1700000000'}
+        responses = [
+            Mock(status_code=200, content=b'{}', headers=dict(window, **{'X-RateLimit-Remaining': '4990'})),
+            Mock(status_code=200, content=b'[1,2]', headers=dict(window, **{'X-RateLimit-Remaining': '4987'})),
+            # The window reset mid-run: the allowance refilled, it was not "spent backwards".
+            Mock(status_code=200, content=b'', headers={
+                'X-RateLimit-Resource': 'core', 'X-RateLimit-Reset': '1700003600', 'X-RateLimit-Remaining': '4999',
+            }),
+        ]
+        updater = DailyUpdater(configure=False)
+        updater.tracer = tracer
+        with patch('daily_update.requests.get', side_effect=responses):
+            with updater._span('github_stats', 'fetch', cache='miss'):
+                updater._request('GET', 'https://api.github.com/users/octocat')
+                updater._request('GET', 'https://api.github.com/users/octocat/repos')
+                updater._request('GET', 'https://api.github.com/users/octocat/events')
+        tracer.instant('languages', hits=3, misses=1)
+
+        text = build_metrics(tracer, {'followers': 93, 'current_streak': None}, True, ['quote'])
+        lines = text.splitlines()
+        self.assertNotIn('# EOF', lines)
+        self.assertFalse(any(line.startswith('# TYPE') and not line.endswith(' gauge') for line in lines))
+        self.assertFalse(any('_total' in line for line in lines))
+        self.assertIn('profile_update_run_success 1', lines)
+        self.assertIn('profile_update_api_calls{host="api.github.com",status="200"} 3', lines)
+        self.assertIn('profile_update_bytes_transferred{host="api.github.com"} 7', lines)
+        self.assertIn('profile_update_rate_limit_points_consumed{resource="api.github.com/core"} 5', lines)
+        self.assertIn('profile_update_rate_limit_remaining{resource="api.github.com/core"} 4999', lines)
+        self.assertIn('profile_update_cache_hit_ratio{cache="languages"} 0.75', lines)
+        self.assertIn('profile_update_cache_hit_ratio{cache="github_stats"} 0', lines)
+        self.assertIn('profile_update_published_value{metric="followers"} 93', lines)
+        self.assertIn('profile_update_fallback_used{section="quote"} 1', lines)
+        self.assertFalse(any('current_streak' in line for line in lines))
+        self.assertTrue(any(line.startswith('profile_update_phase_duration_seconds{kind="fetch",phase="github_stats"}') for line in lines))
+
+
+    def test_profile_mode_writes_one_report_per_top_level_phase(self):
+        updater = DailyUpdater(configure=False)
+        with tempfile.TemporaryDirectory() as directory:
+            updater.profiler = PhaseProfiler(directory)
+            with updater._span('update_readme', 'render'):
+                with updater._span('current_streak', 'fetch') as phase:
+                    phase['payload'] = json.loads(json.dumps([{'date': '2024-01-01'}] * 100))
+            with self.assertRaises(RuntimeError):
+                with updater._span('push', 'git'):
+                    raise RuntimeError('offline')
+
+            summary = Path(updater.profiler.write_summary()).read_text(encoding='utf-8')
+            files = sorted(path.name for path in Path(directory).iterdir())
+        self.assertEqual(files, [
+            '01-update_readme.pstats', '01-update_readme.txt', '02-push.pstats', '02-push.txt', 'summary.txt',
+        ])
+        self.assertIn('update_readme', summary)
+        self.assertNotIn('current_streak', summary)
+
+
+class ContributionSeriesTests(unittest.TestCase):
+    def setUp(self):
+        # 2024-01-01 is a Monday; the series spans two calendar years.
+        self.epoch = datetime(2024, 1, 1).date()
+        counts = [(index * 7) % 5 for index in range(600)]
+        self.days = [
+            {'date': (self.epoch + timedelta(days=index)).isoformat(), 'contributionCount': count}
+            for index, count in enumerate(counts)
+        ]
+        self.series = ContributionSeries.from_days(reversed(self.days))
+
+    def test_current_streak_matches_day_list_calculation(self):
+        for end in range(1, 600, 37):
+            today = self.epoch + timedelta(days=end)
+            descending = list(reversed(self.days[:end + 1]))
+            self.assertEqual(
+                self.series.current_streak(today),
+                DailyUpdater._calculate_current_streak(descending, today.isoformat()),
+            )
+
+    def test_summary_statistics(self):
+        self.assertEqual(self.series.longest_streak(), (4, self.epoch + timedelta(days=1)))
+        self.assertEqual(sum(self.series.yearly_totals().values()), self.series.total())
+        self.assertEqual(set(self.series.yearly_totals()), {2024, 2025})
+        self.assertEqual(self.series.best_day(), (self.epoch + timedelta(days=2), 4))
+        self.assertEqual(self.series.weekday_distribution()[0], sum(
+            day['contributionCount'] for index, day in enumerate(self.days) if index % 7 == 0
+        ))
+        self.assertEqual(len(self.series.rolling_average(30)), 600 - 29)
+        self.assertEqual(self.series.rolling_average(5)[0], 2.0)
+
+    def test_growing_backwards_keeps_offsets(self):
+        series = ContributionSeries()
+        series.set(self.epoch, 3)
+        series.set(self.epoch - timedelta(days=3), 1)
+        self.assertEqual(series.epoch, self.epoch - timedelta(days=3))
+        self.assertEqual(series.counts.tolist(), [1, 0, 0, 3])
+        self.assertEqual(series.current_streak(self.epoch), 1)
+
+    def test_binary_calendar_round_trip_and_tail(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            path = str(Path(cache_dir) / 'Rayyan9477.bin')
+            write_calendar(path, self.series, 'Rayyan9477', 123)
+            self.assertEqual(Path(path).stat().st_size, 64 + 2 * 600)
+
+            with CalendarFile(path) as calendar_file:
+                self.assertEqual(calendar_file.user_id, 123)
+                self.assertEqual(calendar_file.epoch, self.epoch)
+                self.assertEqual(calendar_file.series().counts, self.series.counts)
+                tail = calendar_file.tail(10)
+                self.assertEqual(tail.epoch, self.epoch + timedelta(days=590))
+                self.assertEqual(tail.counts.tolist(), self.series.counts[-10:].tolist())
+
+    def test_binary_calendar_streak_reads_more_tail_when_needed(self):
+        series = ContributionSeries(self.epoch, [0] + [1] * 300)
+        today = series.last_date
+        with tempfile.TemporaryDirectory() as cache_dir:
+            path = str(Path(cache_dir) / 'long.bin')
+            write_calendar(path, series)
+            with CalendarFile(path) as calendar_file:
+                self.assertEqual(calendar_file.current_streak(today, chunk_days=8), 300)
+
+    def test_binary_calendar_rejects_foreign_files(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            path = Path(cache_dir) / 'bogus.bin'
+            path.write_bytes(b'NOPE' + bytes(100))
+            with self.assertRaises(ValueError):
+                CalendarFile(str(path))
+
+
+class StreakHistoryTests(unittest.TestCase):
+    def setUp(self):
+        self.epoch = datetime(2024, 1, 1).date()
+        self.counts = [1, 1, 0, 1, 1, 1, 0, 0, 2, 2]
+
+    def _observed(self, counts):
+        history = StreakHistory()
+        for offset, count in enumerate(counts):
+            history.observe(self.epoch + timedelta(days=offset), count)
+        return history
+
+    def test_incremental_matches_bulk_build(self):
+        incremental = self._observed(self.counts)
+        bulk = StreakHistory.from_series(ContributionSeries(self.epoch, self.counts))
+        self.assertEqual(incremental.to_dict(), bulk.to_dict())
+        self.assertEqual(incremental.longest(), (3, self.epoch + timedelta(days=3), self.epoch + timedelta(days=5)))
+        self.assertEqual(incremental.count(), 3)
+        self.assertEqual(incremental.starts()[-1], self.epoch + timedelta(days=8))
+        self.assertEqual(incremental.current(self.epoch + timedelta(days=10)), 2)
+        self.assertEqual(incremental.current(self.epoch + timedelta(days=11)), 0)
+
+    def test_newest_day_can_be_revised(self):
+        history = self._observed([1, 1, 0])
+        history.observe(self.epoch + timedelta(days=2), 4)
+        self.assertEqual(history.longest()[0], 3)
+        history.observe(self.epoch + timedelta(days=2), 0)
+        self.assertEqual(history.longest()[0], 2)
+        self.assertEqual(history.count(), 1)
+
+    def test_sync_feeds_only_new_days_and_round_trips(self):
+        history = StreakHistory.from_series(ContributionSeries(self.epoch, self.counts[:5]))
+        restored = StreakHistory.from_dict(json.loads(json.dumps(history.to_dict())))
+        synced = restored.sync(ContributionSeries(self.epoch, self.counts))
+        self.assertEqual(synced.to_dict(), self._observed(self.counts).to_dict())
+
+    def test_sync_rescans_recent_days_that_changed(self):
+        history = StreakHistory.from_series(ContributionSeries(self.epoch, self.counts))
+        history.backfilled = True
+        revised = list(self.counts) + [1]
+        revised[6] = revised[7] = 1  # contributions GitHub attributed late
+        synced = history.sync(ContributionSeries(self.epoch, revised), rescan_days=5)
+        self.assertEqual(synced.longest()[0], 8)
+        self.assertEqual(synced.count(), 2)
+        self.assertTrue(synced.backfilled)
+
+    def test_sync_across_a_gap_keeps_older_streaks_and_the_backfill(self):
+        history = StreakHistory.from_series(ContributionSeries(self.epoch, self.counts))
+        history.backfilled = True
+        # No run for a while: the new series starts well after the last observed day.
+        gap = history.sync(ContributionSeries(self.epoch + timedelta(days=20), [1, 1]))
+        self.assertTrue(gap.backfilled)
+        self.assertEqual(gap.longest()[0], 3)  # the streak from before the gap survives
+        self.assertEqual(gap.count(), 4)
+        self.assertEqual(gap.current(self.epoch + timedelta(days=21)), 2)
+        self.assertEqual(gap.first_day, self.epoch.toordinal())
+
+    def test_longest_streak_waits_for_backfill_from_account_year(self):
+        this_year = datetime.now(timezone.utc).year
+
+        def fake_post(url, json=None, **kwargs):
+            response = Mock(status_code=200)
+            if 'createdAt' in json['query']:
+                response.json.return_value = {'data': {'user': {'createdAt': f'{this_year - 1}-06-01T00:00:00Z'}}}
+                return response
+            year = int(json['variables']['from'][:4])
+            days = [{'date': f'{year}-03-{day:02d}', 'contributionCount': 1} for day in range(1, 31 if year < this_year else 3)]
+            response.json.return_value = {'data': {'user': {'contributionsCollection': {
+                'contributionCalendar': {'weeks': [{'contributionDays': days}]},
+            }}}}
+            return response
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            updater = DailyUpdater(configure=False)
+            updater.GH_TOKEN = 'test-token'
+            updater.username = 'Rayyan9477'
+            updater.cache_dir = cache_dir
+            updater.log = lambda *args, **kwargs: None
+            updater.streak_history = self._observed(self.counts)
+
+            with patch('daily_update.requests.post', side_effect=fake_post) as post:
+                history = updater._backfill_streak_history()
+                self.assertEqual(post.call_count, 3)
+                self.assertEqual(history.longest()[0], 30)
+                self.assertIs(updater._backfill_streak_history(), history)
+                self.assertEqual(post.call_count, 3)
+
+            stored = StreakHistory.load(str(Path(cache_dir) / 'streak_history.json'))
+            self.assertTrue(stored.backfilled)
+            updater.GH_TOKEN = None
+            updater.streak_history = None
+            self.assertEqual(updater._backfill_streak_history().longest()[0], 30)
+
+    def test_longest_streak_marker_is_updated(self):
+        updater = DailyUpdater(configure=False)
+        updater.streak_history = self._observed(self.counts)
+        updater.streak_history.backfilled = True
+        content = '<!--LONGEST_STREAK-->0<!--/LONGEST_STREAK-->'
+        with patch.object(DailyUpdater, '_get_current_streak', return_value=None):
+            updater.log = lambda *args, **kwargs: None
+            updater.username = 'Rayyan9477'
+            updater.GH_TOKEN = None
+            updater.wakatime_token = None
+            with tempfile.TemporaryDirectory() as directory:
+                readme = Path(directory) / 'README.md'
+                readme.write_text(content, encoding='utf-8')
+                updater.readme_file = str(readme)
+                self.assertTrue(updater.update_readme_content(
+                    {'content': 'Ship it.', 'author': 'Someone'}, {'followers': 1}
+                ))
+                self.assertIn('<!--LONGEST_STREAK-->3<!--/LONGEST_STREAK-->', readme.read_text(encoding='utf-8'))
+
+
+class StatsHistoryTests(unittest.TestCase):
+    def test_trend_queries_read_recorded_snapshots(self):
+        start = datetime(2024, 3, 1).date()
+        with tempfile.TemporaryDirectory() as directory:
+            path = str(Path(directory) / 'history.sqlite3')
+            with StatsHistory(path) as history:
+                for offset, followers in enumerate([10, 12, 15, 14, 20, 21, 21, 25]):
+                    history.record_snapshot('octocat', start + timedelta(days=offset), {
+                        'followers': followers,
+                        'total_stars': None,
+                    })
+                # A second run on the same day replaces that day's value.
+                history.record_snapshot('octocat', start + timedelta(days=7), {'followers': 26})
+                mode = history.connection.execute('PRAGMA journal_mode').fetchone()[0]
+
+            with StatsHistory(path) as history:
+                today = start + timedelta(days=7)
+                self.assertEqual(mode, 'wal')
+                self.assertEqual(history.growth('octocat', 'followers', today), 16)
+                self.assertEqual(history.all_time_high('octocat', 'followers'), (26, today.isoformat()))
+                self.assertIsNone(history.all_time_high('octocat', 'total_stars'))
+                self.assertEqual(len(history.series('octocat', 'followers', since=today - timedelta(days=1))), 2)
+
+    def test_run_records_published_values(self):
+        updater = DailyUpdater(configure=False)
+        updater.log = lambda *args, **kwargs: None
+        updater.username = 'octocat'
+        updater.current_streak_days = 4
+        with tempfile.TemporaryDirectory() as directory:
+            updater.cache_dir = directory
+            updater._record_stats_history({'followers': 7, 'total_stars': None})
+            with StatsHistory(str(Path(directory) / 'stats_history.sqlite3')) as history:
+                today = datetime.now(timezone.utc).date()
+                self.assertEqual(history.value_on('octocat', 'followers', today), 7)
+                self.assertEqual(history.value_on('octocat', 'current_streak', today), 4)
+                self.assertIsNone(history.value_on('octocat', 'total_stars', today))
+
+
+    def test_trend_charts_skip_unchanged_series(self):
+        rendered = []
+
+        def render(path, title, points, color):
+            rendered.append(path.name)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(b'png')
+
+        points = [('2024-03-01', 10), ('2024-03-02', 12)]
+        charts = {'followers.png': ('Followers', points, '#22C55E'), 'empty.png': ('Empty', [], '#000000')}
+        with tempfile.TemporaryDirectory() as directory:
+            output_dir = Path(directory) / 'trends'
+            state_path = str(Path(directory) / 'trend_charts.json')
+            self.assertEqual(write_trend_charts(charts, output_dir, state_path, render), ['followers.png'])
+            self.assertEqual(write_trend_charts(charts, output_dir, state_path, render), [])
+
+            charts['followers.png'] = ('Followers', points + [('2024-03-03', 13)], '#22C55E')
+            self.assertEqual(write_trend_charts(charts, output_dir, state_path, render), ['followers.png'])
+            self.assertEqual(rendered, ['followers.png', 'followers.png'])
+        self.assertNotEqual(series_digest('A', points), series_digest('B', points))
+
+    def test_trend_points_only_change_when_a_week_completes(self):
+        monday = datetime(2024, 3, 4).date()
+        points = [((monday + timedelta(days=offset)).isoformat(), 10 + offset) for offset in range(-7, 3)]
+        weekly = bucket_weekly(points, monday + timedelta(days=2), lambda values: values[-1])
+        self.assertEqual(weekly, [('2024-03-03', 9)])
+        later = bucket_weekly(points + [('2024-03-07', 99)], monday + timedelta(days=3), lambda values: values[-1])
+        self.assertEqual(later, weekly)
+        self.assertEqual(bucket_weekly(points, monday + timedelta(days=7), sum)[-1], ('2024-03-10', 33))
+
+    def test_damaged_stats_history_only_skips_trend_charts(self):
+        with tempfile.TemporaryDirectory() as directory:
+            (Path(directory) / 'stats_history.sqlite3').write_bytes(b'not a database' * 100)
+            updater = DailyUpdater(configure=False)
+            updater.username = 'octocat'
+            updater.cache_dir = directory
+            updater.readme_file = str(Path(directory) / 'README.md')
+            updater.log = lambda *args, **kwargs: None
+            updater._write_trend_charts()
+            self.assertEqual(updater.fallbacks, ('trend_charts',))
+
+
+    def test_stargazer_sync_pages_only_new_stars(self):
+        today = datetime(2024, 3, 10).date()
+        pages = {
+            None: {'totalCount': 3, 'pageInfo': {'hasNextPage': True, 'endCursor': 'c1'},
+                   'edges': [{'starredAt': '2023-01-01T00:00:00Z'}, {'starredAt': '2024-03-08T10:00:00Z'}]},
+            'c1': {'totalCount': 3, 'pageInfo': {'hasNextPage': False, 'endCursor': 'c2'},
+                   'edges': [{'starredAt': '2024-03-09T10:00:00Z'}]},
+            'c2': {'totalCount': 4, 'pageInfo': {'hasNextPage': False, 'endCursor': 'c3'},
+                   'edges': [{'starredAt': '2024-03-10T10:00:00Z'}]},
+        }
+        requested = []
+
+        def fetch_page(owner, name, cursor):
+            requested.append((owner, name, cursor))
+            return pages[cursor]
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = str(Path(directory) / 'stargazers.json')
+            tracker = StargazerTracker(path)
+            self.assertEqual(tracker.sync('octocat/demo', 3, fetch_page), 3)
+            tracker.prune(today)
+            tracker.save()
+
+            tracker = StargazerTracker(path)
+            self.assertFalse(tracker.needs_sync('octocat/demo', 3))
+            self.assertTrue(tracker.needs_sync('octocat/demo', 4))
+            self.assertEqual(tracker.sync('octocat/demo', 4, fetch_page), 1)
+            self.assertEqual(tracker.gained(today), {'octocat/demo': 3})
+            self.assertEqual(tracker.repos['octocat/demo']['cursor'], 'c3')
+        self.assertEqual([cursor for _, _, cursor in requested], [None, 'c1', 'c2'])
+        self.assertEqual(requested[0][:2], ('octocat', 'demo'))
+
+    def test_stargazer_batch_reports_repositories_that_did_not_catch_up(self):
+        def fetch_batch(pages):
+            return [
+                {'totalCount': 500, 'pageInfo': {'hasNextPage': True, 'endCursor': f'{name}-{cursor}'},
+                 'edges': [{'starredAt': '2024-03-10T00:00:00Z'}]} if name == 'busy' else
+                {'totalCount': 1, 'pageInfo': {'hasNextPage': False, 'endCursor': 'end'},
+                 'edges': [{'starredAt': '2024-03-10T00:00:00Z'}]}
+                for _, name, cursor in pages
+            ]
+
+        tracker = StargazerTracker(None, max_pages=3)
+        added, unfinished = tracker.sync_batch({'octocat/busy': 500, 'octocat/quiet': 1}, fetch_batch)
+        self.assertEqual((added, unfinished), (4, ['octocat/busy']))
+        self.assertTrue(tracker.needs_sync('octocat/busy', 500))  # resumes from its cursor next run
+        self.assertFalse(tracker.needs_sync('octocat/quiet', 1))
+
+        updater = DailyUpdater(configure=False)
+        updater.GH_TOKEN = 'test-token'
+        updater.log = lambda *args, **kwargs: None
+        updater._repo_star_counts = {'octocat/busy': 500}
+        with patch('daily_update.StargazerTracker.sync_batch', return_value=(3, ['octocat/busy'])):
+            self.assertIsNone(updater._get_star_growth())
+
+    def test_star_growth_batches_repositories_and_respects_limits(self):
+        counts = {f'octocat/repo{index}': 1 + index % 3 for index in range(7)}
+        counts['octocat/empty'] = 0
+        calls = []
+        budgets = [100, 5000, 5000]
+
+        def fake_post(url, json=None, **kwargs):
+            variables = json['variables']
+            calls.append(sorted(key for key in variables if key.startswith('owner')))
+            data = {
+                f'r{index}': {'stargazers': {
+                    'totalCount': counts[f"octocat/{variables[f'name{index}']}"],
+                    'pageInfo': {'hasNextPage': False, 'endCursor': 'end'},
+                    'edges': [{'starredAt': f'{datetime.now(timezone.utc).date().isoformat()}T00:00:00Z'}],
+                }}
+                for index in range(len(calls[-1]))
+            }
+            return Mock(status_code=200, headers={'X-RateLimit-Remaining': str(budgets.pop(0))},
+                        json=Mock(return_value={'data': data}))
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            updater = DailyUpdater(configure=False)
+            updater.GH_TOKEN = 'test-token'
+            updater.cache_dir = cache_dir
+            updater.log = lambda *args, **kwargs: None
+            updater._repo_star_counts = counts
+            updater.stargazer_batch_size = 3
+            updater.stargazer_max_repos = 5
+
+            with patch('daily_update.requests.post', side_effect=fake_post):
+                # Five of seven starred repositories fit the cap, and the budget runs
+                # low after the first batch, so nothing partial is published.
+                self.assertIsNone(updater._get_star_growth())
+                self.assertEqual(len(calls), 1)
+                self.assertEqual(len(calls[0]), 3)
+
+                updater._graphql_remaining = 5000
+                updater.stargazer_max_repos = 500
+                calls.clear()
+                growth = updater._get_star_growth()
+            self.assertEqual(len(calls), 2)
+            self.assertEqual(sum(growth.values()), 7)
+            self.assertNotIn('octocat/empty', growth)
+
+
+    @staticmethod
+    def _follower_pages(logins, page_size=2):
+        # Newest followers first, ids derived from the login for readability.
+        nodes = [{'databaseId': int(login[1:]), 'login': login} for login in logins]
+        pages = {}
+        for index in range(0, max(len(nodes), 1), page_size):
+            cursor = None if index == 0 else f'p{index}'
+            has_next = index + page_size < len(nodes)
+            pages[cursor] = {
+                'totalCount': len(nodes),
+                'pageInfo': {'hasNextPage': has_next, 'endCursor': f'p{index + page_size}'},
+                'nodes': nodes[index:index + page_size],
+            }
+        return pages
+
+    def test_follower_sync_stops_at_known_ids_and_resyncs_on_unfollow(self):
+        today = datetime(2024, 3, 10).date()
+        requested = []
+
+        def fetcher(pages):
+            def fetch_page(cursor):
+                requested.append(cursor)
+                return pages[cursor]
+            return fetch_page
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = str(Path(directory) / 'followers.json')
+            sync = FollowerSync(path)
+            baseline = ['u5', 'u4', 'u3', 'u2', 'u1']
+            self.assertEqual(sync.sync(fetcher(self._follower_pages(baseline)), today), {'gained': [], 'lost': []})
+            sync.save()
+
+            requested.clear()
+            sync = FollowerSync(path)
+            changes = sync.sync(fetcher(self._follower_pages(['u9', 'u7'] + baseline)), today)
+            self.assertEqual(sorted(changes['gained']), ['u7', 'u9'])
+            self.assertEqual(requested, [None, 'p2'])
+            self.assertEqual(list(sync.ids), [1, 2, 3, 4, 5, 7, 9])
+
+            requested.clear()
+            changes = sync.sync(fetcher(self._follower_pages(['u8', 'u9', 'u7', 'u5', 'u4', 'u2', 'u1'])), today)
+            self.assertEqual(changes, {'gained': ['u8'], 'lost': ['u3']})
+            self.assertIn(8, sync)
+            self.assertNotIn(3, sync)
+            self.assertEqual(sync.recent[0]['login'], 'u8')
+            self.assertEqual(sync.lost, [{'login': 'u3', 'date': '2024-03-10'}])
+
+            # Same count after an unfollow plus a follow: only the head differs.
+            self.assertTrue(sync.is_current(self._follower_pages(['u8', 'u9'])[None]))
+            self.assertFalse(sync.is_current(self._follower_pages(['u6', 'u8'])[None]))
+            sync.save()
+            self.assertEqual(FollowerSync(path).newest, 8)
+
+
+class WakaTimeAnalyticsTests(unittest.TestCase):
+    def setUp(self):
+        self.end = datetime(2026, 8, 5).date()
+        self.days = {}
+        for offset in range(400):
+            day = (self.end - timedelta(days=offset)).isoformat()
+            if offset % 3 == 0:
+                continue
+            languages = {f'Lang{index}': 60 * (index + 1) for index in range(10)}
+            self.days[day] = {
+                'total_seconds': sum(languages.values()),
+                'languages': languages,
+                'editors': {'VS Code': sum(languages.values())},
+                'projects': {f'project-{offset % 4}': sum(languages.values())},
+            }
+
+    def test_windows_count_every_language_without_truncation(self):
+        week = WakaTimeAnalytics(self.days, self.end, span=7).window(7)
+        self.assertEqual(week['active_days'], 4)
+        self.assertEqual(dict(week['languages'])['Lang9'], 4 * 600)
+        self.assertEqual(week['languages'][0][0], 'Lang9')
+        self.assertEqual(week['total_seconds'], 4 * 3300)
+        self.assertEqual(week['daily_average'], 4 * 3300 // 7)
+
+    def test_averages_cover_only_cached_days(self):
+        recent = {day: value for day, value in self.days.items() if day > (self.end - timedelta(days=10)).isoformat()}
+        windows = WakaTimeAnalytics(recent, self.end).windows()
+        self.assertEqual(windows[7]['covered_days'], 7)
+        self.assertEqual([windows[size]['covered_days'] for size in (30, 90, 365)], [9, 9, 9])
+        self.assertEqual(windows[365]['daily_average'], windows[365]['total_seconds'] // 9)
+
+    def test_numpy_and_pure_python_paths_agree(self):
+        vectorized = WakaTimeAnalytics(self.days, self.end, use_numpy=True)
+        fallback = WakaTimeAnalytics(self.days, self.end, use_numpy=False)
+        self.assertEqual(vectorized.windows(), fallback.windows())
+        self.assertEqual(vectorized.rolling_totals(30), fallback.rolling_totals(30))
+        self.assertEqual(len(fallback.rolling_totals(30)), 365 - 29)
+
+    def test_long_windows_ignore_days_outside_span(self):
+        year = WakaTimeAnalytics(self.days, self.end).window(365)
+        expected = sum(
+            day['total_seconds'] for date, day in self.days.items()
+            if date > (self.end - timedelta(days=365)).isoformat()
+        )
+        self.assertEqual(year['total_seconds'], expected)
+        self.assertEqual(len(year['projects']), 4)
+
+    def test_year_heatmap_has_one_cell_per_day(self):
+        card = build_year_heatmap(self.days, self.end)
+        self.assertTrue(card.startswith('<svg'))
+        self.assertEqual(card.count('<rect x="'), (self.end.weekday() + 1) + 7 * 52)
+        self.assertIn(f'{self.end.isoformat()}: 0m', card)
+        self.assertIn(f'{(self.end - timedelta(days=1)).isoformat()}: 55m', card)
+
+    def test_durations_are_split_across_hour_boundaries(self):
+        cache = WakaTimeDayCache(None)
+        start = datetime(2026, 8, 5, 9, 30, tzinfo=timezone.utc).timestamp()
+        cache.store_durations('2026-08-05', [{'time': start, 'duration': 3600}])
+        hours = cache.days['2026-08-05']['hours']
+        self.assertEqual(hours[9], 1800)
+        self.assertEqual(hours[10], 1800)
+        self.assertEqual(sum(hours), 3600)
+
+        card = build_hour_heatmap(cache.days)
+        self.assertIn('Wed 09:00 UTC: 30m', card)
+        self.assertEqual(card.count('<rect x="'), 7 * 24)
+
+    def test_durations_are_bucketed_in_the_users_timezone(self):
+        cache = WakaTimeDayCache(None)
+        cache.days['2026-08-04'] = {'total_seconds': 60, 'hours': [1] * 24}
+        cache.set_timezone('America/Los_Angeles')
+        self.assertNotIn('hours', cache.days['2026-08-04'])
+
+        # 22:00-23:00 local on Aug 5 is 05:00-06:00 UTC on Aug 6.
+        start = datetime(2026, 8, 6, 5, tzinfo=timezone.utc).timestamp()
+        cache.store_durations('2026-08-05', [{'time': start, 'duration': 3600}])
+        hours = cache.days['2026-08-05']['hours']
+        self.assertEqual(hours[22], 3600)
+        self.assertEqual(sum(hours), 3600)
+        self.assertIn('Wed 22:00 America/Los_Angeles: 1h 0m', build_hour_heatmap(cache.days, cache.timezone))
+
+
+class ContributionsFetcherTests(unittest.TestCase):
+    @staticmethod
+    def _graphql_response(user):
+        response = Mock(status_code=200)
+        response.json.return_value = {'data': {'user': user}}
+        return response
+
+    def _pages(self):
+        first = {
+            'totalCount': 150,
+            'pageInfo': {'endCursor': 'c1', 'hasNextPage': True},
+            'nodes': [{'stargazerCount': 2, 'forkCount': 1}] * 100,
+        }
+        second = {
+            'totalCount': 150,
+            'pageInfo': {'endCursor': 'c2', 'hasNextPage': False},
+            'nodes': [{'stargazerCount': 1, 'forkCount': 0}] * 50,
+        }
+        return first, second
+
+    def _profile(self):
+        return {
+            'contributionsCollection': {
+                'contributionCalendar': {'totalContributions': 400},
+                'restrictedContributionsCount': 0,
+                'totalCommitContributions': 300,
+                'totalIssueContributions': 10,
+                'totalPullRequestContributions': 20,
+                'totalPullRequestReviewContributions': 5,
+            },
+            'followers': {'totalCount': 93},
+        }
+
+    def _fetcher(self):
+        fetcher = GitHubContributionsFetcher.__new__(GitHubContributionsFetcher)
+        fetcher.token = 'test-token'
+        fetcher.username = 'Rayyan9477'
+        fetcher.graphql_url = 'https://api.github.com/graphql'
+        fetcher.max_repository_pages = 100
+        return fetcher
+
+    def test_counts_stars_beyond_first_hundred_repositories(self):
+        first, second = self._pages()
+        profile = dict(self._profile(), repositories=first)
+        responses = [self._graphql_response(profile), self._graphql_response({'repositories': second})]
+
+        with patch('fetch_github_contributions.requests.post', side_effect=responses) as post:
+            data = self._fetcher().fetch_contributions()
+
+        self.assertEqual(post.call_count, 2)
+        self.assertEqual(post.call_args.kwargs['json']['variables']['cursor'], 'c1')
+        self.assertEqual(data['total_stars'], 250)
+        self.assertEqual(data['total_forks'], 100)
+        self.assertEqual(data['public_repos'], 150)
+
+    def test_separate_contributions_query_pages_every_repository(self):
+        first, second = self._pages()
+        responses = [
+            self._graphql_response(self._profile()),
+            self._graphql_response({'repositories': first}),
+            self._graphql_response({'repositories': second}),
+        ]
+
+        with patch('fetch_github_contributions.requests.post', side_effect=responses) as post:
+            data = self._fetcher().fetch_contributions(combine_first_page=False)
+
+        self.assertEqual(post.call_count, 3)
+        self.assertNotIn('repositories', post.call_args_list[0].kwargs['json']['query'])
+        self.assertEqual(data['total_stars'], 250)
+
+    def test_failed_repository_page_returns_fallback(self):
+        first, _ = self._pages()
+        profile = dict(self._profile(), repositories=first)
+        responses = [self._graphql_response(profile), Mock(status_code=502)]
+
+        with patch('fetch_github_contributions.requests.post', side_effect=responses):
+            data = self._fetcher().fetch_contributions()
+
+        self.assertTrue(data['fallback'])
+
+    def test_page_limit_returns_fallback_instead_of_undercount(self):
+        first, second = self._pages()
+        profile = dict(self._profile(), repositories=first)
+        fetcher = self._fetcher()
+        fetcher.max_repository_pages = 1
+
+        with patch('fetch_github_contributions.requests.post', side_effect=[self._graphql_response(profile)]):
+            data = fetcher.fetch_contributions()
+
+        self.assertTrue(data['fallback'])
+        self.assertEqual(data['total_stars'], 0)
+
+
+class HermeticPipelineTests(unittest.TestCase):
+    def test_full_run_against_stub_server(self):
+        dataset = StubDataset(repos=25, streak_days=12, followers=30)
+        readme_source = Path(__file__).resolve().parent.parent / 'README.md'
+        with StubServer(dataset) as server, tempfile.TemporaryDirectory() as directory:
+            readme = Path(directory) / 'README.md'
+            readme.write_text(readme_source.read_text(encoding='utf-8'), encoding='utf-8')
+            env = dict(
+                server.env(),
+                GH_TOKEN='stub-token',
+                WAKATIME_API_KEY='stub-key',
+                PUSH_CHANGES='false',
+                PROFILE_CACHE_DIR=str(Path(directory) / 'cache'),
+                LOG_FILE=str(Path(directory) / 'run.log'),
+                TRACE_FILE=str(Path(directory) / 'run.trace.json'),
+                METRICS_TEXTFILE=str(Path(directory) / 'run.prom'),
+            )
+            with patch.dict(os.environ, env), patch('sys.stdout'):
+                updater = DailyUpdater()
+                updater.readme_file = str(readme)
+                succeeded = updater.run_daily_update()
+                shutdown_logging()
+
+            content = readme.read_text(encoding='utf-8')
+            metrics = (Path(directory) / 'run.prom').read_text(encoding='utf-8')
+            routes = {entry['route'] for entry in server.requests}
+
+        self.assertTrue(succeeded)
+        self.assertIn('<!--FOLLOWERS-->30<!--/FOLLOWERS-->', content)
+        self.assertIn(f'<!--TOTAL_STARS-->{dataset.total_stars}<!--/TOTAL_STARS-->', content)
+        self.assertIn('<!--CURRENT_STREAK-->12<!--/CURRENT_STREAK-->', content)
+        self.assertEqual(updater.fallbacks, ())
+        self.assertTrue({'quote', 'user', 'repos', 'languages', 'events', 'graphql'} <= routes)
+        self.assertIn('profile_update_run_success 1', metrics)
+        self.assertTrue(all(entry['status'] in (200, 304) for entry in server.requests))
+
+
+    def _run_with_deadline(self, budget: str, faults):
+        dataset = StubDataset(repos=5, streak_days=12, followers=30)
+        readme_source = Path(__file__).resolve().parent.parent / 'README.md'
+        with StubServer(dataset, faults=faults) as server, tempfile.TemporaryDirectory() as directory:
+            readme = Path(directory) / 'README.md'
+            readme.write_text(
+                readme_source.read_text(encoding='utf-8') + '<!--START_SECTION:waka-->\n<!--END_SECTION:waka-->\n',
+                encoding='utf-8',
+            )
+            env = dict(
+                server.env(),
+                GH_TOKEN='stub-token',
+                WAKATIME_API_KEY='stub-key',
+                PUSH_CHANGES='false',
+                RUN_DEADLINE_SECONDS=budget,
+                PROFILE_CACHE_DIR=str(Path(directory) / 'cache'),
+                LOG_FILE=str(Path(directory) / 'run.log'),
+                TRACE_FILE=str(Path(directory) / 'run.trace.json'),
+                METRICS_TEXTFILE=str(Path(directory) / 'run.prom'),
+            )
+            with patch.dict(os.environ, env), patch('sys.stdout'):
+                updater = DailyUpdater()
+                updater.readme_file = str(readme)
+                started = time.perf_counter()
+                succeeded = updater.run_daily_update()
+                elapsed = time.perf_counter() - started
+                shutdown_logging()
+            metrics = (Path(directory) / 'run.prom').read_text(encoding='utf-8')
+            routes = {entry['route'] for entry in server.requests}
+        self.assertTrue(succeeded)
+        return updater, elapsed, metrics, routes
+
+    def test_run_deadline_degrades_lower_priority_sections_to_cache(self):
+        # Stats run first and the slow user endpoint eats the budget the rest needed.
+        updater, elapsed, metrics, routes = self._run_with_deadline('2', {'user': Fault('delay', delay=1.3)})
+        self.assertLess(elapsed, 2.5)
+        self.assertTrue({'quote', 'current_streak', 'wakatime'} <= set(updater.degraded))
+        self.assertTrue(set(updater.degraded) <= set(updater.fallbacks))
+        self.assertNotIn('quote', routes)
+        self.assertNotIn('wakatime', routes)
+        self.assertIn('profile_update_section_degraded{section="wakatime"} 1', metrics)
+        self.assertIn('profile_update_run_deadline_seconds 2', metrics)
+
+    def test_run_deadline_leaves_the_quote_its_share_when_upstreams_are_fast(self):
+        updater, _, _, routes = self._run_with_deadline('3', {})
+        self.assertEqual(updater.degraded, ())
+        self.assertIn('quote', routes)
+
+    def test_malformed_run_deadline_falls_back_to_the_default(self):
+        updater = DailyUpdater(configure=False)
+        with patch('sys.stdout'):
+            for raw, expected in (('5m', 300.0), ('nan', 300.0), ('', 300.0), (' 90 ', 90.0), ('0', 0.0)):
+                with patch.dict(os.environ, {'RUN_DEADLINE_SECONDS': raw}):
+                    self.assertEqual(updater._env_seconds('RUN_DEADLINE_SECONDS', 300.0), expected)
+
+    def test_stub_server_paginates_and_honours_etags_and_rate_limits(self):
+        import requests
+        with StubServer(StubDataset(repos=150), rate_limit=3) as server:
+            api = server.env()['GITHUB_API_URL']
+            first = requests.get(f'{api}/users/Rayyan9477/repos?page=1&per_page=100', timeout=5)
+            self.assertEqual(len(first.json()), 100)
+            self.assertIn('rel="next"', first.headers['Link'])
+            self.assertEqual(first.headers['X-RateLimit-Remaining'], '2')
+            again = requests.get(
+                f'{api}/users/Rayyan9477/repos?page=1&per_page=100',
+                headers={'If-None-Match': first.headers['ETag']},
+                timeout=5,
+            )
+            self.assertEqual((again.status_code, again.headers['X-RateLimit-Remaining']), (304, '2'))
+            self.assertEqual(len(requests.get(f'{api}/users/Rayyan9477/repos?page=2&per_page=100', timeout=5).json()), 50)
+            self.assertEqual(requests.get(f'{api}/users/Rayyan9477', timeout=5).headers['X-RateLimit-Remaining'], '0')
+            limited = requests.get(f'{api}/users/Rayyan9477', timeout=5)
+            self.assertEqual((limited.status_code, limited.headers['X-RateLimit-Remaining']), (403, '0'))
+
+    def test_contributions_fetcher_follows_github_api_url(self):
+        dataset = StubDataset(repos=150)
+        with stub_environment(dataset) as server, patch('builtins.print'):
+            data = GitHubContributionsFetcher().fetch_contributions()
+        self.assertNotIn('fallback', data)
+        self.assertEqual((data['public_repos'], data['total_stars']), (150, dataset.total_stars))
+        self.assertEqual({entry['route'] for entry in server.requests}, {'graphql'})
+        self.assertNotEqual(os.environ.get('GITHUB_API_URL'), server.env()['GITHUB_API_URL'])  # restored
+
+    def test_latency_book_derives_clamped_timeouts_and_persists(self):
+        key = endpoint_key('GET', 'https://api.github.com/repos/Rayyan9477/one/languages')
+        self.assertEqual(key, endpoint_key('get', 'https://api.github.com/repos/Rayyan9477/two/languages?x=1'))
+        self.assertEqual(key, 'GET api.github.com/repos/{owner}/{repo}/languages')
+        self.assertEqual(endpoint_key('GET', 'https://api.github.com/users/octocat'), 'GET api.github.com/users/{user}')
+        self.assertNotEqual(
+            endpoint_key('POST', 'https://api.github.com/graphql', {'query': FOLLOWERS_QUERY}),
+            endpoint_key('POST', 'https://api.github.com/graphql', {'query': stargazers_query(2)}),
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'latency.json')
+            book = LatencyBook(path, min_samples=5)
+            for _ in range(4):
+                book.record(key, 0.3)
+            self.assertEqual(book.timeout(key, 10), 10)  # not enough history yet
+            book.record(key, 0.3)
+            self.assertEqual(book.timeout(key, 10), 2.0)  # 0.9s raised to the floor
+            for _ in range(5):
+                book.record(key, 5.0)
+            self.assertEqual(book.timeout(key, 10), 10)  # capped at the call site's value
+            self.assertEqual(book.timeout(key, None), 15.0)
+            book.record_timeout(key, 10.0)
+            self.assertEqual(book.timeout(key, None), 30.0)  # the censored 10 s sample lifts it to the cap
+            book.save()
+            self.assertEqual(len(LatencyBook(path).samples[key]), 11)
+            self.assertEqual(LatencyBook(path).backoff, {key: 20.0})
+            self.assertEqual(len(LatencyBook(path, window=3).samples[key]), 3)
+
+    def test_adaptive_timeout_abandons_a_hung_endpoint_early(self):
+        import requests
+        with StubServer(StubDataset(), faults={'quote': Fault('delay', delay=2.0)}) as server:
+            updater = DailyUpdater(configure=False)
+            updater.latency_book = LatencyBook(None, floor=0.2)
+            url = server.env()['QUOTES_API_URL']
+            for _ in range(5):
+                updater.latency_book.record(endpoint_key('GET', url), 0.02)
+            started = time.perf_counter()
+            with self.assertRaises(requests.exceptions.Timeout):
+                updater._request('GET', url, timeout=5)
+            self.assertLess(time.perf_counter() - started, 1.0)
+
+            # The timeout is kept as a censored sample and the next attempt waits twice as long.
+            key = endpoint_key('GET', url)
+            self.assertEqual(len(updater.latency_book.samples[key]), 6)
+            self.assertGreaterEqual(updater.latency_book.timeout(key, 5), 0.4)
+            server.faults = {}
+            updater._request('GET', url, timeout=5)
+            self.assertEqual(updater.latency_book.backoff, {})
+
+    def test_timeout_cut_short_by_the_run_deadline_is_not_blamed_on_the_endpoint(self):
+        import requests
+        with StubServer(StubDataset(), faults={'quote': Fault('delay', delay=2.0)}) as server:
+            updater = DailyUpdater(configure=False)
+            updater.latency_book = LatencyBook(None, floor=0.2)
+            updater.deadline = RunDeadline(5, min_slice=0.1)
+            url = server.env()['QUOTES_API_URL']
+            with updater.deadline.section('quote'), self.assertRaises(requests.exceptions.Timeout):
+                updater._request('GET', url, timeout=5)
+            self.assertEqual(dict(updater.latency_book.samples), {})
+            self.assertEqual(updater.latency_book.backoff, {})
+
+    def test_run_deadline_reserves_budget_for_higher_priority_sections(self):
+        now = [0.0]
+        deadline = RunDeadline(100, min_slice=1.0, clock=lambda: now[0])
+        self.assertEqual(deadline.available('github_stats'), 100)
+        self.assertEqual(deadline.available('quote'), 10)  # 90% held for stats, streak and WakaTime
+        with deadline.section('quote'):
+            self.assertEqual(deadline.clamp(5), 5)
+            self.assertEqual(deadline.clamp(None), 10)
+        with deadline.section('github_stats'):
+            now[0] = 79.5
+        self.assertEqual(deadline.available('wakatime'), 0.5)  # streak's 20 s still reserved
+        self.assertFalse(deadline.allows('wakatime'))
+        with deadline.section('current_streak'):
+            self.assertEqual(deadline.clamp(15), 15)
+        self.assertTrue(deadline.allows('wakatime'))
+        now[0] = 99.5
+        with deadline.section('wakatime'), self.assertRaises(DeadlineExceeded):
+            deadline.clamp(15)
+        self.assertEqual(deadline.remaining(), 0.5)
+
+    def test_stub_server_injects_faults_per_route(self):
+        import requests
+        faults = {'quote': Fault('error', status=502), 'user': Fault('reset'), 'repos': Fault('partial')}
+        with StubServer(StubDataset(repos=150), faults=faults) as server:
+            env = server.env()
+            self.assertEqual(requests.get(env['QUOTES_API_URL'], timeout=5).status_code, 502)
+            with self.assertRaises(requests.exceptions.ConnectionError):
+                requests.get(f"{env['GITHUB_API_URL']}/users/Rayyan9477", timeout=5)
+            with self.assertRaises(requests.exceptions.RequestException):
+                requests.get(f"{env['GITHUB_API_URL']}/users/Rayyan9477/repos?per_page=100", timeout=5).json()
+            self.assertEqual(requests.get(f"{env['GITHUB_API_URL']}/users/Rayyan9477/events/public", timeout=5).status_code, 200)
+            server.faults = {}
+            self.assertEqual(requests.get(env['QUOTES_API_URL'], timeout=5).status_code, 200)
+            kinds = [entry['fault'] for entry in server.requests]
+        self.assertEqual(kinds[:3], ['error', 'reset', 'partial'])
+        self.assertEqual(kinds[3:], [None, None])
+
+    def test_chaos_harness_reports_percentiles_and_fallbacks(self):
+        self.assertEqual(chaos_harness.percentile([5, 1, 4, 2, 3], 50), 3)
+        self.assertEqual(chaos_harness.percentile([5, 1, 4, 2, 3], 99), 5)
+        profiles = chaos_harness.build_profiles(['quote', 'wakatime'], ['error'], delay=0, probability=1.0)
+        self.assertEqual(list(profiles), ['baseline', 'error:quote', 'error:wakatime'])
+
+        report = chaos_harness.run_profiles(profiles, runs=1, dataset=StubDataset(repos=5, streak_days=3))
+        self.assertEqual(report['baseline']['fallbacks'], {})
+        self.assertEqual(report['error:quote']['fallbacks'], {'quote': 1})
+        self.assertEqual(report['error:wakatime']['fallbacks'], {'wakatime': 1})
+        self.assertTrue(all(row['succeeded'] == 1 for row in report.values()))
+        self.assertIn('quote x1', chaos_harness.format_report(report))
+
+    def test_benchmark_compare_flags_only_budget_regressions(self):
+        baseline = {'small/cold': {'wall_seconds': 1.0, 'api_calls': 30, 'bytes': 50000}}
+        within = {'small/cold': {'succeeded': True, 'wall_seconds': 1.5, 'api_calls': 30, 'bytes': 54000}}
+        self.assertEqual(compare_benchmarks(within, baseline), [])
+
+        regressed = {
+            'small/cold': {'succeeded': True, 'wall_seconds': 3.0, 'api_calls': 31, 'bytes': 50000},
+            'new/cold': {'succeeded': False, 'wall_seconds': 9.0},
+        }
+        messages = compare_benchmarks(regressed, baseline)
+        self.assertEqual(len(messages), 3)
+        self.assertTrue(any('wall_seconds' in message for message in messages))
+        self.assertTrue(any('api_calls' in message for message in messages))
+        self.assertIn('new/cold: run failed', messages)
+
+        fell_back = {'small/warm': {'succeeded': True, 'fallbacks': ['stars_this_week'], 'degraded': []}}
+        self.assertEqual(compare_benchmarks(fell_back, baseline), ['small/warm: fallbacks: stars_this_week'])
+
+    def test_microbench_cases_run_and_results_are_kept_per_commit(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cases = microbench.build_cases(directory)
+            self.assertNotIn('current_streak/365d', cases)
+            self.assertEqual(cases['series_streak/365d'](), 365)
+            self.assertEqual(cases['calendar_streak/36500d'](), 36500)
+        self.assertIn('<!--FOLLOWERS-->42<!--/FOLLOWERS-->', cases['replace_stat_marker/200KB']())
+        self.assertIn('Followers-120', cases['badge_rewrite/200KB-dense']())
+        self.assertEqual(cases['wakatime_windows/30d-10']()[7]['active_days'], 7)
+        self.assertGreaterEqual(len(microbench.synthetic_readme(200_000)), 200_000)
+
+        history = {}
+        microbench.record(history, 'aaa', {'case': 1e-6})
+        microbench.record(history, 'bbb', {'case': 2e-6})
+        microbench.record(history, 'bbb', {'case': 3e-6})
+        self.assertEqual([run['commit'] for run in history['runs']], ['aaa', 'bbb'])
+        self.assertEqual(history['runs'][-1]['results'], {'case': 3e-6})
+        self.assertEqual(microbench.previous_run(history, 'bbb')['commit'], 'aaa')
+
 
 if __name__ == '__main__':
     unittest.main()
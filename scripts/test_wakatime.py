@@ -1,13 +1,19 @@
 #!/usr/bin/env python3
 """
 Test script to verify WakaTime API configuration
+
+Runs against the local stub server by default; pass --live to check the
+real WakaTime and GitHub APIs with the configured keys.
 """
 
 import os
+import sys
 import requests
 import json
 from datetime import datetime, timedelta
 
+from stub_server import stub_environment
+
 
 def safe_print(message):
     try:
@@ -35,7 +41,8 @@ def test_wakatime_api():
     today = datetime.now().strftime('%Y-%m-%d')
     
     # Test summaries endpoint
-    url = f'https://wakatime.com/api/v1/users/current/summaries?start={today}&end={today}'
+    api_base = os.getenv('WAKATIME_API_URL') or 'https://wakatime.com/api/v1'
+    url = f'{api_base}/users/current/summaries?start={today}&end={today}'
     
     try:
         safe_print(f"🔍 Testing WakaTime API connection...")
@@ -111,7 +118,8 @@ def test_GH_TOKEN():
         safe_print("🔍 Testing GitHub API connection...")
         
         # Test user endpoint
-        response = requests.get('https://api.github.com/user', headers=headers, timeout=10)
+        api_base = os.getenv('GITHUB_API_URL') or 'https://api.github.com'
+        response = requests.get(f'{api_base}/user', headers=headers, timeout=10)
         
         if response.status_code == 200:
             user_data = response.json()
@@ -161,4 +169,8 @@ def main():
             safe_print("   - Check repository workflow permissions")
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    if '--live' in sys.argv[1:]:
+        main()
+    else:
+        with stub_environment():
+            main()
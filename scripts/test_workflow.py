@@ -2,11 +2,16 @@
 """
 Test Workflow Script
 Tests the GitHub Actions workflow components to ensure everything is working correctly
+
+The pipeline test runs the daily update against the local stub server, so no
+live GitHub, WakaTime or quote API is contacted.
 """
 
 import os
 import sys
+import shutil
 import subprocess
+import tempfile
 from datetime import datetime
 
 def test_environment():
@@ -108,6 +113,45 @@ def test_scripts():
         print(f"❌ Error testing scripts: {e}")
         return False
 
+def test_stub_pipeline():
+    """Run the daily update end to end against the local stub server"""
+    print("🔍 Testing Daily Update Against the Stub Server...")
+
+    try:
+        sys.path.insert(0, 'scripts')
+        from daily_update import DailyUpdater
+        from run_logging import shutdown as shutdown_logging
+        from stub_server import stub_environment
+
+        with tempfile.TemporaryDirectory() as directory:
+            readme = os.path.join(directory, 'README.md')
+            shutil.copyfile('README.md', readme)
+            with stub_environment(
+                PUSH_CHANGES='false',
+                PROFILE_CACHE_DIR=os.path.join(directory, 'cache'),
+                LOG_FILE=os.path.join(directory, 'run.log'),
+                TRACE_FILE=os.path.join(directory, 'run.trace.json'),
+                METRICS_TEXTFILE=os.path.join(directory, 'run.prom'),
+            ):
+                updater = DailyUpdater()
+                updater.readme_file = readme
+                try:
+                    succeeded = updater.run_daily_update()
+                finally:
+                    shutdown_logging()
+
+        if not succeeded:
+            print("❌ Daily update failed against the stub server")
+            return False
+        if updater.fallbacks:
+            print(f"⚠️ Sections fell back: {', '.join(updater.fallbacks)}")
+        print("✅ Daily update completed against the stub server")
+        return True
+
+    except Exception as e:
+        print(f"❌ Error running the stub pipeline: {e}")
+        return False
+
 def test_workflow_file():
     """Test if the workflow file exists and has correct structure"""
     print("🔍 Testing Workflow File...")
@@ -157,6 +201,7 @@ def main():
         ("GitHub Token", test_github_token),
         ("README Structure", test_readme_structure),
         ("Scripts", test_scripts),
+        ("Stub Pipeline", test_stub_pipeline),
         ("Workflow File", test_workflow_file)
     ]
     
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Run Tracing
+Lightweight spans around fetch, parse, render, write and git steps. Each
+span records its duration plus attributes such as bytes, status and cache
+hit/miss, and the whole run exports as Chrome trace-event JSON that loads
+in chrome://tracing or Perfetto.
+"""
+
+import json
+import os
+import threading
+import time
+from collections.abc import Mapping
+from contextlib import contextmanager, nullcontext
+from typing import Any, Dict, Iterator, List, Optional
+from urllib.parse import urlsplit
+
+import requests
+
+
+class Tracer:
+    """Collects completed spans as Chrome ``X`` (complete) events."""
+
+    def __init__(self, process_name: str = 'profile-update'):
+        self.process_name = process_name
+        self.events: List[Dict[str, Any]] = []
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def _now_us(self) -> float:
+        return (time.perf_counter() - self._origin) * 1e6
+
+    @contextmanager
+    def span(self, name: str, category: str = 'phase', **args: Any) -> Iterator[Dict[str, Any]]:
+        """Time the enclosed block; callers may add attributes to the yielded dict."""
+        start = self._now_us()
+        try:
+            yield args
+        except BaseException as e:
+            args['error'] = f'{type(e).__name__}: {e}'
+            raise
+        finally:
+            event = {
+                'name': name,
+                'cat': category,
+                'ph': 'X',
+                'ts': round(start, 1),
+                'dur': round(self._now_us() - start, 1),
+                'pid': os.getpid(),
+                'tid': threading.get_ident(),
+                'args': args,
+            }
+            with self._lock:
+                self.events.append(event)
+
+    def instant(self, name: str, category: str = 'cache', **args: Any) -> None:
+        """Record a zero-length event, e.g. cache hit/miss counts for a lookup."""
+        event = {
+            'name': name, 'cat': category, 'ph': 'i', 's': 't', 'ts': round(self._now_us(), 1),
+            'pid': os.getpid(), 'tid': threading.get_ident(), 'args': args,
+        }
+        with self._lock:
+            self.events.append(event)
+
+    def durations(self, category: Optional[str] = None) -> Dict[str, float]:
+        """Return total seconds per span name, optionally for one category."""
+        totals: Dict[str, float] = {}
+        for event in self.events:
+            if event['ph'] == 'X' and (category is None or event['cat'] == category):
+                totals[event['name']] = totals.get(event['name'], 0.0) + event['dur'] / 1e6
+        return totals
+
+    def to_chrome(self) -> Dict[str, Any]:
+        metadata = {
+            'name': 'process_name', 'ph': 'M', 'pid': os.getpid(), 'tid': 0,
+            'args': {'name': self.process_name},
+        }
+        return {
+            'traceEvents': [metadata] + sorted(self.events, key=lambda event: event['ts']),
+            'displayTimeUnit': 'ms',
+        }
+
+    def write(self, path: str) -> None:
+        """Write the trace; a tracing failure never fails the run."""
+        try:
+            directory = os.path.dirname(os.path.abspath(path))
+            os.makedirs(directory, exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as file:
+                json.dump(self.to_chrome(), file)
+        except OSError:
+            pass
+
+
+def span(tracer: Optional[Tracer], name: str, category: str = 'phase', **args: Any):
+    """Return ``tracer.span(...)``, or a no-op context yielding a scratch dict."""
+    if tracer is None:
+        return nullcontext(args)
+    return tracer.span(name, category, **args)
+
+
+def traced_request(tracer: Optional[Tracer], method: str, url: str, **kwargs: Any) -> requests.Response:
+    """Send one HTTP request inside an ``http`` span recording status and bytes."""
+    parts = urlsplit(url)
+    with span(tracer, f'{method} {parts.netloc}{parts.path}', 'http', host=parts.netloc) as attributes:
+        if kwargs.get('timeout') is not None:
+            attributes['timeout'] = kwargs['timeout']
+        response = getattr(requests, method.lower())(url, **kwargs)
+        attributes['status'] = response.status_code
+        attributes['cache'] = 'hit' if response.status_code == 304 else 'miss'
+        content = None if kwargs.get('stream') else getattr(response, 'content', None)
+        if isinstance(content, (bytes, str)):
+            attributes['bytes'] = len(content)
+        headers = getattr(response, 'headers', None)
+        if isinstance(headers, Mapping) and headers.get('X-RateLimit-Remaining') is not None:
+            attributes['rate_limit_resource'] = headers.get('X-RateLimit-Resource', 'core')
+            attributes['rate_limit_remaining'] = int(headers['X-RateLimit-Remaining'])
+            if headers.get('X-RateLimit-Reset') is not None:
+                attributes['rate_limit_reset'] = int(headers['X-RateLimit-Reset'])
+        return response
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Trend Charts
+Renders follower, star and contribution trend PNGs from locally stored
+history. Series are bucketed into completed weeks, so a chart's input only
+changes once a week; matplotlib is imported (with the Agg backend) only when
+it has, because importing and rendering dominate runtime.
+"""
+
+import hashlib
+import json
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from profile_cache import load_json, save_json
+
+Point = Tuple[str, float]
+
+_pyplot = None
+
+
+def _load_pyplot():
+    """Import matplotlib on first use and pin the non-interactive Agg backend."""
+    global _pyplot
+    if _pyplot is None:
+        import matplotlib
+        matplotlib.use('Agg')
+        import matplotlib.pyplot as pyplot
+        _pyplot = pyplot
+    return _pyplot
+
+
+def bucket_weekly(points: Sequence[Point], today: date, reduce: Callable[[List[float]], float]) -> List[Point]:
+    """Collapse daily points into one per completed Monday-Sunday week.
+
+    Each bucket is dated by its Sunday and ``reduce`` combines its values in
+    date order (``sum`` for counts, the last value for running totals). The
+    current week is left out until it ends.
+    """
+    week_start = today - timedelta(days=today.weekday())
+    weeks: Dict[date, List[float]] = {}
+    for day, value in sorted(points):
+        current = date.fromisoformat(day)
+        if current < week_start:
+            weeks.setdefault(current + timedelta(days=6 - current.weekday()), []).append(value)
+    return [(end.isoformat(), reduce(values)) for end, values in sorted(weeks.items())]
+
+
+def series_digest(title: str, points: Sequence[Point]) -> str:
+    """Return a stable hash of everything that affects a chart's pixels."""
+    payload = json.dumps([title, [list(point) for point in points]], separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def render_trend_chart(path: Path, title: str, points: Sequence[Point], color: str) -> None:
+    """Draw ``points`` as a filled line chart in the profile's dark palette."""
+    pyplot = _load_pyplot()
+    dates = [date.fromisoformat(day) for day, _ in points]
+    values = [value for _, value in points]
+
+    figure, axis = pyplot.subplots(figsize=(8, 2.6), dpi=100)
+    try:
+        figure.patch.set_facecolor('#0D1117')
+        axis.set_facecolor('#0D1117')
+        axis.plot(dates, values, color=color, linewidth=2)
+        axis.fill_between(dates, values, min(values), color=color, alpha=0.15)
+        axis.set_title(title, color='#E6EDF3', loc='left', fontsize=12, fontweight='bold')
+        axis.tick_params(colors='#8B949E', labelsize=8)
+        axis.grid(color='#30363D', linewidth=0.5)
+        for spine in axis.spines.values():
+            spine.set_visible(False)
+        figure.autofmt_xdate()
+        figure.tight_layout()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        figure.savefig(path, facecolor=figure.get_facecolor())
+    finally:
+        pyplot.close(figure)
+
+
+def write_trend_charts(
+    charts: Dict[str, Tuple[str, Sequence[Point], str]],
+    output_dir: Path,
+    state_path: Optional[str],
+    render: Callable[[Path, str, Sequence[Point], str], None] = render_trend_chart,
+) -> List[str]:
+    """Render each ``name -> (title, points, color)`` chart whose series changed.
+
+    Digests of the last rendered series are kept in ``state_path``; charts
+    whose digest matches and whose PNG still exists are skipped without
+    touching matplotlib. Returns the names of the charts that were written.
+    """
+    state = load_json(state_path, {}) if state_path else {}
+    written = []
+    for name, (title, points, color) in charts.items():
+        if len(points) < 2:
+            continue
+        digest = series_digest(title, points)
+        path = output_dir / name
+        if state.get(name) == digest and path.exists():
+            continue
+        render(path, title, points, color)
+        state[name] = digest
+        written.append(name)
+    if written and state_path:
+        save_json(state_path, state)
+    return written
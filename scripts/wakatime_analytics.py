@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+WakaTime Analytics Engine
+Turns cached per-day WakaTime summaries into a columnar time matrix
+(days x languages/editors/projects) and answers rolling-window questions from
+prefix sums, so every 7/30/90/365-day leaderboard comes from one pass.
+"""
+
+from array import array
+from datetime import date, timedelta
+from itertools import accumulate
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from wakatime_cache import CATEGORIES
+
+try:
+    import numpy as np
+except ImportError:  # numpy ships with matplotlib; pure Python keeps working without it
+    np = None
+
+DEFAULT_WINDOWS = (7, 30, 90, 365)
+
+
+class WakaTimeAnalytics:
+    """Rolling-window totals over a dense matrix of seconds per day."""
+
+    def __init__(self, days_by_date: Dict[str, Dict[str, Any]], end: date, span: int = 365, use_numpy: Optional[bool] = None):
+        self.end = end
+        self.span = span
+        self.start = end - timedelta(days=span - 1)
+        self.use_numpy = np is not None if use_numpy is None else use_numpy and np is not None
+        # Days before the oldest cached one were never synced, not idle.
+        cached = [day for day in days_by_date if day <= end.isoformat()]
+        self.covered_from = max(self.start, date.fromisoformat(min(cached))) if cached else self.start
+
+        rows = [
+            days_by_date.get((self.start + timedelta(days=offset)).isoformat()) or {}
+            for offset in range(span)
+        ]
+        totals = [int(row.get('total_seconds', 0)) for row in rows]
+        self.names: Dict[str, List[str]] = {
+            category: sorted({name for row in rows for name in row.get(category, {})})
+            for category in CATEGORIES
+        }
+
+        if self.use_numpy:
+            total_vector = np.asarray(totals, dtype=np.int64)
+            self._total_prefix = np.concatenate(([0], np.cumsum(total_vector)))
+            self._active_prefix = np.concatenate(([0], np.cumsum(total_vector > 0)))
+            self._prefix = {}
+            for category, names in self.names.items():
+                index = {name: column for column, name in enumerate(names)}
+                matrix = np.zeros((span, len(names)), dtype=np.int64)
+                for offset, row in enumerate(rows):
+                    for name, seconds in row.get(category, {}).items():
+                        matrix[offset, index[name]] = seconds
+                self._prefix[category] = np.vstack(
+                    (np.zeros((1, len(names)), dtype=np.int64), np.cumsum(matrix, axis=0))
+                )
+        else:
+            self._total_prefix = array('q', accumulate(totals, initial=0))
+            self._active_prefix = array('q', accumulate((1 if t > 0 else 0 for t in totals), initial=0))
+            self._prefix = {
+                category: [
+                    array('q', accumulate(
+                        (int(row.get(category, {}).get(name, 0)) for row in rows),
+                        initial=0,
+                    ))
+                    for name in names
+                ]
+                for category, names in self.names.items()
+            }
+
+    def _category_sums(self, category: str, lo: int, hi: int) -> Iterable[Tuple[str, int]]:
+        names = self.names[category]
+        if self.use_numpy:
+            sums = self._prefix[category][hi] - self._prefix[category][lo]
+            return zip(names, (int(value) for value in sums))
+        return ((name, column[hi] - column[lo]) for name, column in zip(names, self._prefix[category]))
+
+    def window(self, days: int) -> Dict[str, Any]:
+        """Return totals and leaderboards for the trailing ``days`` days.
+
+        ``covered_days`` is the part of the window the cache actually holds;
+        the daily average is taken over it rather than the full window.
+        """
+        days = max(1, min(days, self.span))
+        covered = max(1, min(days, (self.end - self.covered_from).days + 1))
+        lo, hi = self.span - days, self.span
+        total_seconds = int(self._total_prefix[hi] - self._total_prefix[lo])
+        active_days = int(self._active_prefix[hi] - self._active_prefix[lo])
+        result: Dict[str, Any] = {
+            'days': days,
+            'covered_days': covered,
+            'start': self.end - timedelta(days=days - 1),
+            'end': self.end,
+            'total_seconds': total_seconds,
+            'active_days': active_days,
+            'daily_average': total_seconds // covered,
+            'active_daily_average': total_seconds // active_days if active_days else 0,
+        }
+        for category in CATEGORIES:
+            result[category] = sorted(
+                ((name, seconds) for name, seconds in self._category_sums(category, lo, hi) if seconds > 0),
+                key=lambda item: (-item[1], item[0]),
+            )
+        return result
+
+    def windows(self, sizes: Iterable[int] = DEFAULT_WINDOWS) -> Dict[int, Dict[str, Any]]:
+        """Return ``window()`` for every size, sharing the same prefix sums."""
+        return {size: self.window(size) for size in sizes}
+
+    def rolling_totals(self, days: int) -> List[int]:
+        """Return the trailing ``days``-day total for every day in the matrix."""
+        days = max(1, min(days, self.span))
+        prefix = self._total_prefix
+        if self.use_numpy:
+            return [int(value) for value in prefix[days:] - prefix[:-days]]
+        return [prefix[index + days] - prefix[index] for index in range(self.span - days + 1)]
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+WakaTime Day Cache
+Stores one compact summary per day so closed days are downloaded once and
+only the still-open days are refreshed on each run.
+"""
+
+from datetime import date, datetime, timedelta, timezone, tzinfo
+from typing import Any, Dict, Iterable, List, Optional
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from profile_cache import load_json, save_json
+
+CATEGORIES = ('languages', 'editors', 'projects')
+
+
+class WakaTimeDayCache:
+    """Per-day WakaTime totals keyed by ISO date, persisted as JSON."""
+
+    def __init__(self, path: Optional[str]):
+        self.path = path
+        self.days: Dict[str, Dict[str, Any]] = {}
+        # IANA name of the zone the hourly buckets are in (the WakaTime user's).
+        self.timezone = 'UTC'
+        if path:
+            data = load_json(path, {})
+            self.days = data.get('days', {})
+            self.timezone = data.get('timezone', self.timezone)
+
+    def zone(self) -> tzinfo:
+        """The ``timezone`` setting as a tzinfo, UTC when it is unknown."""
+        try:
+            return ZoneInfo(self.timezone)
+        except (ZoneInfoNotFoundError, ValueError):
+            return timezone.utc
+
+    @staticmethod
+    def summarize_day(day: Dict[str, Any]) -> Dict[str, Any]:
+        """Reduce one ``summaries`` entry to seconds per language, editor and project."""
+        summary: Dict[str, Any] = {
+            'total_seconds': int(day.get('grand_total', {}).get('total_seconds', 0) or 0),
+        }
+        for category in CATEGORIES:
+            totals: Dict[str, int] = {}
+            for item in day.get(category, []) or []:
+                name = item.get('name') or 'Other'
+                totals[name] = totals.get(name, 0) + int(item.get('total_seconds', 0) or 0)
+            summary[category] = totals
+        return summary
+
+    def store(self, summaries: Iterable[Dict[str, Any]]) -> None:
+        """Record API ``summaries`` entries under the date in their ``range``."""
+        for day in summaries:
+            date_str = (day.get('range') or {}).get('date')
+            if date_str:
+                summary = self.summarize_day(day)
+                if 'hours' in self.days.get(date_str, {}):
+                    summary['hours'] = self.days[date_str]['hours']
+                self.days[date_str] = summary
+
+    def set_timezone(self, name: str) -> None:
+        """Switch the hourly buckets to ``name``; buckets from another zone are dropped."""
+        if name and name != self.timezone:
+            for day in self.days.values():
+                day.pop('hours', None)
+            self.timezone = name
+
+    def store_durations(self, date_str: str, durations: Iterable[Dict[str, Any]]) -> None:
+        """Bucket a day's ``durations`` entries into 24 hourly totals.
+
+        WakaTime reports a day in the user's timezone, so hours are bucketed
+        in ``timezone`` too; time outside that local date is dropped.
+        """
+        zone = self.zone()
+        hours = [0.0] * 24
+        for entry in durations:
+            start = float(entry.get('time', 0) or 0)
+            remaining = float(entry.get('duration', 0) or 0)
+            while remaining > 0:
+                moment = datetime.fromtimestamp(start, tz=zone)
+                hour_left = 3600 - (moment.minute * 60 + moment.second + moment.microsecond / 1e6)
+                chunk = min(remaining, hour_left)
+                if moment.date().isoformat() == date_str:
+                    hours[moment.hour] += chunk
+                start += chunk
+                remaining -= chunk
+        self.days.setdefault(date_str, {'total_seconds': 0})['hours'] = [round(value) for value in hours]
+
+    def first_stale_day(self, start: date, end: date, refresh_days: int) -> Optional[date]:
+        """Return the earliest day in ``start..end`` that must be (re)fetched.
+
+        Days missing from the cache are stale, and so are the last
+        ``refresh_days`` days up to ``end``, which may still receive heartbeats.
+        """
+        refresh_from = end - timedelta(days=max(refresh_days, 1) - 1)
+        current = start
+        while current <= end:
+            if current >= refresh_from or current.isoformat() not in self.days:
+                return current
+            current += timedelta(days=1)
+        return None
+
+    def window(self, start: date, end: date) -> List[Dict[str, Any]]:
+        """Return cached day summaries between ``start`` and ``end`` inclusive."""
+        result = []
+        current = start
+        while current <= end:
+            day = self.days.get(current.isoformat())
+            if day is not None:
+                result.append(day)
+            current += timedelta(days=1)
+        return result
+
+    def save(self) -> None:
+        """Persist the cache when it has a backing file."""
+        if self.path:
+            save_json(self.path, {'days': self.days, 'timezone': self.timezone})
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+WakaTime Heatmap Cards
+Renders coding-activity heatmaps as self-hosted SVG from the per-day WakaTime
+cache: a year of days (GitHub calendar layout) and a weekday x hour grid.
+Rendering reads only cached data, so it never costs an API call.
+"""
+
+from datetime import date, timedelta
+from html import escape
+from typing import Any, Dict, List
+
+PALETTE = ['#1F2937', '#134E4A', '#0F766E', '#14B8A6', '#7CF6D2']
+WEEKDAYS = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
+STYLE = (
+    '  <style>.title{font:600 17px Segoe UI,Ubuntu,sans-serif;fill:#7CF6D2}'
+    '.label{font:10px Segoe UI,Ubuntu,sans-serif;fill:#AAB2C0}'
+    '.note{font:11px Segoe UI,Ubuntu,sans-serif;fill:#7D8590}</style>'
+)
+
+
+def _format_seconds(seconds: int) -> str:
+    hours, minutes = divmod(int(seconds) // 60, 60)
+    return f'{hours}h {minutes}m' if hours else f'{minutes}m'
+
+
+def _levels(values: List[int]) -> List[int]:
+    """Map values to palette levels using quartiles of the non-zero values."""
+    active = sorted(value for value in values if value > 0)
+    if not active:
+        return [0] * len(values)
+    cuts = [active[min(len(active) - 1, len(active) * q // 4)] for q in (1, 2, 3)]
+    return [0 if value <= 0 else 1 + sum(value > cut for cut in cuts) for value in values]
+
+
+def _card(width: int, height: int, title: str, description: str, note: str, body: List[str]) -> str:
+    return '\n'.join([
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" viewBox="0 0 {width} {height}" role="img" aria-labelledby="title desc">',
+        f'  <title id="title">{escape(title)}</title>',
+        f'  <desc id="desc">{escape(description)}</desc>',
+        STYLE,
+        f'  <rect width="{width - 1}" height="{height - 1}" x=".5" y=".5" rx="8" fill="#0D1117" stroke="#30363D"/>',
+        f'  <text x="22" y="31" class="title">{escape(title)}</text>',
+        *body,
+        f'  <text x="22" y="{height - 12}" class="note">{escape(note)}</text>',
+        '</svg>',
+        '',
+    ])
+
+
+def build_year_heatmap(days_by_date: Dict[str, Dict[str, Any]], end: date, weeks: int = 53) -> str:
+    """Build a calendar heatmap of coding time for the trailing ``weeks`` weeks."""
+    start = end - timedelta(days=end.weekday() + 7 * (weeks - 1))
+    dates = [start + timedelta(days=offset) for offset in range((end - start).days + 1)]
+    seconds = [int(days_by_date.get(day.isoformat(), {}).get('total_seconds', 0)) for day in dates]
+    levels = _levels(seconds)
+
+    body = [
+        f'  <text x="22" y="{62 + row * 13}" class="label">{WEEKDAYS[row]}</text>'
+        for row in (0, 2, 4)
+    ]
+    for day, value, level in zip(dates, seconds, levels):
+        column = (day - start).days // 7
+        row = day.weekday()
+        body.append(
+            f'  <rect x="{52 + column * 13}" y="{53 + row * 13}" width="10" height="10" rx="2" '
+            f'fill="{PALETTE[level]}"><title>{day.isoformat()}: {_format_seconds(value)}</title></rect>'
+        )
+
+    width = 52 + weeks * 13 + 20
+    return _card(
+        width, 170,
+        'Coding Activity',
+        f'WakaTime coding time per day from {start.isoformat()} to {end.isoformat()}.',
+        f'{_format_seconds(sum(seconds))} coded over {sum(1 for value in seconds if value)} active days',
+        body,
+    )
+
+
+def build_hour_heatmap(days_by_date: Dict[str, Dict[str, Any]], zone_name: str = 'UTC') -> str:
+    """Build a weekday x hour heatmap from cached hourly buckets in ``zone_name``."""
+    grid = [[0] * 24 for _ in range(7)]
+    for date_str, day in days_by_date.items():
+        hours = day.get('hours')
+        if hours:
+            weekday = date.fromisoformat(date_str).weekday()
+            for hour, value in enumerate(hours):
+                grid[weekday][hour] += int(value)
+
+    flat = [value for row in grid for value in row]
+    levels = _levels(flat)
+    body = [
+        f'  <text x="22" y="{62 + row * 18}" class="label">{WEEKDAYS[row]}</text>'
+        for row in range(7)
+    ]
+    body.extend(
+        f'  <text x="{60 + hour * 18}" y="{190}" class="label">{hour:02d}</text>'
+        for hour in range(0, 24, 3)
+    )
+    for index, (value, level) in enumerate(zip(flat, levels)):
+        row, hour = divmod(index, 24)
+        body.append(
+            f'  <rect x="{56 + hour * 18}" y="{52 + row * 18}" width="15" height="15" rx="3" '
+            f'fill="{PALETTE[level]}"><title>{WEEKDAYS[row]} {hour:02d}:00 {escape(zone_name)}: {_format_seconds(value)}</title></rect>'
+        )
+
+    return _card(
+        56 + 24 * 18 + 20, 215,
+        'Coding Hours',
+        f'WakaTime coding time by weekday and hour ({zone_name}).',
+        f'By weekday and hour ({zone_name}) across cached days',
+        body,
+    )